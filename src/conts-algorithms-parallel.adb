@@ -0,0 +1,676 @@
+------------------------------------------------------------------------------
+--                     Copyright (C) 2016, AdaCore                          --
+--                                                                          --
+-- This library is free software;  you can redistribute it and/or modify it --
+-- under terms of the  GNU General Public License  as published by the Free --
+-- Software  Foundation;  either version 3,  or (at your  option) any later --
+-- version. This library is distributed in the hope that it will be useful, --
+-- but WITHOUT ANY WARRANTY;  without even the implied warranty of MERCHAN- --
+-- TABILITY or FITNESS FOR A PARTICULAR PURPOSE.                            --
+--                                                                          --
+-- As a special exception under Section 7 of GPL version 3, you are granted --
+-- additional permissions described in the GCC Runtime Library Exception,   --
+-- version 3.1, as published by the Free Software Foundation.               --
+--                                                                          --
+-- You should have received a copy of the GNU General Public License and    --
+-- a copy of the GCC Runtime Library Exception along with this program;     --
+-- see the files COPYING3 and COPYING.RUNTIME respectively.  If not, see    --
+-- <http://www.gnu.org/licenses/>.                                          --
+--                                                                          --
+------------------------------------------------------------------------------
+
+pragma Ada_2012;
+with Ada.Unchecked_Deallocation;
+with System.Multiprocessors;
+
+package body Conts.Algorithms.Parallel with SPARK_Mode => Off is
+
+   use Ada.Exceptions;
+
+   Chunks_Per_Worker : constant := 4;
+   Min_Chunk_Size    : constant := 4_096;
+   --  Number of chunks the searches split the container into. Several
+   --  chunks per worker balance the load, but each of them must be large
+   --  enough to hide the cost of fetching it.
+
+   procedure Work_On (Control : not null Control_Access);
+   --  Process chunks of the current job until there are none left
+
+   function Split (Total, Parts, Part : Natural) return Natural
+     is (Natural (Long_Long_Integer (Part) * Long_Long_Integer (Total)
+                  / Long_Long_Integer (Parts)))
+     with Inline;
+   --  The start of the Part-th of Parts nearly equal slices of 0 .. Total
+
+   generic
+      with package Cursors is new Conts.Cursors.Random_Access_Cursors (<>);
+   function Length (Self : Cursors.Container) return Natural;
+   --  The number of elements in Self, which might be empty. For vectors,
+   --  Last_Index is then outside of the range accepted by Dist.
+
+   function Chunk_Count (Count : Natural; Workers : Positive) return Positive
+     is (Integer'Max
+           (1, Integer'Min (Count / Min_Chunk_Size,
+                            Workers * Chunks_Per_Worker)))
+     with Inline;
+   --  Number of chunks used to process Count elements
+
+   ------------------
+   -- Control_Type --
+   ------------------
+
+   protected body Control_Type is
+
+      -----------
+      -- Start --
+      -----------
+
+      procedure Start (Work : Job_Access; Chunks : Natural) is
+      begin
+         Control_Type.Work := Work;
+         Control_Type.Chunks := Chunks;
+         Next := 0;
+         Remaining := Chunks;
+         Failed := False;
+      end Start;
+
+      ----------------
+      -- Next_Chunk --
+      ----------------
+
+      procedure Next_Chunk (Work : out Job_Access; Chunk : out Integer) is
+      begin
+         Work := Control_Type.Work;
+         if Next < Chunks then
+            Chunk := Next;
+            Next := Next + 1;
+         else
+            Chunk := -1;
+         end if;
+      end Next_Chunk;
+
+      ----------------
+      -- Chunk_Done --
+      ----------------
+
+      procedure Chunk_Done is
+      begin
+         Remaining := Remaining - 1;
+      end Chunk_Done;
+
+      ------------------
+      -- Chunk_Failed --
+      ------------------
+
+      procedure Chunk_Failed (E : Exception_Occurrence) is
+      begin
+         if not Failed then
+            Failed := True;
+            Save_Occurrence (Error, E);
+         end if;
+
+         --  Skip the chunks that were not started yet
+
+         Remaining := Remaining - 1 - (Chunks - Next);
+         Next := Chunks;
+      end Chunk_Failed;
+
+      ---------------
+      -- Wait_Done --
+      ---------------
+
+      entry Wait_Done when Remaining = 0 is
+      begin
+         Work := null;
+      end Wait_Done;
+
+      ----------------
+      -- Take_Error --
+      ----------------
+
+      procedure Take_Error
+        (Failed : out Boolean;
+         E      : out Exception_Occurrence) is
+      begin
+         Failed := Control_Type.Failed;
+         if Failed then
+            Save_Occurrence (E, Error);
+            Control_Type.Failed := False;
+         end if;
+      end Take_Error;
+
+   end Control_Type;
+
+   ------------
+   -- Length --
+   ------------
+
+   function Length (Self : Cursors.Container) return Natural is
+      First : constant Cursors.Index := Cursors.First_Index (Self);
+   begin
+      if Cursors.Has_Element (Self, First) then
+         return Cursors.Dist (Cursors.Last_Index (Self), First) + 1;
+      else
+         return 0;
+      end if;
+   end Length;
+
+   -------------
+   -- Work_On --
+   -------------
+
+   procedure Work_On (Control : not null Control_Access) is
+      Work  : Job_Access;
+      Chunk : Integer;
+   begin
+      loop
+         Control.Next_Chunk (Work, Chunk);
+         exit when Chunk < 0;
+
+         begin
+            Work.Run (Chunk);
+            Control.Chunk_Done;
+         exception
+            when E : others =>
+               Control.Chunk_Failed (E);
+         end;
+      end loop;
+   end Work_On;
+
+   ------------
+   -- Worker --
+   ------------
+
+   task body Worker is
+      Current : Control_Access;
+   begin
+      loop
+         select
+            accept Wake (Control : Control_Access) do
+               Current := Control;
+            end Wake;
+         or
+            terminate;
+         end select;
+
+         Work_On (Current);
+      end loop;
+   end Worker;
+
+   ---------------------
+   -- Default_Workers --
+   ---------------------
+
+   function Default_Workers return Positive is
+   begin
+      return Positive (System.Multiprocessors.Number_Of_CPUs);
+   end Default_Workers;
+
+   -------------
+   -- Execute --
+   -------------
+
+   procedure Execute
+     (Self   : in out Task_Pool'Class;
+      Work   : in out Job'Class;
+      Chunks : Natural)
+   is
+      Control : constant Control_Access := Self.Control'Unchecked_Access;
+      Failed  : Boolean;
+      Error   : Exception_Occurrence;
+   begin
+      if Chunks = 0 then
+         return;
+      end if;
+
+      Control.Start (Work'Unchecked_Access, Chunks);
+
+      --  No need to wake more tasks than there are chunks, since the
+      --  caller also processes them.
+
+      for T in Self.Tasks'First
+        .. Integer'Min (Self.Tasks'Last, Chunks)
+      loop
+         Self.Tasks (T).Wake (Control);
+      end loop;
+
+      Work_On (Control);
+      Control.Wait_Done;
+
+      Control.Take_Error (Failed, Error);
+      if Failed then
+         Reraise_Occurrence (Error);
+      end if;
+   end Execute;
+
+   ----------
+   -- Sort --
+   ----------
+
+   procedure Sort
+     (Self : in out Cursors.Container;
+      Pool : in out Task_Pool'Class)
+   is
+      package Ranges is new Ranged_Random_Access_Cursors
+        (Cursors, Getters, Swap);
+      procedure Sequential is new Pdqsort (Cursors, Getters, "<", Swap);
+      procedure Sort_Range is new Pdqsort
+        (Ranges.Cursors, Ranges.Getters, "<", Ranges.Swap);
+
+      type Element_Array is array (Natural range <>) of Element_Type;
+      type Element_Array_Access is access Element_Array;
+      procedure Unchecked_Free is new Ada.Unchecked_Deallocation
+        (Element_Array, Element_Array_Access);
+
+      function Count_Of is new Length (Cursors);
+
+      First  : constant Cursors.Index := Cursors.First_Index (Self);
+      Count  : constant Natural := Count_Of (Self);
+      Blocks : constant Positive := Pool.Workers;
+
+      Bounds : array (0 .. Blocks) of Natural;
+      --  Offsets of the blocks sorted by each worker. Block J contains the
+      --  elements in Bounds (J) .. Bounds (J + 1) - 1.
+
+      Width  : Positive := 1;
+      --  Number of blocks in each sorted run, during the merge passes
+
+      Buffer : Element_Array_Access;
+      --  A copy of the container before each merge pass
+
+      function Idx (Offset : Natural) return Cursors.Index
+        is (Cursors.Add (First, Offset)) with Inline;
+
+      type Sort_Job is new Job with null record;
+      overriding procedure Run (Work : in out Sort_Job; Chunk : Natural);
+      --  Sort one block
+
+      type Copy_Job is new Job with null record;
+      overriding procedure Run (Work : in out Copy_Job; Chunk : Natural);
+      --  Copy one block into Buffer
+
+      type Merge_Job is new Job with null record;
+      overriding procedure Run (Work : in out Merge_Job; Chunk : Natural);
+      --  Compute the elements Bounds (Chunk) .. Bounds (Chunk + 1) - 1 of the
+      --  container, by merging two runs from Buffer.
+
+      ---------
+      -- Run --
+      ---------
+
+      overriding procedure Run (Work : in out Sort_Job; Chunk : Natural) is
+         pragma Unreferenced (Work);
+      begin
+         if Bounds (Chunk) < Bounds (Chunk + 1) then
+            declare
+               S : Ranges.Rg := Ranges.Subset
+                 (Self'Unrestricted_Access,
+                  Idx (Bounds (Chunk)), Idx (Bounds (Chunk + 1) - 1));
+            begin
+               Sort_Range (S);
+            end;
+         end if;
+      end Run;
+
+      ---------
+      -- Run --
+      ---------
+
+      overriding procedure Run (Work : in out Copy_Job; Chunk : Natural) is
+         pragma Unreferenced (Work);
+      begin
+         for J in Bounds (Chunk) .. Bounds (Chunk + 1) - 1 loop
+            Buffer (J) := Getters.Get (Self, Idx (J));
+         end loop;
+      end Run;
+
+      ---------
+      -- Run --
+      ---------
+
+      overriding procedure Run (Work : in out Merge_Job; Chunk : Natural) is
+         pragma Unreferenced (Work);
+
+         --  The two runs are Buffer (Low .. Mid - 1) and
+         --  Buffer (Mid .. High - 1). When elements compare equal, those
+         --  of the left run come first.
+
+         Pair      : constant Natural := Chunk / (2 * Width);
+         Low       : constant Natural := Bounds (2 * Pair * Width);
+         Mid       : constant Natural :=
+           Bounds (Integer'Min ((2 * Pair + 1) * Width, Blocks));
+         High      : constant Natural :=
+           Bounds (Integer'Min ((2 * Pair + 2) * Width, Blocks));
+         Left_Len  : constant Natural := Mid - Low;
+         Right_Len : constant Natural := High - Mid;
+         Start     : constant Natural := Bounds (Chunk) - Low;
+         I_Low     : Natural := Integer'Max (0, Start - Right_Len);
+         I_High    : Natural := Integer'Min (Start, Left_Len);
+         M         : Natural;
+         L, R      : Natural;
+      begin
+         if Mid = High then
+            --  The last run has no partner in this pass, and is already
+            --  in place.
+            return;
+         end if;
+
+         --  Find how many of the first Start elements of the merge come
+         --  from the left run.
+
+         while I_Low < I_High loop
+            M := (I_Low + I_High) / 2;
+            if not (Buffer (Mid + Start - M - 1) < Buffer (Low + M)) then
+               I_Low := M + 1;
+            else
+               I_High := M;
+            end if;
+         end loop;
+
+         L := Low + I_Low;
+         R := Mid + Start - I_Low;
+
+         for Out_Pos in Bounds (Chunk) .. Bounds (Chunk + 1) - 1 loop
+            if R >= High
+              or else (L < Mid and then not (Buffer (R) < Buffer (L)))
+            then
+               Set (Self, Idx (Out_Pos), Buffer (L));
+               L := L + 1;
+            else
+               Set (Self, Idx (Out_Pos), Buffer (R));
+               R := R + 1;
+            end if;
+         end loop;
+      end Run;
+
+      Sort_Work  : Sort_Job;
+      Copy_Work  : Copy_Job;
+      Merge_Work : Merge_Job;
+
+   begin
+      if Count < 2 then
+         return;
+      elsif Count < Sequential_Threshold or else Blocks = 1 then
+         Sequential (Self);
+         return;
+      end if;
+
+      for J in Bounds'Range loop
+         Bounds (J) := Split (Count, Blocks, J);
+      end loop;
+
+      Execute (Pool, Sort_Work, Blocks);
+
+      Buffer := new Element_Array (0 .. Count - 1);
+      while Width < Blocks loop
+         Execute (Pool, Copy_Work, Blocks);
+         Execute (Pool, Merge_Work, Blocks);
+         Width := Width * 2;
+      end loop;
+      Unchecked_Free (Buffer);
+
+   exception
+      when others =>
+         Unchecked_Free (Buffer);
+         raise;
+   end Sort;
+
+   --------------
+   -- Count_If --
+   --------------
+
+   function Count_If
+     (Self      : Cursors.Container;
+      Predicate : not null access
+        function (E : Getters.Element) return Boolean;
+      Pool      : in out Task_Pool'Class)
+     return Natural
+   is
+      function Count_Of is new Length (Cursors);
+
+      First  : constant Cursors.Index := Cursors.First_Index (Self);
+      Count  : constant Natural := Count_Of (Self);
+      Chunks : constant Positive := Chunk_Count (Count, Pool.Workers);
+      Counts : array (0 .. Chunks - 1) of Natural := (others => 0);
+
+      type Count_Job is new Job with null record;
+      overriding procedure Run (Work : in out Count_Job; Chunk : Natural);
+
+      ---------
+      -- Run --
+      ---------
+
+      overriding procedure Run (Work : in out Count_Job; Chunk : Natural) is
+         pragma Unreferenced (Work);
+         Low  : constant Natural := Split (Count, Chunks, Chunk);
+         High : constant Natural := Split (Count, Chunks, Chunk + 1);
+         C    : Natural := 0;
+      begin
+         for J in Low .. High - 1 loop
+            if Predicate (Getters.Get (Self, Cursors.Add (First, J))) then
+               C := C + 1;
+            end if;
+         end loop;
+         Counts (Chunk) := C;
+      end Run;
+
+      Work  : Count_Job;
+      Total : Natural := 0;
+   begin
+      Execute (Pool, Work, Chunks);
+      for C of Counts loop
+         Total := Total + C;
+      end loop;
+      return Total;
+   end Count_If;
+
+   ----------
+   -- Find --
+   ----------
+
+   function Find
+     (Self : Cursors.Container;
+      E    : Getters.Element;
+      Pool : in out Task_Pool'Class)
+     return Cursors.Index
+   is
+      function Count_Of is new Length (Cursors);
+
+      First  : constant Cursors.Index := Cursors.First_Index (Self);
+      Count  : constant Natural := Count_Of (Self);
+      Chunks : constant Positive := Chunk_Count (Count, Pool.Workers);
+
+      Found  : array (0 .. Chunks - 1) of Integer := (others => -1);
+      --  Offset of the first occurrence of E in each chunk, or -1
+
+      Limit  : Natural := Chunks with Atomic;
+      --  The first chunk in which E was found. Chunks after it no longer
+      --  need to be searched.
+
+      protected Lowest is
+         procedure Lower (Chunk : Natural);
+         --  Record that E was found in Chunk
+      end Lowest;
+
+      type Find_Job is new Job with null record;
+      overriding procedure Run (Work : in out Find_Job; Chunk : Natural);
+
+      ------------
+      -- Lowest --
+      ------------
+
+      protected body Lowest is
+         procedure Lower (Chunk : Natural) is
+         begin
+            if Chunk < Limit then
+               Limit := Chunk;
+            end if;
+         end Lower;
+      end Lowest;
+
+      ---------
+      -- Run --
+      ---------
+
+      overriding procedure Run (Work : in out Find_Job; Chunk : Natural) is
+         pragma Unreferenced (Work);
+         Low  : constant Natural := Split (Count, Chunks, Chunk);
+         High : constant Natural := Split (Count, Chunks, Chunk + 1);
+      begin
+         for J in Low .. High - 1 loop
+            exit when Limit < Chunk;
+            if Getters.Get (Self, Cursors.Add (First, J)) = E then
+               Found (Chunk) := J;
+               Lowest.Lower (Chunk);
+               exit;
+            end if;
+         end loop;
+      end Run;
+
+      Work : Find_Job;
+   begin
+      Execute (Pool, Work, Chunks);
+      for F of Found loop
+         if F >= 0 then
+            return Cursors.Add (First, F);
+         end if;
+      end loop;
+      return Cursors.No_Element;
+   end Find;
+
+   --------------
+   -- Contains --
+   --------------
+
+   function Contains
+     (Self : Cursors.Container;
+      E    : Getters.Element;
+      Pool : in out Task_Pool'Class)
+     return Boolean
+   is
+      function Count_Of is new Length (Cursors);
+
+      First  : constant Cursors.Index := Cursors.First_Index (Self);
+      Count  : constant Natural := Count_Of (Self);
+      Chunks : constant Positive := Chunk_Count (Count, Pool.Workers);
+
+      Found  : Boolean := False with Atomic;
+      --  Set as soon as one of the tasks finds E
+
+      type Contains_Job is new Job with null record;
+      overriding procedure Run (Work : in out Contains_Job; Chunk : Natural);
+
+      ---------
+      -- Run --
+      ---------
+
+      overriding procedure Run (Work : in out Contains_Job; Chunk : Natural)
+      is
+         pragma Unreferenced (Work);
+         Low  : constant Natural := Split (Count, Chunks, Chunk);
+         High : constant Natural := Split (Count, Chunks, Chunk + 1);
+      begin
+         for J in Low .. High - 1 loop
+            exit when Found;
+            if Getters.Get (Self, Cursors.Add (First, J)) = E then
+               Found := True;
+            end if;
+         end loop;
+      end Run;
+
+      Work : Contains_Job;
+   begin
+      Execute (Pool, Work, Chunks);
+      return Found;
+   end Contains;
+
+   ------------
+   -- Equals --
+   ------------
+
+   function Equals
+     (Left, Right : Cursors.Container;
+      Pool        : in out Task_Pool'Class)
+     return Boolean
+   is
+      function Count_Of is new Length (Cursors);
+
+      L_First : constant Cursors.Index := Cursors.First_Index (Left);
+      R_First : constant Cursors.Index := Cursors.First_Index (Right);
+      Count   : constant Natural := Count_Of (Left);
+      Chunks  : constant Positive := Chunk_Count (Count, Pool.Workers);
+
+      Different : Boolean := False with Atomic;
+      --  Set as soon as one of the tasks finds a difference
+
+      type Equals_Job is new Job with null record;
+      overriding procedure Run (Work : in out Equals_Job; Chunk : Natural);
+
+      ---------
+      -- Run --
+      ---------
+
+      overriding procedure Run (Work : in out Equals_Job; Chunk : Natural) is
+         pragma Unreferenced (Work);
+         Low  : constant Natural := Split (Count, Chunks, Chunk);
+         High : constant Natural := Split (Count, Chunks, Chunk + 1);
+      begin
+         for J in Low .. High - 1 loop
+            exit when Different;
+            if Getters.Get (Left, Cursors.Add (L_First, J)) /=
+               Getters.Get (Right, Cursors.Add (R_First, J))
+            then
+               Different := True;
+            end if;
+         end loop;
+      end Run;
+
+      Work : Equals_Job;
+   begin
+      if Count_Of (Right) /= Count then
+         return False;
+      end if;
+
+      Execute (Pool, Work, Chunks);
+      return not Different;
+   end Equals;
+
+   --------------
+   -- For_Each --
+   --------------
+
+   procedure For_Each
+     (Self    : Cursors.Container;
+      Process : not null access procedure (E : Getters.Element);
+      Pool    : in out Task_Pool'Class)
+   is
+      function Count_Of is new Length (Cursors);
+
+      First  : constant Cursors.Index := Cursors.First_Index (Self);
+      Count  : constant Natural := Count_Of (Self);
+      Chunks : constant Positive := Chunk_Count (Count, Pool.Workers);
+
+      type For_Each_Job is new Job with null record;
+      overriding procedure Run (Work : in out For_Each_Job; Chunk : Natural);
+
+      ---------
+      -- Run --
+      ---------
+
+      overriding procedure Run (Work : in out For_Each_Job; Chunk : Natural)
+      is
+         pragma Unreferenced (Work);
+         Low  : constant Natural := Split (Count, Chunks, Chunk);
+         High : constant Natural := Split (Count, Chunks, Chunk + 1);
+      begin
+         for J in Low .. High - 1 loop
+            Process (Getters.Get (Self, Cursors.Add (First, J)));
+         end loop;
+      end Run;
+
+      Work : For_Each_Job;
+   begin
+      Execute (Pool, Work, Chunks);
+   end For_Each;
+
+end Conts.Algorithms.Parallel;
@@ -20,6 +20,7 @@
 ------------------------------------------------------------------------------
 
 pragma Ada_2012;
+with Ada.Unchecked_Deallocation;
 
 package body Conts.Algorithms is
 
@@ -248,6 +249,856 @@ package body Conts.Algorithms is
       Recurse (Cursors.First_Index (Self), Cursors.Last_Index (Self));
    end Quicksort;
 
+   --------------
+   -- Heapsort --
+   --------------
+
+   procedure Heapsort (Self : in out Cursors.Container) is
+      First : constant Cursors.Index := Cursors.First_Index (Self);
+      Count : constant Natural :=
+        (if Cursors.Has_Element (Self, First)
+         then Cursors.Dist (Cursors.Last_Index (Self), First) + 1
+         else 0);
+
+      function Idx (Offset : Natural) return Cursors.Index
+        is (Cursors.Add (First, Offset)) with Inline;
+      function Less (Left, Right : Natural) return Boolean
+        is ("<" (Getters.Get (Self, Idx (Left)),
+                 Getters.Get (Self, Idx (Right)))) with Inline;
+
+      procedure Sift_Down (Root, Size : Natural);
+      --  Restore the heap property for the subtree starting at Root,
+      --  within the first Size elements.
+
+      ---------------
+      -- Sift_Down --
+      ---------------
+
+      procedure Sift_Down (Root, Size : Natural) is
+         R     : Natural := Root;
+         Child : Natural;
+      begin
+         loop
+            Child := 2 * R + 1;
+            exit when Child >= Size;
+
+            if Child + 1 < Size and then Less (Child, Child + 1) then
+               Child := Child + 1;
+            end if;
+
+            exit when not Less (R, Child);
+            Swap (Self, Idx (R), Idx (Child));
+            R := Child;
+         end loop;
+      end Sift_Down;
+
+   begin
+      if Count < 2 then
+         return;
+      end if;
+
+      for Root in reverse 0 .. Count / 2 - 1 loop
+         Sift_Down (Root, Count);
+      end loop;
+
+      for Last in reverse 1 .. Count - 1 loop
+         Swap (Self, First, Idx (Last));
+         Sift_Down (0, Last);
+      end loop;
+   end Heapsort;
+
+   -------------
+   -- Pdqsort --
+   -------------
+
+   procedure Pdqsort (Self : in out Cursors.Container) is
+      Insertion_Threshold     : constant := 24;
+      --  Sequences smaller than this are sorted with an insertion sort
+
+      Ninther_Threshold       : constant := 128;
+      --  Sequences larger than this use the median of three medians as
+      --  the pivot.
+
+      Partial_Insertion_Limit : constant := 8;
+      --  Number of elements a partial insertion sort is allowed to move
+      --  before it gives up.
+
+      package Ranges is new Ranged_Random_Access_Cursors
+        (Cursors, Getters, Swap);
+      procedure Heap is new Heapsort
+        (Ranges.Cursors, Ranges.Getters, "<", Ranges.Swap);
+
+      First : constant Cursors.Index := Cursors.First_Index (Self);
+      Count : constant Natural :=
+        (if Cursors.Has_Element (Self, First)
+         then Cursors.Dist (Cursors.Last_Index (Self), First) + 1
+         else 0);
+
+      --  All positions below are offsets from First. Ranges are given as
+      --  Low .. High - 1, as in the original algorithm.
+
+      function Idx (Offset : Natural) return Cursors.Index
+        is (Cursors.Add (First, Offset)) with Inline;
+      function Less (Left, Right : Natural) return Boolean
+        is ("<" (Getters.Get (Self, Idx (Left)),
+                 Getters.Get (Self, Idx (Right)))) with Inline;
+      procedure Swap (Left, Right : Natural) with Inline;
+
+      procedure Sort2 (A, B : Natural) with Inline;
+      procedure Sort3 (A, B, C : Natural) with Inline;
+      --  Sort the elements at the given positions
+
+      procedure Insertion_Sort (Low, High : Natural);
+      --  Sort the elements in Low .. High - 1
+
+      function Partial_Insertion_Sort (Low, High : Natural) return Boolean;
+      --  Attempt an insertion sort of Low .. High - 1, but give up if too
+      --  many elements need to be moved. Returns True if the range was
+      --  sorted.
+
+      procedure Partition_Right
+        (Low, High             : Natural;
+         Pivot_Pos             : out Natural;
+         Already_Partitioned   : out Boolean);
+      --  Partition Low .. High - 1 around the pivot at Low. Elements equal
+      --  to the pivot go to the right. Pivot_Pos is the final position of
+      --  the pivot. Already_Partitioned is set if no element was swapped.
+
+      function Partition_Left (Low, High : Natural) return Natural;
+      --  Partition Low .. High - 1 around the pivot at Low. Elements equal
+      --  to the pivot go to the left. Returns the final position of the
+      --  pivot.
+
+      procedure Recurse
+        (Low, High   : Natural;
+         Bad_Allowed : Natural;
+         Leftmost    : Boolean);
+      --  Sort Low .. High - 1. Bad_Allowed is the number of unbalanced
+      --  partitions allowed before we switch to Heapsort.
+      --  Leftmost is False when the element at Low - 1 is known to be less
+      --  than or equal to all elements in the range.
+
+      ----------
+      -- Swap --
+      ----------
+
+      procedure Swap (Left, Right : Natural) is
+      begin
+         Swap (Self, Idx (Left), Idx (Right));
+      end Swap;
+
+      -----------
+      -- Sort2 --
+      -----------
+
+      procedure Sort2 (A, B : Natural) is
+      begin
+         if Less (B, A) then
+            Swap (A, B);
+         end if;
+      end Sort2;
+
+      -----------
+      -- Sort3 --
+      -----------
+
+      procedure Sort3 (A, B, C : Natural) is
+      begin
+         Sort2 (A, B);
+         Sort2 (B, C);
+         Sort2 (A, B);
+      end Sort3;
+
+      --------------------
+      -- Insertion_Sort --
+      --------------------
+
+      procedure Insertion_Sort (Low, High : Natural) is
+         J : Natural;
+      begin
+         for Current in Low + 1 .. High - 1 loop
+            J := Current;
+            while J > Low and then Less (J, J - 1) loop
+               Swap (J, J - 1);
+               J := J - 1;
+            end loop;
+         end loop;
+      end Insertion_Sort;
+
+      ----------------------------
+      -- Partial_Insertion_Sort --
+      ----------------------------
+
+      function Partial_Insertion_Sort (Low, High : Natural) return Boolean
+      is
+         Moved : Natural := 0;
+         J     : Natural;
+      begin
+         for Current in Low + 1 .. High - 1 loop
+            --  Only give up when there is another element to move, so that
+            --  a range sorted by the last moves is not partitioned again.
+            if Moved > Partial_Insertion_Limit then
+               return False;
+            end if;
+
+            J := Current;
+            while J > Low and then Less (J, J - 1) loop
+               Swap (J, J - 1);
+               J := J - 1;
+            end loop;
+
+            Moved := Moved + (Current - J);
+         end loop;
+         return True;
+      end Partial_Insertion_Sort;
+
+      ---------------------
+      -- Partition_Right --
+      ---------------------
+
+      procedure Partition_Right
+        (Low, High             : Natural;
+         Pivot_Pos             : out Natural;
+         Already_Partitioned   : out Boolean)
+      is
+         Pivot : constant Getters.Element := Getters.Get (Self, Idx (Low));
+         F     : Natural := Low + 1;
+         L     : Natural := High - 1;
+
+         function Less_Than_Pivot (Pos : Natural) return Boolean
+           is ("<" (Getters.Get (Self, Idx (Pos)), Pivot)) with Inline;
+
+      begin
+         --  Find the first element greater than or equal to the pivot (the
+         --  median of three guarantees there is one).
+
+         while Less_Than_Pivot (F) loop
+            F := F + 1;
+         end loop;
+
+         --  Find the last element less than the pivot. If there was no
+         --  element before F, there might be none.
+
+         if F - 1 = Low then
+            while F < L and then not Less_Than_Pivot (L) loop
+               L := L - 1;
+            end loop;
+         else
+            while not Less_Than_Pivot (L) loop
+               L := L - 1;
+            end loop;
+         end if;
+
+         Already_Partitioned := F >= L;
+
+         while F < L loop
+            Swap (F, L);
+            loop
+               F := F + 1;
+               exit when not Less_Than_Pivot (F);
+            end loop;
+            loop
+               L := L - 1;
+               exit when Less_Than_Pivot (L);
+            end loop;
+         end loop;
+
+         Pivot_Pos := F - 1;
+         if Pivot_Pos /= Low then
+            Swap (Low, Pivot_Pos);
+         end if;
+      end Partition_Right;
+
+      --------------------
+      -- Partition_Left --
+      --------------------
+
+      function Partition_Left (Low, High : Natural) return Natural is
+         Pivot : constant Getters.Element := Getters.Get (Self, Idx (Low));
+         F     : Natural := Low;
+         L     : Natural := High - 1;
+
+         function Greater_Than_Pivot (Pos : Natural) return Boolean
+           is ("<" (Pivot, Getters.Get (Self, Idx (Pos)))) with Inline;
+
+      begin
+         while Greater_Than_Pivot (L) loop
+            L := L - 1;
+         end loop;
+
+         if L + 1 = High then
+            while F < L loop
+               F := F + 1;
+               exit when Greater_Than_Pivot (F);
+            end loop;
+         else
+            loop
+               F := F + 1;
+               exit when Greater_Than_Pivot (F);
+            end loop;
+         end if;
+
+         while F < L loop
+            Swap (F, L);
+            loop
+               L := L - 1;
+               exit when not Greater_Than_Pivot (L);
+            end loop;
+            loop
+               F := F + 1;
+               exit when Greater_Than_Pivot (F);
+            end loop;
+         end loop;
+
+         if L /= Low then
+            Swap (Low, L);
+         end if;
+         return L;
+      end Partition_Left;
+
+      -------------
+      -- Recurse --
+      -------------
+
+      procedure Recurse
+        (Low, High   : Natural;
+         Bad_Allowed : Natural;
+         Leftmost    : Boolean)
+      is
+         L         : Natural := Low;
+         Bad       : Natural := Bad_Allowed;
+         Left_Most : Boolean := Leftmost;
+         Size, S2  : Natural;
+         L_Size    : Natural;
+         R_Size    : Natural;
+         Pivot_Pos : Natural;
+         Already_Partitioned : Boolean;
+      begin
+         loop
+            Size := High - L;
+
+            if Size < Insertion_Threshold then
+               Insertion_Sort (L, High);
+               return;
+            end if;
+
+            --  Choose the pivot, and move it to L
+
+            S2 := Size / 2;
+            if Size > Ninther_Threshold then
+               Sort3 (L, L + S2, High - 1);
+               Sort3 (L + 1, L + S2 - 1, High - 2);
+               Sort3 (L + 2, L + S2 + 1, High - 3);
+               Sort3 (L + S2 - 1, L + S2, L + S2 + 1);
+               Swap (L, L + S2);
+            else
+               Sort3 (L + S2, L, High - 1);
+            end if;
+
+            --  If the pivot is equal to the element before the range (which
+            --  is less than or equal to all the elements in the range), all
+            --  the elements equal to the pivot are put on the left, and do
+            --  not need to be sorted any further.
+
+            if not Left_Most and then not Less (L - 1, L) then
+               L := Partition_Left (L, High) + 1;
+
+            else
+               Partition_Right (L, High, Pivot_Pos, Already_Partitioned);
+               L_Size := Pivot_Pos - L;
+               R_Size := High - (Pivot_Pos + 1);
+
+               if L_Size < Size / 8 or else R_Size < Size / 8 then
+                  --  Highly unbalanced partition. If there were too many
+                  --  of them, fall back to heapsort.
+
+                  Bad := Bad - 1;
+                  if Bad = 0 then
+                     declare
+                        S : Ranges.Rg := Ranges.Subset
+                          (Self'Unrestricted_Access, Idx (L), Idx (High - 1));
+                     begin
+                        Heap (S);
+                     end;
+                     return;
+                  end if;
+
+                  --  Otherwise, shuffle some elements to break patterns
+
+                  if L_Size >= Insertion_Threshold then
+                     Swap (L, L + L_Size / 4);
+                     Swap (Pivot_Pos - 1, Pivot_Pos - L_Size / 4);
+
+                     if L_Size > Ninther_Threshold then
+                        Swap (L + 1, L + (L_Size / 4 + 1));
+                        Swap (L + 2, L + (L_Size / 4 + 2));
+                        Swap (Pivot_Pos - 2, Pivot_Pos - (L_Size / 4 + 1));
+                        Swap (Pivot_Pos - 3, Pivot_Pos - (L_Size / 4 + 2));
+                     end if;
+                  end if;
+
+                  if R_Size >= Insertion_Threshold then
+                     Swap (Pivot_Pos + 1, Pivot_Pos + (1 + R_Size / 4));
+                     Swap (High - 1, High - R_Size / 4);
+
+                     if R_Size > Ninther_Threshold then
+                        Swap (Pivot_Pos + 2, Pivot_Pos + (2 + R_Size / 4));
+                        Swap (Pivot_Pos + 3, Pivot_Pos + (3 + R_Size / 4));
+                        Swap (High - 2, High - (1 + R_Size / 4));
+                        Swap (High - 3, High - (2 + R_Size / 4));
+                     end if;
+                  end if;
+
+               elsif Already_Partitioned
+                 and then Partial_Insertion_Sort (L, Pivot_Pos)
+                 and then Partial_Insertion_Sort (Pivot_Pos + 1, High)
+               then
+                  --  The range was probably already sorted
+                  return;
+               end if;
+
+               --  Recurse on the left part, and loop on the right part
+
+               Recurse (L, Pivot_Pos, Bad, Left_Most);
+               L := Pivot_Pos + 1;
+               Left_Most := False;
+            end if;
+         end loop;
+      end Recurse;
+
+      Log : Natural := 0;
+      N   : Natural := Count;
+
+   begin
+      if Count < 2 then
+         return;
+      end if;
+
+      while N > 1 loop
+         Log := Log + 1;
+         N := N / 2;
+      end loop;
+
+      Recurse (0, Count, Bad_Allowed => Log, Leftmost => True);
+   end Pdqsort;
+
+   --------------------
+   -- Stable_Sorting --
+   --------------------
+
+   package body Stable_Sorting is
+
+      procedure Unchecked_Free is new Ada.Unchecked_Deallocation
+        (Element_Array, Element_Array_Access);
+
+      --------------
+      -- Finalize --
+      --------------
+
+      overriding procedure Finalize (Self : in out Scratch_Buffer) is
+      begin
+         Unchecked_Free (Self.Data);
+      end Finalize;
+
+      ----------
+      -- Sort --
+      ----------
+
+      procedure Sort (Self : in out Cursors.Container) is
+         Scratch : Scratch_Buffer;
+      begin
+         Sort (Self, Scratch);
+      end Sort;
+
+      ----------
+      -- Sort --
+      ----------
+
+      procedure Sort
+        (Self    : in out Cursors.Container;
+         Scratch : in out Scratch_Buffer)
+      is
+         Min_Merge : constant := 64;
+         --  Containers smaller than this are sorted with a single insertion
+         --  sort.
+
+         First : constant Cursors.Index := Cursors.First_Index (Self);
+         Count : constant Natural :=
+           (if Cursors.Has_Element (Self, First)
+            then Cursors.Dist (Cursors.Last_Index (Self), First) + 1
+            else 0);
+
+         --  All positions below are offsets from First. Ranges are given as
+         --  Low .. High - 1.
+
+         function Idx (Offset : Natural) return Cursors.Index
+           is (Cursors.Add (First, Offset)) with Inline;
+         function Get (Offset : Natural) return Getters.Element
+           is (Getters.Get (Self, Idx (Offset))) with Inline;
+         procedure Put (Offset : Natural; Value : Getters.Element)
+           with Inline;
+
+         procedure Reserve (Size : Natural);
+         --  Make sure Scratch can store at least Size elements
+
+         function Min_Run_Length (N : Natural) return Natural;
+         --  The minimal length of runs, so that N / Min_Run_Length is a
+         --  power of two, or slightly less.
+
+         function Count_Run (Low, High : Natural) return Natural;
+         --  Find the end of the run starting at Low, and reverse it if it
+         --  is decreasing. Returns the first position after the run.
+
+         procedure Insertion_Sort (Low, High, Start : Natural);
+         --  Sort Low .. High - 1, knowing that Low .. Start - 1 is sorted
+
+         function Upper_Bound
+           (Value : Getters.Element; Low, High : Natural) return Natural;
+         --  First position in the sorted range Low .. High - 1 whose
+         --  element is greater than Value, or High.
+
+         function Lower_Bound
+           (Value : Getters.Element; Low, High : Natural) return Natural;
+         --  First position in the sorted range Low .. High - 1 whose
+         --  element is not less than Value, or High.
+
+         procedure Merge_Low (Base1, Len1, Base2, Len2 : Natural);
+         procedure Merge_High (Base1, Len1, Base2, Len2 : Natural);
+         --  Merge two adjacent runs, when the first (resp. the second) is
+         --  the shortest and is copied to the scratch buffer.
+
+         procedure Merge_At (I : Natural);
+         --  Merge the runs I and I + 1 on the stack
+
+         Max_Runs : constant := 64;
+         Run_Base : array (0 .. Max_Runs - 1) of Natural;
+         Run_Len  : array (0 .. Max_Runs - 1) of Natural;
+         Runs     : Natural := 0;
+         --  The stack of runs waiting to be merged
+
+         ---------
+         -- Put --
+         ---------
+
+         procedure Put (Offset : Natural; Value : Getters.Element) is
+         begin
+            Set (Self, Idx (Offset), Value);
+         end Put;
+
+         -------------
+         -- Reserve --
+         -------------
+
+         procedure Reserve (Size : Natural) is
+         begin
+            if Scratch.Data = null or else Scratch.Data'Length < Size then
+               Unchecked_Free (Scratch.Data);
+               Scratch.Data := new Element_Array
+                 (0 .. Natural'Max (Size, Count / 2) - 1);
+            end if;
+         end Reserve;
+
+         --------------------
+         -- Min_Run_Length --
+         --------------------
+
+         function Min_Run_Length (N : Natural) return Natural is
+            M : Natural := N;
+            R : Natural := 0;  --  1 if any bit is shifted out
+         begin
+            while M >= Min_Merge loop
+               R := R + M mod 2;
+               M := M / 2;
+            end loop;
+            return M + Natural'Min (R, 1);
+         end Min_Run_Length;
+
+         ---------------
+         -- Count_Run --
+         ---------------
+
+         function Count_Run (Low, High : Natural) return Natural is
+            R    : Natural := Low + 1;
+            L, H : Natural;
+         begin
+            if R = High then
+               return High;
+            end if;
+
+            if Get (R) < Get (Low) then
+               --  Strictly decreasing, so that reversing is stable
+               while R + 1 < High and then Get (R + 1) < Get (R) loop
+                  R := R + 1;
+               end loop;
+
+               L := Low;
+               H := R;
+               while L < H loop
+                  declare
+                     Tmp : constant Element_Type := Get (L);
+                  begin
+                     Put (L, Get (H));
+                     Put (H, Tmp);
+                  end;
+                  L := L + 1;
+                  H := H - 1;
+               end loop;
+            else
+               while R + 1 < High and then not (Get (R + 1) < Get (R)) loop
+                  R := R + 1;
+               end loop;
+            end if;
+
+            return R + 1;
+         end Count_Run;
+
+         --------------------
+         -- Insertion_Sort --
+         --------------------
+
+         procedure Insertion_Sort (Low, High, Start : Natural) is
+            P : Natural;
+         begin
+            for Current in Start .. High - 1 loop
+               declare
+                  Value : constant Getters.Element := Get (Current);
+               begin
+                  P := Upper_Bound (Value, Low, Current);
+                  for J in reverse P + 1 .. Current loop
+                     Put (J, Get (J - 1));
+                  end loop;
+                  if P /= Current then
+                     Put (P, Value);
+                  end if;
+               end;
+            end loop;
+         end Insertion_Sort;
+
+         -----------------
+         -- Upper_Bound --
+         -----------------
+
+         function Upper_Bound
+           (Value : Getters.Element; Low, High : Natural) return Natural
+         is
+            L : Natural := Low;
+            H : Natural := High;
+            M : Natural;
+         begin
+            while L < H loop
+               M := L + (H - L) / 2;
+               if Value < Get (M) then
+                  H := M;
+               else
+                  L := M + 1;
+               end if;
+            end loop;
+            return L;
+         end Upper_Bound;
+
+         -----------------
+         -- Lower_Bound --
+         -----------------
+
+         function Lower_Bound
+           (Value : Getters.Element; Low, High : Natural) return Natural
+         is
+            L : Natural := Low;
+            H : Natural := High;
+            M : Natural;
+         begin
+            while L < H loop
+               M := L + (H - L) / 2;
+               if Get (M) < Value then
+                  L := M + 1;
+               else
+                  H := M;
+               end if;
+            end loop;
+            return L;
+         end Lower_Bound;
+
+         ---------------
+         -- Merge_Low --
+         ---------------
+
+         procedure Merge_Low (Base1, Len1, Base2, Len2 : Natural) is
+            I    : Natural := 0;       --  in Scratch
+            J    : Natural := Base2;   --  in the second run
+            Dest : Natural := Base1;
+         begin
+            Reserve (Len1);
+            for K in 0 .. Len1 - 1 loop
+               Scratch.Data (K) := Get (Base1 + K);
+            end loop;
+
+            while I < Len1 and then J < Base2 + Len2 loop
+               --  Only take from the second run if strictly less, for
+               --  stability.
+               if Get (J) < Scratch.Data (I) then
+                  Put (Dest, Get (J));
+                  J := J + 1;
+               else
+                  Put (Dest, Scratch.Data (I));
+                  I := I + 1;
+               end if;
+               Dest := Dest + 1;
+            end loop;
+
+            --  Remaining elements of the second run are already in place
+
+            while I < Len1 loop
+               Put (Dest, Scratch.Data (I));
+               I := I + 1;
+               Dest := Dest + 1;
+            end loop;
+         end Merge_Low;
+
+         ----------------
+         -- Merge_High --
+         ----------------
+
+         procedure Merge_High (Base1, Len1, Base2, Len2 : Natural) is
+            I    : Integer := Base1 + Len1 - 1;   --  in the first run
+            J    : Integer := Len2 - 1;           --  in Scratch
+            Dest : Integer := Base2 + Len2 - 1;
+         begin
+            Reserve (Len2);
+            for K in 0 .. Len2 - 1 loop
+               Scratch.Data (K) := Get (Base2 + K);
+            end loop;
+
+            while J >= 0 and then I >= Base1 loop
+               if Scratch.Data (J) < Get (I) then
+                  Put (Dest, Get (I));
+                  I := I - 1;
+               else
+                  Put (Dest, Scratch.Data (J));
+                  J := J - 1;
+               end if;
+               Dest := Dest - 1;
+            end loop;
+
+            --  Remaining elements of the first run are already in place
+
+            while J >= 0 loop
+               Put (Dest, Scratch.Data (J));
+               J := J - 1;
+               Dest := Dest - 1;
+            end loop;
+         end Merge_High;
+
+         --------------
+         -- Merge_At --
+         --------------
+
+         procedure Merge_At (I : Natural) is
+            Base1 : Natural := Run_Base (I);
+            Len1  : Natural := Run_Len (I);
+            Base2 : constant Natural := Run_Base (I + 1);
+            Len2  : Natural := Run_Len (I + 1);
+            K     : Natural;
+         begin
+            Run_Len (I) := Len1 + Len2;
+            if I = Runs - 3 then
+               Run_Base (I + 1) := Run_Base (I + 2);
+               Run_Len (I + 1) := Run_Len (I + 2);
+            end if;
+            Runs := Runs - 1;
+
+            --  Elements of the first run that are not greater than the
+            --  first element of the second run are already in place.
+
+            K := Upper_Bound (Get (Base2), Base1, Base1 + Len1);
+            Len1 := Len1 - (K - Base1);
+            Base1 := K;
+            if Len1 = 0 then
+               return;
+            end if;
+
+            --  Likewise for elements of the second run that are not less
+            --  than the last element of the first run.
+
+            Len2 := Lower_Bound (Get (Base1 + Len1 - 1), Base2, Base2 + Len2)
+              - Base2;
+            if Len2 = 0 then
+               return;
+            end if;
+
+            if Len1 <= Len2 then
+               Merge_Low (Base1, Len1, Base2, Len2);
+            else
+               Merge_High (Base1, Len1, Base2, Len2);
+            end if;
+         end Merge_At;
+
+         Min_Run : Natural;
+         Low     : Natural := 0;
+         High    : Natural;
+         N       : Natural;
+
+      begin
+         if Count < 2 then
+            return;
+         end if;
+
+         if Count < Min_Merge then
+            Insertion_Sort (0, Count, Count_Run (0, Count));
+            return;
+         end if;
+
+         Min_Run := Min_Run_Length (Count);
+
+         while Low < Count loop
+            High := Count_Run (Low, Count);
+
+            --  Extend short runs
+
+            if High - Low < Min_Run then
+               N := Natural'Min (Low + Min_Run, Count);
+               Insertion_Sort (Low, N, High);
+               High := N;
+            end if;
+
+            Run_Base (Runs) := Low;
+            Run_Len (Runs) := High - Low;
+            Runs := Runs + 1;
+
+            --  Merge runs until the lengths on the stack decrease at least
+            --  as fast as the Fibonacci sequence, which bounds the size of
+            --  the stack and keeps merges balanced.
+
+            while Runs > 1 loop
+               N := Runs - 2;
+               if N > 0
+                 and then
+                   (Run_Len (N - 1) <= Run_Len (N) + Run_Len (N + 1)
+                    or else (N > 1
+                             and then Run_Len (N - 2)
+                               <= Run_Len (N - 1) + Run_Len (N)))
+               then
+                  if Run_Len (N - 1) < Run_Len (N + 1) then
+                     N := N - 1;
+                  end if;
+               elsif Run_Len (N) > Run_Len (N + 1) then
+                  exit;
+               end if;
+               Merge_At (N);
+            end loop;
+
+            Low := High;
+         end loop;
+
+         while Runs > 1 loop
+            N := Runs - 2;
+            if N > 0 and then Run_Len (N - 1) < Run_Len (N + 1) then
+               N := N - 1;
+            end if;
+            Merge_At (N);
+         end loop;
+      end Sort;
+   end Stable_Sorting;
+
    ---------------
    -- Is_Sorted --
    ---------------
@@ -333,4 +1184,157 @@ package body Conts.Algorithms is
       return True;
    end Equals;
 
+   --------------------
+   -- Is_Partitioned --
+   --------------------
+
+   function Is_Partitioned
+     (Self      : Cursors.Container;
+      Predicate : not null access
+        function (E : Getters.Element) return Boolean)
+     return Boolean
+   is
+      C : Cursors.Cursor := Cursors.First (Self);
+   begin
+      --  Skip the elements that satisfy the predicate
+
+      while Cursors.Has_Element (Self, C)
+        and then Predicate (Getters.Get (Self, C))
+      loop
+         C := Cursors.Next (Self, C);
+      end loop;
+
+      --  None of the remaining elements should satisfy it
+
+      while Cursors.Has_Element (Self, C) loop
+         if Predicate (Getters.Get (Self, C)) then
+            return False;
+         end if;
+         C := Cursors.Next (Self, C);
+      end loop;
+      return True;
+   end Is_Partitioned;
+
+   ---------------------
+   -- Partition_Point --
+   ---------------------
+
+   function Partition_Point
+     (Self      : Cursors.Container;
+      Predicate : not null access
+        function (E : Getters.Element) return Boolean)
+     return Cursors.Index
+   is
+      First : constant Cursors.Index := Cursors.First_Index (Self);
+      Count : Natural;
+      Low   : Natural := 0;  --  all elements before Low satisfy it
+      Len   : Natural;       --  number of elements left to check
+      Half  : Natural;
+   begin
+      if not Cursors.Has_Element (Self, First) then
+         return Cursors.No_Element;  --  empty container
+      end if;
+
+      Count := Cursors.Dist (Cursors.Last_Index (Self), First) + 1;
+      Len := Count;
+
+      while Len > 0 loop
+         Half := Len / 2;
+         if Predicate (Getters.Get (Self, Cursors.Add (First, Low + Half)))
+         then
+            Low := Low + Half + 1;
+            Len := Len - Half - 1;
+         else
+            Len := Half;
+         end if;
+      end loop;
+
+      if Low = Count then
+         return Cursors.No_Element;
+      else
+         return Cursors.Add (First, Low);
+      end if;
+   end Partition_Point;
+
+   -----------------
+   -- Lower_Bound --
+   -----------------
+
+   function Lower_Bound
+     (Self : Cursors.Container;
+      E    : Getters.Element)
+     return Cursors.Index
+   is
+      function Point is new Partition_Point (Cursors, Getters);
+      function Is_Less (Item : Getters.Element) return Boolean
+        is (Item < E) with Inline;
+   begin
+      return Point (Self, Is_Less'Access);
+   end Lower_Bound;
+
+   -----------------
+   -- Upper_Bound --
+   -----------------
+
+   function Upper_Bound
+     (Self : Cursors.Container;
+      E    : Getters.Element)
+     return Cursors.Index
+   is
+      function Point is new Partition_Point (Cursors, Getters);
+      function Not_Greater (Item : Getters.Element) return Boolean
+        is (not (E < Item)) with Inline;
+   begin
+      return Point (Self, Not_Greater'Access);
+   end Upper_Bound;
+
+   -----------------
+   -- Equal_Range --
+   -----------------
+
+   procedure Equal_Range
+     (Self      : Cursors.Container;
+      E         : Getters.Element;
+      Low, High : out Cursors.Index)
+   is
+      function Lower is new Lower_Bound (Cursors, Getters, "<");
+      function Upper is new Upper_Bound (Cursors, Getters, "<");
+      use type Cursors.Index;
+      After : Cursors.Index;
+   begin
+      Low := Lower (Self, E);
+      if Low = Cursors.No_Element
+        or else E < Getters.Get (Self, Low)
+      then
+         Low := Cursors.No_Element;
+         High := Cursors.No_Element;
+      else
+         After := Upper (Self, E);
+         if After = Cursors.No_Element then
+            High := Cursors.Last_Index (Self);
+         else
+            High := Cursors.Add (After, -1);
+         end if;
+      end if;
+   end Equal_Range;
+
+   -------------------
+   -- Binary_Search --
+   -------------------
+
+   function Binary_Search
+     (Self : Cursors.Container;
+      E    : Getters.Element)
+     return Cursors.Index
+   is
+      function Lower is new Lower_Bound (Cursors, Getters, "<");
+      use type Cursors.Index;
+      C : constant Cursors.Index := Lower (Self, E);
+   begin
+      if C = Cursors.No_Element or else E < Getters.Get (Self, C) then
+         return Cursors.No_Element;
+      end if;
+      return C;
+   end Binary_Search;
+
 end Conts.Algorithms;
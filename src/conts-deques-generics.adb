@@ -0,0 +1,288 @@
+------------------------------------------------------------------------------
+--                     Copyright (C) 2016, AdaCore                          --
+--                                                                          --
+-- This library is free software;  you can redistribute it and/or modify it --
+-- under terms of the  GNU General Public License  as published by the Free --
+-- Software  Foundation;  either version 3,  or (at your  option) any later --
+-- version. This library is distributed in the hope that it will be useful, --
+-- but WITHOUT ANY WARRANTY;  without even the implied warranty of MERCHAN- --
+-- TABILITY or FITNESS FOR A PARTICULAR PURPOSE.                            --
+--                                                                          --
+-- As a special exception under Section 7 of GPL version 3, you are granted --
+-- additional permissions described in the GCC Runtime Library Exception,   --
+-- version 3.1, as published by the Free Software Foundation.               --
+--                                                                          --
+-- You should have received a copy of the GNU General Public License and    --
+-- a copy of the GCC Runtime Library Exception along with this program;     --
+-- see the files COPYING3 and COPYING.RUNTIME respectively.  If not, see    --
+-- <http://www.gnu.org/licenses/>.                                          --
+--                                                                          --
+------------------------------------------------------------------------------
+
+pragma Ada_2012;
+with System;  use type System.Address;
+
+package body Conts.Deques.Generics is
+
+   function Slot
+     (Self : Base_Deque'Class; Position : Cursor) return Count_Type
+     is (Conts.Deques.Storage.Slot
+           (Storage.Capacity (Self), Self.Head, Position - 1))
+     with Inline;
+   --  The slot in which the element at Position is stored
+
+   procedure Resize
+     (Self     : in out Base_Deque'Class;
+      New_Size : Count_Type;
+      Force    : Boolean) with Inline;
+   --  Resize the storage, preserving the elements
+
+   ------------
+   -- Resize --
+   ------------
+
+   procedure Resize
+     (Self     : in out Base_Deque'Class;
+      New_Size : Count_Type;
+      Force    : Boolean)
+   is
+      Head : Count_Type := Self.Head;
+   begin
+      Storage.Resize (Self, New_Size, Head, Self.Length, Force);
+      Self.Head := Head;
+   end Resize;
+
+   ----------------------
+   -- Reserve_Capacity --
+   ----------------------
+
+   procedure Reserve_Capacity
+     (Self : in out Base_Deque'Class; Capacity : Count_Type) is
+   begin
+      Resize (Self, Count_Type'Max (Self.Length, Capacity), Force => True);
+   end Reserve_Capacity;
+
+   -------------------
+   -- Shrink_To_Fit --
+   -------------------
+
+   procedure Shrink_To_Fit (Self : in out Base_Deque'Class) is
+   begin
+      Resize (Self, Self.Length, Force => True);
+   end Shrink_To_Fit;
+
+   ------------
+   -- Append --
+   ------------
+
+   procedure Append
+     (Self    : in out Base_Deque'Class;
+      Element : Element_Type) is
+   begin
+      if Self.Length = Storage.Capacity (Self) then
+         Resize (Self, Self.Length + 1, Force => False);
+      end if;
+
+      Self.Length := Self.Length + 1;
+      Storage.Set_Element
+        (Self, Slot (Self, Self.Length),
+         Storage.Elements.To_Stored (Element));
+   end Append;
+
+   -------------
+   -- Prepend --
+   -------------
+
+   procedure Prepend
+     (Self    : in out Base_Deque'Class;
+      Element : Element_Type) is
+   begin
+      if Self.Length = Storage.Capacity (Self) then
+         Resize (Self, Self.Length + 1, Force => False);
+      end if;
+
+      if Self.Head = 1 then
+         Self.Head := Storage.Capacity (Self);
+      else
+         Self.Head := Self.Head - 1;
+      end if;
+
+      Self.Length := Self.Length + 1;
+      Storage.Set_Element
+        (Self, Self.Head, Storage.Elements.To_Stored (Element));
+   end Prepend;
+
+   ------------------
+   -- Delete_First --
+   ------------------
+
+   procedure Delete_First (Self : in out Base_Deque'Class) is
+   begin
+      Storage.Release_Element (Self, Self.Head);
+      Self.Length := Self.Length - 1;
+
+      if Self.Length = 0 or else Self.Head = Storage.Capacity (Self) then
+         Self.Head := 1;
+      else
+         Self.Head := Self.Head + 1;
+      end if;
+   end Delete_First;
+
+   -----------------
+   -- Delete_Last --
+   -----------------
+
+   procedure Delete_Last (Self : in out Base_Deque'Class) is
+   begin
+      Storage.Release_Element (Self, Slot (Self, Self.Length));
+      Self.Length := Self.Length - 1;
+   end Delete_Last;
+
+   -------------------
+   -- First_Element --
+   -------------------
+
+   function First_Element
+     (Self : Base_Deque'Class) return Constant_Returned_Type is
+   begin
+      return Storage.Elements.To_Constant_Returned
+        (Storage.Get_Element (Self, Self.Head));
+   end First_Element;
+
+   ------------------
+   -- Last_Element --
+   ------------------
+
+   function Last_Element
+     (Self : Base_Deque'Class) return Constant_Returned_Type is
+   begin
+      return Element (Self, Self.Length);
+   end Last_Element;
+
+   -----------
+   -- Clear --
+   -----------
+
+   procedure Clear (Self : in out Base_Deque'Class) is
+   begin
+      for P in 1 .. Self.Length loop
+         Storage.Release_Element (Self, Slot (Self, P));
+      end loop;
+
+      Self.Length := 0;
+
+      --  Deallocate all memory
+      Resize (Self, 0, Force => True);
+      Self.Head := 1;
+   end Clear;
+
+   ------------
+   -- Assign --
+   ------------
+
+   procedure Assign
+     (Self : in out Base_Deque'Class; Source : Base_Deque'Class)
+   is
+      Head   : Count_Type := Source.Head;
+      Length : constant Count_Type := Source.Length;
+   begin
+      --  When called from Adjust, Self is a bitwise copy of the original
+      --  deque and must not be cleared.
+      if Self'Address /= Source'Address then
+         Clear (Self);
+      end if;
+
+      Storage.Assign (Self, Source, Head, Length);
+      Self.Head := Head;
+      Self.Length := Length;
+   end Assign;
+
+   ------------
+   -- Adjust --
+   ------------
+
+   procedure Adjust (Self : in out Base_Deque) is
+   begin
+      Assign (Self, Self);
+   end Adjust;
+
+   --------------
+   -- Finalize --
+   --------------
+
+   procedure Finalize (Self : in out Base_Deque) is
+   begin
+      Clear (Self);
+   end Finalize;
+
+   -------------
+   -- Element --
+   -------------
+
+   function Element
+     (Self : Base_Deque'Class; Position : Cursor)
+      return Constant_Returned_Type is
+   begin
+      return Storage.Elements.To_Constant_Returned
+        (Storage.Get_Element (Self, Slot (Self, Position)));
+   end Element;
+
+   ---------------
+   -- Reference --
+   ---------------
+
+   function Reference
+     (Self : Base_Deque'Class; Position : Cursor) return Returned_Type is
+   begin
+      return Storage.Elements.To_Returned
+        (Storage.Get_Element (Self, Slot (Self, Position)));
+   end Reference;
+
+   ---------------------
+   -- Replace_Element --
+   ---------------------
+
+   procedure Replace_Element
+     (Self     : in out Base_Deque'Class;
+      Position : Cursor;
+      New_Item : Element_Type)
+   is
+      S : constant Count_Type := Slot (Self, Position);
+   begin
+      Storage.Release_Element (Self, S);
+      Storage.Set_Element (Self, S, Storage.Elements.To_Stored (New_Item));
+   end Replace_Element;
+
+   ----------
+   -- Swap --
+   ----------
+
+   procedure Swap
+     (Self        : in out Base_Deque'Class;
+      Left, Right : Cursor)
+   is
+      L     : constant Count_Type := Slot (Self, Left);
+      R     : constant Count_Type := Slot (Self, Right);
+      L_Tmp : constant Stored_Type := Storage.Get_Element (Self, L);
+      R_Tmp : constant Stored_Type := Storage.Get_Element (Self, R);
+   begin
+      --  Since we will only keep one copy of the elements in the end, we
+      --  should test Movable here, not Copyable.
+      if Storage.Elements.Movable then
+         Storage.Set_Element (Self, L, R_Tmp);
+         Storage.Set_Element (Self, R, L_Tmp);
+
+      else
+         declare
+            L2 : constant Stored_Type := Storage.Elements.Copy (L_Tmp);
+            R2 : constant Stored_Type := Storage.Elements.Copy (R_Tmp);
+         begin
+            Storage.Release_Element (Self, L);
+            Storage.Set_Element (Self, L, R2);
+            Storage.Release_Element (Self, R);
+            Storage.Set_Element (Self, R, L2);
+         end;
+      end if;
+   end Swap;
+
+end Conts.Deques.Generics;
@@ -0,0 +1,126 @@
+------------------------------------------------------------------------------
+--                     Copyright (C) 2016, AdaCore                          --
+--                                                                          --
+-- This library is free software;  you can redistribute it and/or modify it --
+-- under terms of the  GNU General Public License  as published by the Free --
+-- Software  Foundation;  either version 3,  or (at your  option) any later --
+-- version. This library is distributed in the hope that it will be useful, --
+-- but WITHOUT ANY WARRANTY;  without even the implied warranty of MERCHAN- --
+-- TABILITY or FITNESS FOR A PARTICULAR PURPOSE.                            --
+--                                                                          --
+-- As a special exception under Section 7 of GPL version 3, you are granted --
+-- additional permissions described in the GCC Runtime Library Exception,   --
+-- version 3.1, as published by the Free Software Foundation.               --
+--                                                                          --
+-- You should have received a copy of the GNU General Public License and    --
+-- a copy of the GCC Runtime Library Exception along with this program;     --
+-- see the files COPYING3 and COPYING.RUNTIME respectively.  If not, see    --
+-- <http://www.gnu.org/licenses/>.                                          --
+--                                                                          --
+------------------------------------------------------------------------------
+
+pragma Ada_2012;
+with Ada.Unchecked_Deallocation;
+
+package body Conts.Deques.Storage.Unbounded with SPARK_Mode => Off is
+
+   package body Impl is
+
+      procedure Unchecked_Free is new Ada.Unchecked_Deallocation
+        (Nodes_Array, Nodes_Array_Access);
+
+      ---------------------
+      -- Release_Element --
+      ---------------------
+
+      procedure Release_Element
+        (Self : in out Container'Class; Index : Count_Type) is
+      begin
+         Elements.Release (Self.Nodes (Index));
+      end Release_Element;
+
+      -----------------
+      -- Set_Element --
+      -----------------
+
+      procedure Set_Element
+        (Self    : in out Container'Class;
+         Index   : Count_Type;
+         Element : Elements.Stored_Type) is
+      begin
+         Self.Nodes (Index) := Element;
+      end Set_Element;
+
+      ------------
+      -- Resize --
+      ------------
+
+      procedure Resize
+        (Self     : in out Container'Class;
+         New_Size : Count_Type;
+         Head     : in out Count_Type;
+         Length   : Count_Type;
+         Force    : Boolean)
+      is
+         Old  : constant Count_Type := Capacity (Self);
+         Size : Count_Type;
+         Tmp  : Nodes_Array_Access;
+      begin
+         if Force then
+            Size := New_Size;
+         elsif New_Size < Old then
+            Size := Resize_Policy.Shrink
+              (Current_Size => Old, Min_Expected_Size => New_Size);
+         else
+            Size := Resize_Policy.Grow
+              (Current_Size => Old, Min_Expected_Size => New_Size);
+         end if;
+
+         if Size /= Old then
+            if Size /= 0 then
+               --  Move the elements to the start of the new array, so that
+               --  they no longer wrap around. Freeing the old array does
+               --  not release the elements, which now belong to Tmp.
+               Tmp := new Nodes_Array (1 .. Size);
+               for J in 0 .. Length - 1 loop
+                  Tmp (J + 1) := Self.Nodes (Slot (Old, Head, J));
+               end loop;
+            end if;
+
+            Unchecked_Free (Self.Nodes);
+            Self.Nodes := Tmp;
+            Head := 1;
+         end if;
+      end Resize;
+
+      ------------
+      -- Assign --
+      ------------
+
+      procedure Assign
+        (Self   : in out Container'Class;
+         Source : Container'Class;
+         Head   : in out Count_Type;
+         Length : Count_Type)
+      is
+         --  Self might be the same as Source, so keep a pointer to the
+         --  elements to copy.
+         Src : constant Nodes_Array_Access := Source.Nodes;
+      begin
+         if Length = 0 then
+            Self.Nodes := null;
+         else
+            --  We only allocate enough memory to copy everything
+            Self.Nodes := new Nodes_Array (1 .. Length);
+            for J in 0 .. Length - 1 loop
+               Self.Nodes (J + 1) :=
+                 Elements.Copy (Src (Slot (Src'Length, Head, J)));
+            end loop;
+         end if;
+
+         Head := 1;
+      end Assign;
+
+   end Impl;
+
+end Conts.Deques.Storage.Unbounded;
@@ -0,0 +1,168 @@
+------------------------------------------------------------------------------
+--                     Copyright (C) 2016, AdaCore                          --
+--                                                                          --
+-- This library is free software;  you can redistribute it and/or modify it --
+-- under terms of the  GNU General Public License  as published by the Free --
+-- Software  Foundation;  either version 3,  or (at your  option) any later --
+-- version. This library is distributed in the hope that it will be useful, --
+-- but WITHOUT ANY WARRANTY;  without even the implied warranty of MERCHAN- --
+-- TABILITY or FITNESS FOR A PARTICULAR PURPOSE.                            --
+--                                                                          --
+-- As a special exception under Section 7 of GPL version 3, you are granted --
+-- additional permissions described in the GCC Runtime Library Exception,   --
+-- version 3.1, as published by the Free Software Foundation.               --
+--                                                                          --
+-- You should have received a copy of the GNU General Public License and    --
+-- a copy of the GCC Runtime Library Exception along with this program;     --
+-- see the files COPYING3 and COPYING.RUNTIME respectively.  If not, see    --
+-- <http://www.gnu.org/licenses/>.                                          --
+--                                                                          --
+------------------------------------------------------------------------------
+
+pragma Ada_2012;
+
+package body Conts.Hashes with SPARK_Mode => Off is
+   use Interfaces;
+
+   Prime_1 : constant Unsigned_32 := 16#9E37_79B1#;
+   Prime_2 : constant Unsigned_32 := 16#85EB_CA77#;
+   Prime_3 : constant Unsigned_32 := 16#C2B2_AE3D#;
+   Prime_4 : constant Unsigned_32 := 16#27D4_EB2F#;
+   Prime_5 : constant Unsigned_32 := 16#1656_67B1#;
+   --  The constants used by xxHash32
+
+   function Read_32 (S : String; Index : Positive) return Unsigned_32
+     is (Unsigned_32 (Character'Pos (S (Index)))
+         or Shift_Left (Unsigned_32 (Character'Pos (S (Index + 1))), 8)
+         or Shift_Left (Unsigned_32 (Character'Pos (S (Index + 2))), 16)
+         or Shift_Left (Unsigned_32 (Character'Pos (S (Index + 3))), 24))
+     with Inline;
+   --  Read four characters as a little-endian word. The compiler is able
+   --  to turn this into a single load on most architectures.
+
+   function Round (Acc, Lane : Unsigned_32) return Unsigned_32
+     is (Rotate_Left (Acc + Lane * Prime_2, 13) * Prime_1)
+     with Inline;
+   --  Mix one word of the input into one of the accumulators
+
+   ---------
+   -- Mix --
+   ---------
+
+   function Mix (Value : Hash_Type) return Hash_Type is
+      H : Unsigned_32 := Unsigned_32 (Value);
+   begin
+      H := H xor Shift_Right (H, 16);
+      H := H * 16#85EB_CA6B#;
+      H := H xor Shift_Right (H, 13);
+      H := H * 16#C2B2_AE35#;
+      H := H xor Shift_Right (H, 16);
+      return Hash_Type (H);
+   end Mix;
+
+   ------------
+   -- Mix_64 --
+   ------------
+
+   function Mix_64 (Value : Interfaces.Unsigned_64) return Hash_Type is
+      H : Unsigned_64 := Value;
+   begin
+      H := H xor Shift_Right (H, 33);
+      H := H * 16#FF51_AFD7_ED55_8CCD#;
+      H := H xor Shift_Right (H, 33);
+      H := H * 16#C4CE_B9FE_1A85_EC53#;
+      H := H xor Shift_Right (H, 33);
+      return Hash_Type (H and 16#FFFF_FFFF#);
+   end Mix_64;
+
+   -------------------
+   -- Discrete_Hash --
+   -------------------
+
+   function Discrete_Hash (Key : Discrete) return Hash_Type is
+   begin
+      return Mix_64 (Unsigned_64'Mod (Discrete'Pos (Key)));
+   end Discrete_Hash;
+
+   -----------------
+   -- String_Hash --
+   -----------------
+
+   function String_Hash (Key : String) return Hash_Type is
+   begin
+      return String_Hash (Key, Seed => 0);
+   end String_Hash;
+
+   -----------------
+   -- String_Hash --
+   -----------------
+
+   function String_Hash
+     (Key : String; Seed : Hash_Type) return Hash_Type
+   is
+      S     : constant Unsigned_32 := Unsigned_32 (Seed);
+      Index : Natural := Key'First;
+      H     : Unsigned_32;
+   begin
+      if Key'Length >= 16 then
+         declare
+            V1    : Unsigned_32 := S + Prime_1 + Prime_2;
+            V2    : Unsigned_32 := S + Prime_2;
+            V3    : Unsigned_32 := S;
+            V4    : Unsigned_32 := S - Prime_1;
+            Limit : constant Integer := Key'Last - 15;
+         begin
+            while Index <= Limit loop
+               V1 := Round (V1, Read_32 (Key, Index));
+               V2 := Round (V2, Read_32 (Key, Index + 4));
+               V3 := Round (V3, Read_32 (Key, Index + 8));
+               V4 := Round (V4, Read_32 (Key, Index + 12));
+               Index := Index + 16;
+            end loop;
+
+            H := Rotate_Left (V1, 1) + Rotate_Left (V2, 7)
+              + Rotate_Left (V3, 12) + Rotate_Left (V4, 18);
+         end;
+      else
+         H := S + Prime_5;
+      end if;
+
+      H := H + Unsigned_32 (Key'Length);
+
+      while Index + 3 <= Key'Last loop
+         H := Rotate_Left (H + Read_32 (Key, Index) * Prime_3, 17) * Prime_4;
+         Index := Index + 4;
+      end loop;
+
+      while Index <= Key'Last loop
+         H := Rotate_Left
+           (H + Unsigned_32 (Character'Pos (Key (Index))) * Prime_5, 11)
+           * Prime_1;
+         Index := Index + 1;
+      end loop;
+
+      --  Final avalanche
+
+      H := H xor Shift_Right (H, 15);
+      H := H * Prime_2;
+      H := H xor Shift_Right (H, 13);
+      H := H * Prime_3;
+      H := H xor Shift_Right (H, 16);
+      return Hash_Type (H);
+   end String_Hash;
+
+   -------------
+   -- Combine --
+   -------------
+
+   function Combine (Seed, Hash : Hash_Type) return Hash_Type is
+   begin
+      --  Similar to boost::hash_combine, but Hash is mixed first so that
+      --  combining poor hashes (identity on integers) still gives a good
+      --  result.
+
+      return Seed xor
+        (Mix (Hash) + 16#9E37_79B9# + Seed * 64 + Seed / 4);
+   end Combine;
+
+end Conts.Hashes;
@@ -30,6 +30,19 @@ package body Conts.Lists.Impl with SPARK_Mode => Off is
    pragma Assertion_Policy
       (Pre => Suppressible, Ghost => Suppressible, Post => Ignore);
 
+   procedure Unlink (Self : in out Base_List'Class; N : Node_Access);
+   --  Remove N from the list, without releasing it
+
+   procedure Link_Before
+     (Self : in out Base_List'Class; Before, N : Node_Access);
+   --  Insert N, which must not be part of a list, before Before (or at the
+   --  end of the list if Before is Null_Access).
+
+   procedure Relink (Self : in out Base_List'Class; Head : Node_Access);
+   --  Make Head the first node of Self. Nodes starting at Head are only
+   --  linked through their Next field, and this procedure restores their
+   --  Previous field, as well as the tail of the list.
+
    ---------------
    -- Positions --
    ---------------
@@ -308,6 +321,333 @@ package body Conts.Lists.Impl with SPARK_Mode => Off is
       Position.Current := N;
    end Delete;
 
+   ------------
+   -- Unlink --
+   ------------
+
+   procedure Unlink (Self : in out Base_List'Class; N : Node_Access) is
+      Prev : constant Node_Access := Get_Previous (Self, N);
+      Next : constant Node_Access := Get_Next (Self, N);
+   begin
+      if Prev = Null_Access then
+         Self.Head := Next;
+      else
+         Set_Next (Self, Prev, Next);
+      end if;
+
+      if Next = Null_Access then
+         Self.Tail := Prev;
+      else
+         Set_Previous (Self, Next, Prev);
+      end if;
+
+      Set_Next (Self, N, Null_Access);
+      Set_Previous (Self, N, Null_Access);
+      Self.Size := Self.Size - 1;
+   end Unlink;
+
+   -----------------
+   -- Link_Before --
+   -----------------
+
+   procedure Link_Before
+     (Self : in out Base_List'Class; Before, N : Node_Access)
+   is
+      Prev : Node_Access;
+   begin
+      if Before = Null_Access then
+         Prev := Self.Tail;
+         Self.Tail := N;
+      else
+         Prev := Get_Previous (Self, Before);
+         Set_Next (Self, N, Before);
+         Set_Previous (Self, Before, N);
+      end if;
+
+      if Prev = Null_Access then
+         Self.Head := N;
+      else
+         Set_Next (Self, Prev, N);
+         Set_Previous (Self, N, Prev);
+      end if;
+
+      Self.Size := Self.Size + 1;
+   end Link_Before;
+
+   ------------
+   -- Relink --
+   ------------
+
+   procedure Relink (Self : in out Base_List'Class; Head : Node_Access) is
+      Prev : Node_Access := Null_Access;
+      N    : Node_Access := Head;
+   begin
+      Self.Head := Head;
+      while N /= Null_Access loop
+         Set_Previous (Self, N, Prev);
+         Prev := N;
+         N := Get_Next (Self, N);
+      end loop;
+      Self.Tail := Prev;
+   end Relink;
+
+   ------------
+   -- Splice --
+   ------------
+
+   procedure Splice
+     (Self     : in out Base_List'Class;
+      Before   : Cursor;
+      Source   : in out Base_List'Class;
+      Position : in out Cursor)
+   is
+      N : Node_Access := Position.Current;
+      E : Stored_Type;
+   begin
+      if Self'Address = Source'Address then
+         if N /= Before.Current then
+            Unlink (Self, N);
+            Link_Before (Self, Before.Current, N);
+         end if;
+
+      elsif Storage.Movable_Nodes then
+         Unlink (Source, N);
+         Link_Before (Self, Before.Current, N);
+
+      else
+         --  Only the stored element is moved to a new node, the element
+         --  itself is not copied.
+
+         E := Get_Element (Source, N);
+         Unlink (Source, N);
+         Storage.Release_Node (Source, N);
+         Allocate (Self, E, New_Node => N);
+         Link_Before (Self, Before.Current, N);
+      end if;
+
+      Position := (Current => N);
+   end Splice;
+
+   ------------
+   -- Splice --
+   ------------
+
+   procedure Splice
+     (Self   : in out Base_List'Class;
+      Before : Cursor;
+      Source : in out Base_List'Class)
+   is
+      Prev : Node_Access;
+      C    : Cursor;
+   begin
+      if Self'Address = Source'Address
+        or else Source.Head = Null_Access
+      then
+         return;
+      end if;
+
+      if Storage.Movable_Nodes then
+         if Before.Current = Null_Access then
+            Prev := Self.Tail;
+            Self.Tail := Source.Tail;
+         else
+            Prev := Get_Previous (Self, Before.Current);
+            Set_Next (Self, Source.Tail, Before.Current);
+            Set_Previous (Self, Before.Current, Source.Tail);
+         end if;
+
+         if Prev = Null_Access then
+            Self.Head := Source.Head;
+         else
+            Set_Next (Self, Prev, Source.Head);
+            Set_Previous (Self, Source.Head, Prev);
+         end if;
+
+         Self.Size := Self.Size + Source.Size;
+         Source.Head := Null_Access;
+         Source.Tail := Null_Access;
+         Source.Size := 0;
+
+      else
+         while Source.Head /= Null_Access loop
+            C := (Current => Source.Head);
+            Splice (Self, Before, Source, C);
+         end loop;
+         Storage.Release (Source);
+      end if;
+   end Splice;
+
+   ---------------------
+   -- Generic_Sorting --
+   ---------------------
+
+   package body Generic_Sorting is
+
+      function Less
+        (Self : Base_List'Class; Left, Right : Node_Access) return Boolean
+        is ("<" (Storage.Elements.To_Element
+                   (Storage.Elements.To_Constant_Returned
+                      (Get_Element (Self, Left))),
+                 Storage.Elements.To_Element
+                   (Storage.Elements.To_Constant_Returned
+                      (Get_Element (Self, Right)))))
+        with Inline;
+
+      procedure Merge_Chains
+        (Self        : in out Base_List'Class;
+         Left, Right : Node_Access;
+         Result      : out Node_Access);
+      --  Merge two sorted chains of nodes, only linked through their Next
+      --  field. The nodes from Left come first among equal elements, so
+      --  that the sort is stable.
+
+      ------------------
+      -- Merge_Chains --
+      ------------------
+
+      procedure Merge_Chains
+        (Self        : in out Base_List'Class;
+         Left, Right : Node_Access;
+         Result      : out Node_Access)
+      is
+         L    : Node_Access := Left;
+         R    : Node_Access := Right;
+         N    : Node_Access;
+         Tail : Node_Access := Null_Access;
+      begin
+         Result := Null_Access;
+
+         while L /= Null_Access and then R /= Null_Access loop
+            if Less (Self, R, L) then
+               N := R;
+               R := Get_Next (Self, R);
+            else
+               N := L;
+               L := Get_Next (Self, L);
+            end if;
+
+            if Tail = Null_Access then
+               Result := N;
+            else
+               Set_Next (Self, Tail, N);
+            end if;
+            Tail := N;
+         end loop;
+
+         if L = Null_Access then
+            N := R;
+         else
+            N := L;
+         end if;
+
+         if Tail = Null_Access then
+            Result := N;
+         else
+            Set_Next (Self, Tail, N);
+         end if;
+      end Merge_Chains;
+
+      ----------
+      -- Sort --
+      ----------
+
+      procedure Sort (Self : in out Base_List'Class) is
+         Bins : array (0 .. Count_Type'Size) of Node_Access :=
+           (others => Null_Access);
+         --  Bins (J) is either empty or a sorted chain of 2**J nodes. The
+         --  nodes in a bin come before all the nodes in the lower bins.
+
+         N, Next, Carry, Result : Node_Access;
+         J : Natural;
+      begin
+         if Self.Size < 2 then
+            return;
+         end if;
+
+         N := Self.Head;
+         while N /= Null_Access loop
+            Next := Get_Next (Self, N);
+            Set_Next (Self, N, Null_Access);
+
+            Carry := N;
+            J := Bins'First;
+            while Bins (J) /= Null_Access loop
+               Merge_Chains (Self, Bins (J), Carry, Result);
+               Carry := Result;
+               Bins (J) := Null_Access;
+               J := J + 1;
+            end loop;
+            Bins (J) := Carry;
+
+            N := Next;
+         end loop;
+
+         Carry := Null_Access;
+         for B of Bins loop
+            if B /= Null_Access then
+               Merge_Chains (Self, B, Carry, Result);
+               Carry := Result;
+            end if;
+         end loop;
+
+         Relink (Self, Carry);
+      end Sort;
+
+      -----------
+      -- Merge --
+      -----------
+
+      procedure Merge
+        (Self   : in out Base_List'Class;
+         Source : in out Base_List'Class)
+      is
+         Old_Tail : constant Node_Access := Self.Tail;
+         Second   : Node_Access;
+         Result   : Node_Access;
+      begin
+         if Self'Address = Source'Address
+           or else Source.Head = Null_Access
+         then
+            return;
+         end if;
+
+         Splice (Self, No_Element, Source);
+
+         if Old_Tail /= Null_Access then
+            Second := Get_Next (Self, Old_Tail);
+            Set_Next (Self, Old_Tail, Null_Access);
+            Merge_Chains (Self, Self.Head, Second, Result);
+            Relink (Self, Result);
+         end if;
+      end Merge;
+
+      ---------------
+      -- Is_Sorted --
+      ---------------
+
+      function Is_Sorted (Self : Base_List'Class) return Boolean is
+         N    : Node_Access := Self.Head;
+         Next : Node_Access;
+      begin
+         if N = Null_Access then
+            return True;
+         end if;
+
+         loop
+            Next := Get_Next (Self, N);
+            exit when Next = Null_Access;
+
+            if Less (Self, Next, N) then
+               return False;
+            end if;
+            N := Next;
+         end loop;
+
+         return True;
+      end Is_Sorted;
+
+   end Generic_Sorting;
+
    ------------
    -- Length --
    ------------
@@ -0,0 +1,286 @@
+------------------------------------------------------------------------------
+--                     Copyright (C) 2016, AdaCore                          --
+--                                                                          --
+-- This library is free software;  you can redistribute it and/or modify it --
+-- under terms of the  GNU General Public License  as published by the Free --
+-- Software  Foundation;  either version 3,  or (at your  option) any later --
+-- version. This library is distributed in the hope that it will be useful, --
+-- but WITHOUT ANY WARRANTY;  without even the implied warranty of MERCHAN- --
+-- TABILITY or FITNESS FOR A PARTICULAR PURPOSE.                            --
+--                                                                          --
+-- As a special exception under Section 7 of GPL version 3, you are granted --
+-- additional permissions described in the GCC Runtime Library Exception,   --
+-- version 3.1, as published by the Free Software Foundation.               --
+--                                                                          --
+-- You should have received a copy of the GNU General Public License and    --
+-- a copy of the GCC Runtime Library Exception along with this program;     --
+-- see the files COPYING3 and COPYING.RUNTIME respectively.  If not, see    --
+-- <http://www.gnu.org/licenses/>.                                          --
+--                                                                          --
+------------------------------------------------------------------------------
+
+pragma Ada_2012;
+with System;                 use System;
+
+package body Conts.Lists.Singly_Generics with SPARK_Mode => Off is
+
+   use Storage;
+
+   -------------
+   -- Prepend --
+   -------------
+
+   procedure Prepend
+     (Self    : in out Base_List'Class;
+      Element : Element_Type)
+   is
+      N : Node_Access;
+   begin
+      Allocate
+        (Self,
+         Storage.Elements.To_Stored (Element),
+         New_Node => N);
+
+      if Self.Head = Null_Access then
+         Self.Tail := N;
+      else
+         Set_Next (Self, N, Next => Self.Head);
+      end if;
+
+      Self.Head := N;
+      Self.Size := Self.Size + 1;
+   end Prepend;
+
+   ------------
+   -- Append --
+   ------------
+
+   procedure Append
+     (Self    : in out Base_List'Class;
+      Element : Element_Type)
+   is
+      N : Node_Access;
+   begin
+      Allocate
+        (Self,
+         Storage.Elements.To_Stored (Element),
+         New_Node => N);
+
+      if Self.Tail = Null_Access then
+         Self.Head := N;
+      else
+         Set_Next (Self, Self.Tail, Next => N);
+      end if;
+
+      Self.Tail := N;
+      Self.Size := Self.Size + 1;
+   end Append;
+
+   ------------------
+   -- Insert_After --
+   ------------------
+
+   procedure Insert_After
+     (Self     : in out Base_List'Class;
+      Position : Cursor;
+      Element  : Element_Type)
+   is
+      N : Node_Access;
+   begin
+      if Position.Current = Null_Access then
+         Prepend (Self, Element);
+      elsif Position.Current = Self.Tail then
+         Append (Self, Element);
+      else
+         Allocate
+           (Self,
+            Storage.Elements.To_Stored (Element),
+            New_Node => N);
+         Set_Next (Self, N, Next => Get_Next (Self, Position.Current));
+         Set_Next (Self, Position.Current, Next => N);
+         Self.Size := Self.Size + 1;
+      end if;
+   end Insert_After;
+
+   ------------------
+   -- Delete_First --
+   ------------------
+
+   procedure Delete_First (Self : in out Base_List'Class) is
+   begin
+      Delete_After (Self, No_Element);
+   end Delete_First;
+
+   ------------------
+   -- Delete_After --
+   ------------------
+
+   procedure Delete_After
+     (Self     : in out Base_List'Class;
+      Position : Cursor)
+   is
+      N         : Node_Access;
+      Following : Node_Access;
+      E         : Stored_Type;
+   begin
+      if Position.Current = Null_Access then
+         N := Self.Head;
+      else
+         N := Get_Next (Self, Position.Current);
+      end if;
+
+      if N = Null_Access then
+         return;
+      end if;
+
+      Following := Get_Next (Self, N);
+      if Position.Current = Null_Access then
+         Self.Head := Following;
+      else
+         Set_Next (Self, Position.Current, Next => Following);
+      end if;
+
+      if Following = Null_Access then
+         Self.Tail := Position.Current;
+      end if;
+
+      E := Get_Element (Self, N);
+      Storage.Elements.Release (E);
+      Storage.Release_Node (Self, N);
+      Self.Size := Self.Size - 1;
+   end Delete_After;
+
+   -------------------
+   -- First_Element --
+   -------------------
+
+   function First_Element
+     (Self : Base_List'Class) return Constant_Returned_Type is
+   begin
+      return Storage.Elements.To_Constant_Returned
+        (Get_Element (Self, Self.Head));
+   end First_Element;
+
+   ---------------------
+   -- Replace_Element --
+   ---------------------
+
+   procedure Replace_Element
+     (Self     : in out Base_List'Class;
+      Position : Cursor;
+      Element  : Element_Type)
+   is
+      P : constant Node_Access := Position.Current;
+      E : Stored_Type := Get_Element (Self, P);
+   begin
+      Storage.Elements.Release (E);
+      Set_Element (Self, P, Storage.Elements.To_Stored (Element));
+   end Replace_Element;
+
+   -----------
+   -- Clear --
+   -----------
+
+   procedure Clear (Self : in out Base_List'Class) is
+      C : Node_Access := Self.Head;
+      N : Node_Access;
+      E : Stored_Type;
+   begin
+      while C /= Null_Access loop
+         N := Get_Next (Self, C);
+         E := Get_Element (Self, C);
+         Storage.Elements.Release (E);
+         Storage.Release_Node (Self, C);
+         C := N;
+      end loop;
+      Storage.Release (Self);
+
+      Self.Head := Null_Access;
+      Self.Tail := Null_Access;
+      Self.Size := 0;
+   end Clear;
+
+   ------------
+   -- Assign --
+   ------------
+
+   procedure Assign
+     (Self : in out Base_List'Class; Source : Base_List'Class) is
+   begin
+      if Self'Address = Source'Address then
+         --  Tagged types are always passed by reference, so we know they
+         --  are the same, and do nothing.
+         return;
+      end if;
+
+      Clear (Self);
+      Storage.Assign (Self, Source,
+                      Self.Head, Source.Head,
+                      Self.Tail, Source.Tail);
+      Self.Size := Source.Size;
+   end Assign;
+
+   -------------
+   -- Element --
+   -------------
+
+   function Element
+     (Self : Base_List'Class; Position : Cursor)
+      return Constant_Returned_Type is
+   begin
+      return Storage.Elements.To_Constant_Returned
+        (Get_Element (Self, Position.Current));
+   end Element;
+
+   -----------------
+   -- Has_Element --
+   -----------------
+
+   function Has_Element
+     (Self : Base_List'Class; Position : Cursor) return Boolean
+   is
+      pragma Unreferenced (Self);
+   begin
+      return Position.Current /= Null_Access;
+   end Has_Element;
+
+   ----------
+   -- Next --
+   ----------
+
+   function Next
+     (Self : Base_List'Class; Position : Cursor) return Cursor is
+   begin
+      return (Current => Get_Next (Self, Position.Current));
+   end Next;
+
+   ----------
+   -- Next --
+   ----------
+
+   procedure Next (Self : Base_List'Class; Position : in out Cursor) is
+   begin
+      Position := Next (Self, Position);
+   end Next;
+
+   ------------
+   -- Adjust --
+   ------------
+
+   procedure Adjust (Self : in out Base_List) is
+   begin
+      Storage.Assign (Self, Self,
+                      Self.Head, Self.Head,
+                      Self.Tail, Self.Tail);
+   end Adjust;
+
+   --------------
+   -- Finalize --
+   --------------
+
+   procedure Finalize (Self : in out Base_List) is
+   begin
+      Clear (Self);
+   end Finalize;
+
+end Conts.Lists.Singly_Generics;
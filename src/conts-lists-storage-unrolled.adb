@@ -0,0 +1,481 @@
+------------------------------------------------------------------------------
+--                     Copyright (C) 2016, AdaCore                          --
+--                                                                          --
+-- This library is free software;  you can redistribute it and/or modify it --
+-- under terms of the  GNU General Public License  as published by the Free --
+-- Software  Foundation;  either version 3,  or (at your  option) any later --
+-- version. This library is distributed in the hope that it will be useful, --
+-- but WITHOUT ANY WARRANTY;  without even the implied warranty of MERCHAN- --
+-- TABILITY or FITNESS FOR A PARTICULAR PURPOSE.                            --
+--                                                                          --
+-- As a special exception under Section 7 of GPL version 3, you are granted --
+-- additional permissions described in the GCC Runtime Library Exception,   --
+-- version 3.1, as published by the Free Software Foundation.               --
+--                                                                          --
+-- You should have received a copy of the GNU General Public License and    --
+-- a copy of the GCC Runtime Library Exception along with this program;     --
+-- see the files COPYING3 and COPYING.RUNTIME respectively.  If not, see    --
+-- <http://www.gnu.org/licenses/>.                                          --
+--                                                                          --
+------------------------------------------------------------------------------
+
+pragma Ada_2012;
+with Ada.Unchecked_Deallocation;
+
+package body Conts.Lists.Storage.Unrolled with SPARK_Mode => Off is
+
+   package body Impl is
+      procedure Unchecked_Free is new Ada.Unchecked_Deallocation
+         (Block, Block_Access);
+      procedure Unchecked_Free is new Ada.Unchecked_Deallocation
+         (Run, Run_Access);
+
+      function Next_Used
+         (B : not null Block_Access; S, Last : Slot_Index) return Slot_Count
+         with Inline;
+      function Previous_Used
+         (B : not null Block_Access; S, First : Slot_Index) return Slot_Count
+         with Inline;
+      --  The closest slot after (resp. before) S, up to Last (resp. First),
+      --  that contains an element, or 0 if there is none.
+
+      function Run_Of (N : Node_Access) return not null Run_Access;
+      --  The run that contains N, which is created if N is not linked to
+      --  any other element yet.
+
+      procedure Split_After (N : Node_Access; R : out Run_Access);
+      procedure Split_Before (N : Node_Access; R : out Run_Access);
+      --  Split the run that contains N, so that N becomes its last (resp.
+      --  first) element, and return that run.
+
+      function Can_Extend
+         (R : not null Run_Access; N : Node_Access) return Boolean;
+      --  Whether N, which is not linked to any other element yet, can be
+      --  added at the end of R, which must not be followed by other runs.
+      --  This is the case when N is stored in the same block, after the
+      --  last slot of R, and only holes separate them.
+
+      procedure Release_Elements (Self : in out Container'Class);
+      --  Release all elements still stored in Self
+
+      ---------------
+      -- Next_Used --
+      ---------------
+
+      function Next_Used
+         (B : not null Block_Access; S, Last : Slot_Index) return Slot_Count is
+      begin
+         for J in S + 1 .. Last loop
+            if B.Used (J) then
+               return J;
+            end if;
+         end loop;
+         return 0;
+      end Next_Used;
+
+      -------------------
+      -- Previous_Used --
+      -------------------
+
+      function Previous_Used
+         (B : not null Block_Access; S, First : Slot_Index) return Slot_Count
+      is
+      begin
+         for J in reverse First .. S - 1 loop
+            if B.Used (J) then
+               return J;
+            end if;
+         end loop;
+         return 0;
+      end Previous_Used;
+
+      ------------
+      -- Run_Of --
+      ------------
+
+      function Run_Of (N : Node_Access) return not null Run_Access is
+         R : Run_Access := N.Block.Runs (N.Slot);
+      begin
+         if R = null then
+            R := new Run'(Block    => N.Block,
+                          First    => N.Slot,
+                          Last     => N.Slot,
+                          Previous => null,
+                          Next     => null);
+            N.Block.Runs (N.Slot) := R;
+         end if;
+         return R;
+      end Run_Of;
+
+      -----------------
+      -- Split_After --
+      -----------------
+
+      procedure Split_After (N : Node_Access; R : out Run_Access) is
+         B    : constant Block_Access := N.Block;
+         Tail : Run_Access;
+      begin
+         R := Run_Of (N);
+         if N.Slot /= R.Last then
+            Tail := new Run'(Block    => B,
+                             First    => Next_Used (B, N.Slot, R.Last),
+                             Last     => R.Last,
+                             Previous => R,
+                             Next     => R.Next);
+            if R.Next /= null and then R.Next.Previous = R then
+               R.Next.Previous := Tail;
+            end if;
+
+            R.Next := Tail;
+            R.Last := N.Slot;
+
+            for J in Tail.First .. Tail.Last loop
+               if B.Used (J) then
+                  B.Runs (J) := Tail;
+               end if;
+            end loop;
+         end if;
+      end Split_After;
+
+      ------------------
+      -- Split_Before --
+      ------------------
+
+      procedure Split_Before (N : Node_Access; R : out Run_Access) is
+      begin
+         R := Run_Of (N);
+         if N.Slot /= R.First then
+            Split_After
+               ((Block => N.Block,
+                 Slot  => Previous_Used (N.Block, N.Slot, R.First)),
+                R);
+            R := R.Next;
+         end if;
+      end Split_Before;
+
+      ----------------
+      -- Can_Extend --
+      ----------------
+
+      function Can_Extend
+         (R : not null Run_Access; N : Node_Access) return Boolean is
+      begin
+         return R.Next = null
+           and then N.Block = R.Block
+           and then N.Block.Runs (N.Slot) = null
+           and then N.Slot > R.Last
+           and then (for all J in R.Last + 1 .. N.Slot - 1 =>
+                       not N.Block.Used (J));
+      end Can_Extend;
+
+      --------------
+      -- Allocate --
+      --------------
+
+      procedure Allocate
+         (Self    : in out Container'Class;
+          Element : Stored_Type;
+          N       : out Node_Access)
+      is
+         B : Block_Access := Self.Blocks;
+      begin
+         if B = null or else B.Fill = Block_Capacity then
+            B := new Block;
+            B.Next := Self.Blocks;
+            if Self.Blocks /= null then
+               Self.Blocks.Previous := B;
+            end if;
+            Self.Blocks := B;
+         end if;
+
+         B.Fill := B.Fill + 1;
+         B.Elements (B.Fill) := Element;
+         B.Used (B.Fill) := True;
+         B.Count := B.Count + 1;
+         N := (Block => B, Slot => B.Fill);
+      end Allocate;
+
+      ------------------
+      -- Release_Node --
+      ------------------
+
+      procedure Release_Node
+         (Self : in out Container'Class; N : in out Node_Access)
+      is
+         B : Block_Access := N.Block;
+         S : constant Slot_Index := N.Slot;
+         R : Run_Access := B.Runs (S);
+      begin
+         if R /= null then
+            if R.First = R.Last then
+               if R.Previous /= null and then R.Previous.Next = R then
+                  R.Previous.Next := R.Next;
+               end if;
+               if R.Next /= null and then R.Next.Previous = R then
+                  R.Next.Previous := R.Previous;
+               end if;
+               Unchecked_Free (R);
+            elsif S = R.First then
+               R.First := Next_Used (B, S, R.Last);
+            elsif S = R.Last then
+               R.Last := Previous_Used (B, S, R.First);
+            end if;
+            B.Runs (S) := null;
+         end if;
+
+         B.Used (S) := False;
+         B.Count := B.Count - 1;
+
+         if B.Count = 0 then
+            if B.Previous = null then
+               Self.Blocks := B.Next;
+            else
+               B.Previous.Next := B.Next;
+            end if;
+            if B.Next /= null then
+               B.Next.Previous := B.Previous;
+            end if;
+            Unchecked_Free (B);
+         else
+            --  Trailing holes can be reused by the next allocations, since
+            --  no run covers them anymore.
+
+            while not B.Used (B.Fill) loop
+               B.Fill := B.Fill - 1;
+            end loop;
+         end if;
+
+         N := Null_Node_Access;
+      end Release_Node;
+
+      -------------
+      -- Release --
+      -------------
+
+      procedure Release (Self : in out Container'Class) is
+         B : Block_Access;
+         R : Run_Access;
+      begin
+         while Self.Blocks /= null loop
+            B := Self.Blocks;
+            Self.Blocks := B.Next;
+
+            for S in 1 .. B.Fill loop
+               R := B.Runs (S);
+               if R /= null and then R.Last = S then
+                  Unchecked_Free (R);
+               end if;
+            end loop;
+
+            Unchecked_Free (B);
+         end loop;
+      end Release;
+
+      ----------------------
+      -- Release_Elements --
+      ----------------------
+
+      procedure Release_Elements (Self : in out Container'Class) is
+         B : Block_Access := Self.Blocks;
+      begin
+         while B /= null loop
+            for S in 1 .. B.Fill loop
+               if B.Used (S) then
+                  Elements.Release (B.Elements (S));
+               end if;
+            end loop;
+            B := B.Next;
+         end loop;
+      end Release_Elements;
+
+      -----------------
+      -- Get_Element --
+      -----------------
+
+      function Get_Element
+         (Self : Container'Class; N : Node_Access) return Stored_Type
+      is
+         pragma Unreferenced (Self);
+      begin
+         return N.Block.Elements (N.Slot);
+      end Get_Element;
+
+      --------------
+      -- Get_Next --
+      --------------
+
+      function Get_Next
+         (Self : Container'Class; N : Node_Access) return Node_Access
+      is
+         pragma Unreferenced (Self);
+         R : constant Run_Access := N.Block.Runs (N.Slot);
+      begin
+         if R = null then
+            return Null_Node_Access;
+         elsif N.Slot /= R.Last then
+            return (Block => N.Block,
+                    Slot  => Next_Used (N.Block, N.Slot, R.Last));
+         elsif R.Next = null then
+            return Null_Node_Access;
+         else
+            return (Block => R.Next.Block, Slot => R.Next.First);
+         end if;
+      end Get_Next;
+
+      ------------------
+      -- Get_Previous --
+      ------------------
+
+      function Get_Previous
+         (Self : Container'Class; N : Node_Access) return Node_Access
+      is
+         pragma Unreferenced (Self);
+         R : constant Run_Access := N.Block.Runs (N.Slot);
+      begin
+         if R = null then
+            return Null_Node_Access;
+         elsif N.Slot /= R.First then
+            return (Block => N.Block,
+                    Slot  => Previous_Used (N.Block, N.Slot, R.First));
+         elsif R.Previous = null then
+            return Null_Node_Access;
+         else
+            return (Block => R.Previous.Block, Slot => R.Previous.Last);
+         end if;
+      end Get_Previous;
+
+      --------------
+      -- Set_Next --
+      --------------
+
+      procedure Set_Next
+         (Self    : in out Container'Class;
+          N, Next : Node_Access)
+      is
+         R, After : Run_Access;
+      begin
+         if Get_Next (Self, N) = Next then
+            return;
+         end if;
+
+         Split_After (N, R);
+
+         if Next = Null_Node_Access then
+            R.Next := null;
+         elsif Can_Extend (R, Next) then
+            --  The common case when appending: no new run is needed
+            R.Last := Next.Slot;
+            Next.Block.Runs (Next.Slot) := R;
+         else
+            --  Next might be in the same run as N, so that splitting it
+            --  changes the run of N.
+            Split_Before (Next, After);
+            N.Block.Runs (N.Slot).Next := After;
+         end if;
+      end Set_Next;
+
+      ------------------
+      -- Set_Previous --
+      ------------------
+
+      procedure Set_Previous
+         (Self    : in out Container'Class;
+          N, Prev : Node_Access)
+      is
+         R, Before : Run_Access;
+      begin
+         if Get_Previous (Self, N) = Prev then
+            return;
+         end if;
+
+         if Prev /= Null_Node_Access
+           and then N.Block.Runs (N.Slot) = null
+         then
+            --  When inserting several elements, the lists set the previous
+            --  link of the new element first. Extending the run also sets
+            --  the next link of Prev, which the lists do right after.
+            Before := Run_Of (Prev);
+            if Before.Last = Prev.Slot and then Can_Extend (Before, N) then
+               Before.Last := N.Slot;
+               N.Block.Runs (N.Slot) := Before;
+               return;
+            end if;
+         end if;
+
+         Split_Before (N, R);
+
+         if Prev = Null_Node_Access then
+            R.Previous := null;
+         else
+            Split_After (Prev, Before);
+            N.Block.Runs (N.Slot).Previous := Before;
+         end if;
+      end Set_Previous;
+
+      -----------------
+      -- Set_Element --
+      -----------------
+
+      procedure Set_Element
+        (Self : in out Container'Class;
+         N    : Node_Access;
+         E    : Stored_Type)
+      is
+         pragma Unreferenced (Self);
+      begin
+         N.Block.Elements (N.Slot) := E;
+      end Set_Element;
+
+      ------------
+      -- Assign --
+      ------------
+
+      procedure Assign
+         (Nodes    : in out Container'Class;
+          Source   : Container'Class;
+          New_Head : out Node_Access;
+          Old_Head : Node_Access;
+          New_Tail : out Node_Access;
+          Old_Tail : Node_Access)
+      is
+         pragma Unreferenced (Old_Tail);
+         Old        : Node_Access := Old_Head;
+         Head, Tail : Node_Access := Null_Node_Access;
+         N          : Node_Access;
+      begin
+         if Nodes'Address /= Source'Address then
+            Release_Elements (Nodes);
+            Release (Nodes);
+         end if;
+
+         --  When called from Adjust, Nodes is a copy of Source, and its
+         --  blocks still belong to Source.
+         Nodes.Blocks := null;
+
+         while Old /= Null_Node_Access loop
+            if Elements.Copyable then
+               Allocate (Nodes, Old.Block.Elements (Old.Slot), N);
+            else
+               Allocate
+                  (Nodes, Elements.Copy (Old.Block.Elements (Old.Slot)), N);
+            end if;
+
+            if Tail = Null_Node_Access then
+               Head := N;
+            else
+               Set_Next (Nodes, Tail, N);
+               Set_Previous (Nodes, N, Tail);
+            end if;
+
+            Tail := N;
+            Old := Get_Next (Source, Old);
+         end loop;
+
+         --  New_Head and Old_Head might be the same object
+         New_Head := Head;
+         New_Tail := Tail;
+      end Assign;
+
+   end Impl;
+
+end Conts.Lists.Storage.Unrolled;
@@ -0,0 +1,444 @@
+------------------------------------------------------------------------------
+--                     Copyright (C) 2016, AdaCore                          --
+--                                                                          --
+-- This library is free software;  you can redistribute it and/or modify it --
+-- under terms of the  GNU General Public License  as published by the Free --
+-- Software  Foundation;  either version 3,  or (at your  option) any later --
+-- version. This library is distributed in the hope that it will be useful, --
+-- but WITHOUT ANY WARRANTY;  without even the implied warranty of MERCHAN- --
+-- TABILITY or FITNESS FOR A PARTICULAR PURPOSE.                            --
+--                                                                          --
+-- As a special exception under Section 7 of GPL version 3, you are granted --
+-- additional permissions described in the GCC Runtime Library Exception,   --
+-- version 3.1, as published by the Free Software Foundation.               --
+--                                                                          --
+-- You should have received a copy of the GNU General Public License and    --
+-- a copy of the GCC Runtime Library Exception along with this program;     --
+-- see the files COPYING3 and COPYING.RUNTIME respectively.  If not, see    --
+-- <http://www.gnu.org/licenses/>.                                          --
+--                                                                          --
+------------------------------------------------------------------------------
+
+pragma Ada_2012;
+with Ada.Unchecked_Deallocation;
+with System;                 use System;
+
+package body Conts.Maps.Compact is
+
+   Min_Size : constant Hash_Type := 8;
+   --  Minimal size for the hash table
+
+   procedure Free is new Ada.Unchecked_Deallocation
+     (Entry_Array, Entry_Array_Access);
+   procedure Free is new Ada.Unchecked_Deallocation
+     (Index_Array, Index_Array_Access);
+
+   function Find_Slot
+     (Self : Base_Map'Class;
+      Key  : Keys.Element_Type;
+      H    : Hash_Type) return Hash_Type;
+   --  Probe the hash table, and return the slot that refers to Key, or the
+   --  slot where it should be inserted. The table must have been allocated.
+
+   function Lookup
+     (Self : Base_Map'Class; Key : Keys.Element_Type) return Count_Type;
+   --  The index of the entry for Key, or Empty_Index
+
+   procedure Rebuild
+     (Self           : in out Base_Map'Class;
+      Entry_Capacity : Count_Type;
+      Source         : Entry_Array_Access;
+      Source_Last    : Count_Type;
+      Copy           : Boolean);
+   --  Allocate new tables for Self, for at least Entry_Capacity entries,
+   --  and store the elements in Source (1 .. Source_Last), skipping holes.
+   --  If Copy is True, the keys and elements are copied, otherwise they are
+   --  moved. The previous tables of Self are not freed.
+
+   ---------------
+   -- Find_Slot --
+   ---------------
+
+   function Find_Slot
+     (Self : Base_Map'Class;
+      Key  : Keys.Element_Type;
+      H    : Hash_Type) return Hash_Type
+   is
+      Candidate   : Hash_Type := H and Self.Indices'Last;
+      First_Dummy : Hash_Type := Hash_Type'Last;
+      E           : Count_Type;
+      Prob        : Probing;
+   begin
+      Prob.Initialize_Probing (Hash => H, Size => Self.Indices'Last);
+
+      loop
+         E := Self.Indices (Candidate);
+         if E = Empty_Index then
+            exit;
+         elsif E = Dummy_Index then
+            if First_Dummy = Hash_Type'Last then
+               First_Dummy := Candidate;
+            end if;
+         elsif Self.Entries (E).Hash = H
+           and then "=" (Key, Self.Entries (E).Key)
+         then
+            return Candidate;
+         end if;
+
+         Candidate := Prob.Next_Probing (Candidate) and Self.Indices'Last;
+      end loop;
+
+      --  The key is not in the table: reuse the first dummy slot we saw,
+      --  if any, rather than the empty one.
+
+      if First_Dummy /= Hash_Type'Last then
+         return First_Dummy;
+      else
+         return Candidate;
+      end if;
+   end Find_Slot;
+
+   ------------
+   -- Lookup --
+   ------------
+
+   function Lookup
+     (Self : Base_Map'Class; Key : Keys.Element_Type) return Count_Type
+   is
+      E : Count_Type;
+   begin
+      if Self.Indices = null then
+         return Empty_Index;
+      end if;
+
+      E := Self.Indices (Find_Slot (Self, Key, Hash (Key)));
+      return (if E = Dummy_Index then Empty_Index else E);
+   end Lookup;
+
+   -------------
+   -- Rebuild --
+   -------------
+
+   procedure Rebuild
+     (Self           : in out Base_Map'Class;
+      Entry_Capacity : Count_Type;
+      Source         : Entry_Array_Access;
+      Source_Last    : Count_Type;
+      Copy           : Boolean)
+   is
+      Size      : Hash_Type := Min_Size;
+      Candidate : Hash_Type;
+      N         : Count_Type := 0;
+      Prob      : Probing;
+   begin
+      --  Keep the table at most 2/3 full, as for Conts.Maps.Generics
+
+      while (Size * 2) / 3 < Hash_Type (Entry_Capacity) loop
+         Size := Size * 2;
+      end loop;
+
+      Self.Indices := new Index_Array'(0 .. Size - 1 => Empty_Index);
+      Self.Entries := new Entry_Array (1 .. Count_Type ((Size * 2) / 3));
+
+      if Source /= null then
+         for E in 1 .. Source_Last loop
+            if Source (E).Live then
+               N := N + 1;
+
+               if Copy then
+                  Self.Entries (N) :=
+                    (Hash  => Source (E).Hash,
+                     Key   =>
+                       (if Keys.Copyable
+                        then Source (E).Key
+                        else Keys.Copy (Source (E).Key)),
+                     Value =>
+                       (if Elements.Copyable
+                        then Source (E).Value
+                        else Elements.Copy (Source (E).Value)),
+                     Live  => True);
+               else
+                  Self.Entries (N) := Source (E);
+               end if;
+
+               --  There are no dummy slots in the new table, and the keys
+               --  are known to be different, so we only look for an empty
+               --  slot.
+
+               Candidate := Self.Entries (N).Hash and Self.Indices'Last;
+               Prob.Initialize_Probing
+                 (Hash => Self.Entries (N).Hash, Size => Self.Indices'Last);
+               while Self.Indices (Candidate) /= Empty_Index loop
+                  Candidate :=
+                    Prob.Next_Probing (Candidate) and Self.Indices'Last;
+               end loop;
+               Self.Indices (Candidate) := N;
+            end if;
+         end loop;
+      end if;
+
+      Self.Last := N;
+      Self.Used := N;
+   end Rebuild;
+
+   ----------------------
+   -- Reserve_Capacity --
+   ----------------------
+
+   procedure Reserve_Capacity
+     (Self     : in out Base_Map'Class;
+      Capacity : Count_Type)
+   is
+      Old_Entries : Entry_Array_Access := Self.Entries;
+      Old_Indices : Index_Array_Access := Self.Indices;
+   begin
+      --  Capacity - Self.Used new elements must fit after Self.Last
+
+      if Capacity + Self.Last > Compact.Capacity (Self) + Self.Used then
+         Rebuild
+           (Self, Count_Type'Max (Capacity, Self.Used),
+            Old_Entries, Self.Last, Copy => False);
+         Free (Old_Entries);
+         Free (Old_Indices);
+      end if;
+   end Reserve_Capacity;
+
+   ---------
+   -- Set --
+   ---------
+
+   procedure Set
+     (Self     : in out Base_Map'Class;
+      Key      : Keys.Element_Type;
+      Value    : Elements.Element_Type)
+   is
+      H    : constant Hash_Type := Hash (Key);
+      Slot : Hash_Type;
+      E    : Count_Type;
+   begin
+      if Self.Indices /= null then
+         Slot := Find_Slot (Self, Key, H);
+         E := Self.Indices (Slot);
+         if E /= Empty_Index and then E /= Dummy_Index then
+            Elements.Release (Self.Entries (E).Value);
+            Self.Entries (E).Value := Elements.To_Stored (Value);
+            return;
+         end if;
+      end if;
+
+      --  A new entry is needed. When the array of entries is full, we
+      --  allocate new tables with room for twice as many elements (which
+      --  also removes holes).
+
+      if Self.Entries = null or else Self.Last = Self.Entries'Last then
+         declare
+            Old_Entries : Entry_Array_Access := Self.Entries;
+            Old_Indices : Index_Array_Access := Self.Indices;
+         begin
+            Rebuild
+              (Self, (Self.Used + 1) * 2, Old_Entries, Self.Last,
+               Copy => False);
+            Free (Old_Entries);
+            Free (Old_Indices);
+         end;
+         Slot := Find_Slot (Self, Key, H);
+      end if;
+
+      Self.Last := Self.Last + 1;
+      Self.Entries (Self.Last) :=
+        (Hash  => H,
+         Key   => Keys.To_Stored (Key),
+         Value => Elements.To_Stored (Value),
+         Live  => True);
+      Self.Indices (Slot) := Self.Last;
+      Self.Used := Self.Used + 1;
+   end Set;
+
+   ---------
+   -- Get --
+   ---------
+
+   function Get
+     (Self     : Base_Map'Class;
+      Key      : Keys.Element_Type)
+      return Elements.Constant_Returned_Type
+   is
+      E : constant Count_Type := Lookup (Self, Key);
+   begin
+      if E = Empty_Index then
+         raise Constraint_Error with "Key not in map";
+      end if;
+      return Elements.To_Constant_Returned (Self.Entries (E).Value);
+   end Get;
+
+   --------------
+   -- Contains --
+   --------------
+
+   function Contains
+     (Self     : Base_Map'Class;
+      Key      : Keys.Element_Type) return Boolean is
+   begin
+      return Lookup (Self, Key) /= Empty_Index;
+   end Contains;
+
+   ------------
+   -- Delete --
+   ------------
+
+   procedure Delete
+     (Self     : in out Base_Map'Class;
+      Key      : Keys.Element_Type)
+   is
+      Slot : Hash_Type;
+      E    : Count_Type;
+   begin
+      if Self.Indices = null then
+         return;
+      end if;
+
+      Slot := Find_Slot (Self, Key, Hash (Key));
+      E := Self.Indices (Slot);
+
+      if E /= Empty_Index and then E /= Dummy_Index then
+         Keys.Release (Self.Entries (E).Key);
+         Elements.Release (Self.Entries (E).Value);
+         Self.Entries (E).Live := False;
+         Self.Indices (Slot) := Dummy_Index;
+         Self.Used := Self.Used - 1;
+
+         --  The entry is not reused until the map is rebuilt, even if it
+         --  is the last one: this ensures that the number of used and dummy
+         --  slots in the hash table never exceeds the number of entries, so
+         --  that there is always an empty slot to end the probing.
+      end if;
+   end Delete;
+
+   -----------
+   -- Clear --
+   -----------
+
+   procedure Clear (Self : in out Base_Map'Class) is
+   begin
+      if Self.Entries /= null then
+         for E of Self.Entries (1 .. Self.Last) loop
+            if E.Live then
+               Keys.Release (E.Key);
+               Elements.Release (E.Value);
+            end if;
+         end loop;
+         Free (Self.Entries);
+         Free (Self.Indices);
+      end if;
+
+      Self.Last := 0;
+      Self.Used := 0;
+   end Clear;
+
+   ------------
+   -- Adjust --
+   ------------
+
+   procedure Adjust (Self : in out Base_Map) is
+      Source : constant Entry_Array_Access := Self.Entries;
+   begin
+      --  Only the elements are copied, and the hash table is rebuilt, so
+      --  the copy has no holes.
+
+      Self.Entries := null;
+      Self.Indices := null;
+      if Source /= null then
+         Rebuild (Self, Self.Used, Source, Self.Last, Copy => True);
+      end if;
+   end Adjust;
+
+   --------------
+   -- Finalize --
+   --------------
+
+   procedure Finalize (Self : in out Base_Map) is
+   begin
+      Clear (Self);
+   end Finalize;
+
+   ------------
+   -- Assign --
+   ------------
+
+   procedure Assign
+     (Self : in out Base_Map'Class; Source : Base_Map'Class) is
+   begin
+      if Self'Address = Source'Address then
+         return;
+      end if;
+
+      Clear (Self);
+      if Source.Entries /= null then
+         Rebuild (Self, Source.Used, Source.Entries, Source.Last,
+                  Copy => True);
+      end if;
+   end Assign;
+
+   -----------
+   -- First --
+   -----------
+
+   function First (Self : Base_Map'Class) return Cursor is
+   begin
+      return Next (Self, No_Element);
+   end First;
+
+   -----------------
+   -- Has_Element --
+   -----------------
+
+   function Has_Element
+     (Self : Base_Map'Class; Position : Cursor) return Boolean
+   is
+      pragma Unreferenced (Self);
+   begin
+      return Position.Index /= 0;
+   end Has_Element;
+
+   ----------
+   -- Next --
+   ----------
+
+   function Next
+     (Self : Base_Map'Class; Position : Cursor) return Cursor
+   is
+      E : Count_Type := Position.Index + 1;
+   begin
+      while E <= Self.Last loop
+         if Self.Entries (E).Live then
+            return (Index => E);
+         end if;
+         E := E + 1;
+      end loop;
+      return No_Element;
+   end Next;
+
+   ---------
+   -- Key --
+   ---------
+
+   function Key
+     (Self : Base_Map'Class; Position : Cursor)
+     return Constant_Returned_Key_Type is
+   begin
+      return Keys.To_Constant_Returned (Self.Entries (Position.Index).Key);
+   end Key;
+
+   -------------
+   -- Element --
+   -------------
+
+   function Element
+     (Self : Base_Map'Class; Position : Cursor) return Constant_Returned_Type
+   is
+   begin
+      return Elements.To_Constant_Returned
+        (Self.Entries (Position.Index).Value);
+   end Element;
+
+end Conts.Maps.Compact;
@@ -0,0 +1,191 @@
+------------------------------------------------------------------------------
+--                     Copyright (C) 2016, AdaCore                          --
+--                                                                          --
+-- This library is free software;  you can redistribute it and/or modify it --
+-- under terms of the  GNU General Public License  as published by the Free --
+-- Software  Foundation;  either version 3,  or (at your  option) any later --
+-- version. This library is distributed in the hope that it will be useful, --
+-- but WITHOUT ANY WARRANTY;  without even the implied warranty of MERCHAN- --
+-- TABILITY or FITNESS FOR A PARTICULAR PURPOSE.                            --
+--                                                                          --
+-- As a special exception under Section 7 of GPL version 3, you are granted --
+-- additional permissions described in the GCC Runtime Library Exception,   --
+-- version 3.1, as published by the Free Software Foundation.               --
+--                                                                          --
+-- You should have received a copy of the GNU General Public License and    --
+-- a copy of the GCC Runtime Library Exception along with this program;     --
+-- see the files COPYING3 and COPYING.RUNTIME respectively.  If not, see    --
+-- <http://www.gnu.org/licenses/>.                                          --
+--                                                                          --
+------------------------------------------------------------------------------
+
+pragma Ada_2012;
+
+package body Conts.Maps.Concurrent with SPARK_Mode => Off is
+
+   function Shard_Index (Key : Keys.Element_Type) return Hash_Type
+     is (if Shard_Bits = 0 then 0 else Hash (Key) / (2 ** (32 - Shard_Bits)))
+     with Inline;
+   --  The shard that contains Key. The low bits of the hash are used by the
+   --  shard itself to find the slot.
+
+   -----------
+   -- Shard --
+   -----------
+
+   protected body Shard is
+
+      ---------
+      -- Set --
+      ---------
+
+      procedure Set
+        (Key : Keys.Element_Type; Value : Elements.Element_Type) is
+      begin
+         Impl.Set (Table, Key, Value);
+      end Set;
+
+      ---------
+      -- Get --
+      ---------
+
+      function Get (Key : Keys.Element_Type) return Elements.Element_Type is
+      begin
+         return Elements.To_Element (Impl.Get (Table, Key));
+      end Get;
+
+      --------------
+      -- Contains --
+      --------------
+
+      function Contains (Key : Keys.Element_Type) return Boolean is
+      begin
+         return Impl.Impl.Contains (Table, Key);
+      end Contains;
+
+      ------------
+      -- Delete --
+      ------------
+
+      procedure Delete (Key : Keys.Element_Type) is
+      begin
+         Impl.Delete (Table, Key);
+      end Delete;
+
+      ------------
+      -- Length --
+      ------------
+
+      function Length return Count_Type is
+      begin
+         return Impl.Length (Table);
+      end Length;
+
+      -----------
+      -- Clear --
+      -----------
+
+      procedure Clear is
+      begin
+         Impl.Clear (Table);
+      end Clear;
+
+      -------------
+      -- Iterate --
+      -------------
+
+      procedure Iterate
+        (Process : not null access procedure
+           (Key : Keys.Element_Type; Element : Elements.Element_Type))
+      is
+         C : Impl.Cursor := Impl.First (Table);
+      begin
+         while Impl.Has_Element (Table, C) loop
+            Process (Impl.As_Key (Table, C), Impl.As_Element (Table, C));
+            C := Impl.Next (Table, C);
+         end loop;
+      end Iterate;
+
+   end Shard;
+
+   ---------
+   -- Set --
+   ---------
+
+   procedure Set
+     (Self     : in out Map;
+      Key      : Keys.Element_Type;
+      Value    : Elements.Element_Type) is
+   begin
+      Self.Shards (Shard_Index (Key)).Set (Key, Value);
+   end Set;
+
+   ---------
+   -- Get --
+   ---------
+
+   function Get
+     (Self     : Map;
+      Key      : Keys.Element_Type) return Elements.Element_Type is
+   begin
+      return Self.Shards (Shard_Index (Key)).Get (Key);
+   end Get;
+
+   --------------
+   -- Contains --
+   --------------
+
+   function Contains
+     (Self     : Map;
+      Key      : Keys.Element_Type) return Boolean is
+   begin
+      return Self.Shards (Shard_Index (Key)).Contains (Key);
+   end Contains;
+
+   ------------
+   -- Delete --
+   ------------
+
+   procedure Delete
+     (Self     : in out Map;
+      Key      : Keys.Element_Type) is
+   begin
+      Self.Shards (Shard_Index (Key)).Delete (Key);
+   end Delete;
+
+   ------------
+   -- Length --
+   ------------
+
+   function Length (Self : Map) return Count_Type is
+      Result : Count_Type := 0;
+   begin
+      for S of Self.Shards loop
+         Result := Result + S.Length;
+      end loop;
+      return Result;
+   end Length;
+
+   -----------
+   -- Clear --
+   -----------
+
+   procedure Clear (Self : in out Map) is
+   begin
+      for S of Self.Shards loop
+         S.Clear;
+      end loop;
+   end Clear;
+
+   -------------
+   -- Iterate --
+   -------------
+
+   procedure Iterate (Self : in out Map) is
+   begin
+      for S of Self.Shards loop
+         S.Iterate (Process'Access);
+      end loop;
+   end Iterate;
+
+end Conts.Maps.Concurrent;
@@ -22,6 +22,7 @@
 pragma Ada_2012;
 with Ada.Unchecked_Deallocation;
 with Ada.Containers; use Ada.Containers;
+with Interfaces;     use Interfaces;
 
 package body Conts.Maps.Impl with SPARK_Mode => Off is
 
@@ -32,7 +33,28 @@ package body Conts.Maps.Impl with SPARK_Mode => Off is
    --  Minimum size for maps. Must be a power of 2.
 
    procedure Unchecked_Free is new Ada.Unchecked_Deallocation
-     (Slot_Table, Slot_Table_Access);
+     (Table_Record, Table_Access);
+   procedure Unchecked_Free is new Ada.Unchecked_Deallocation
+     (Control_Table, Control_Table_Access);
+
+   Bounded : constant Boolean := Fixed_Capacity /= 0;
+   --  Whether the table is stored in the map itself (Self.Fixed)
+
+   function Table (Self : Base_Map'Class) return Table_Access
+     is (if not Bounded then Self.Allocated
+         elsif Self.Fixed_Used then Self.Fixed'Unrestricted_Access
+         else null)
+     with Inline;
+   --  The slots table, or null if none was created yet. For bounded maps,
+   --  the pointer to Self.Fixed is computed on each access, so that it is
+   --  always correct even when the map was copied without Adjust.
+
+   No_Slot : constant Hash_Type := Hash_Type'Last;
+   --  Returned by Lookup when a key is not in the table. This is never a
+   --  valid index, since the size of a table always fits in a Count_Type.
+
+   function Is_Robin_Hood return Boolean;
+   --  Whether the Probing formal parameter is a Robin_Hood_Probing
 
    function Find_Slot
      (Self  : Base_Map'Class;
@@ -40,6 +62,301 @@ package body Conts.Maps.Impl with SPARK_Mode => Off is
       H     : Hash_Type) return Hash_Type;
    --  Probe the table and look for the place where the element with that
    --  key would be inserted (or already exists).
+   --  This is only used when we are not using Robin Hood probing.
+
+   generic
+      type Lookup_Key (<>) is limited private;
+      with function "="
+        (Left  : Lookup_Key;
+         Right : Keys.Stored_Type) return Boolean is <>;
+   function Generic_Lookup
+     (Self  : Base_Map'Class;
+      Key   : Lookup_Key;
+      H     : Hash_Type) return Hash_Type;
+   --  Return the index of the slot that contains Key, or No_Slot if Key is
+   --  not in the table (which must have been allocated).
+   --  This is generic so that the map can also be searched with keys of a
+   --  different type (see Alternate_Keys).
+
+   function Probe_Distance
+     (Table : Slot_Table; Index : Hash_Type) return Hash_Type
+     is ((Index - Table (Index).Hash) and Table'Last)
+     with Inline;
+   --  Number of slots between the full slot at Index and the preferred slot
+   --  for its key (only relevant for Robin Hood probing).
+
+   procedure Robin_Hood_Insert (Table : in out Slot_Table; S : Slot);
+   --  Store S (a full slot) in Table, taking the place of keys that are
+   --  closer to their preferred slot, which are then moved further away.
+   --  The key must not already be in the table, which must have at least
+   --  one empty slot.
+
+   procedure Robin_Hood_Delete (Table : in out Slot_Table; Index : Hash_Type);
+   --  Mark the slot at Index as empty, and shift the following keys back
+   --  towards their preferred slot, so that no dummy slot is needed.
+
+   procedure Insert
+     (Self     : in out Base_Map'Class;
+      Key      : Keys.Element_Type;
+      Value    : Elements.Element_Type);
+   --  Same as Set, but never resizes the table. The table must have been
+   --  allocated, and must have room for one more element.
+
+   procedure Delete_Slot (Self : in out Base_Map'Class; Index : Hash_Type);
+   --  Release the key and element stored at Index, and free the slot
+
+   procedure Rehash_In_Place (Self : in out Base_Map'Class);
+   --  Remove all dummy slots from the table, without changing its size.
+   --  This is used when a lot of elements have been deleted, so that the
+   --  table does not grow although the number of elements doesn't.
+
+   procedure Move_Slot (Self : in out Base_Map'Class; S : Slot);
+   --  Store S (a full slot) in Self.Table, and update Self.Fill. The key
+   --  must not already be in the table. This is only used when resizing
+   --  incrementally.
+
+   procedure Migrate (Self : in out Base_Map'Class; Count : Hash_Type);
+   --  Move the elements of the next Count slots of Self.Old to Self.Table,
+   --  and free Self.Old when all its slots have been processed.
+
+   procedure Start_Migration
+     (Self     : in out Base_Map'Class;
+      New_Size : Count_Type);
+   --  Allocate a new table with at least New_Size slots, and start moving
+   --  the elements of the current table to it.
+   --  This does nothing while a previous migration is still running.
+
+   -------------------
+   -- Is_Robin_Hood --
+   -------------------
+
+   function Is_Robin_Hood return Boolean is
+      Prob : Probing;
+   begin
+      return Probing_Strategy'Class (Prob) in Robin_Hood_Probing'Class;
+   end Is_Robin_Hood;
+
+   Robin_Hood : constant Boolean := Is_Robin_Hood;
+   --  Whether to use Robin Hood hashing rather than the standard open
+   --  addressing with dummy slots. This is known at elaboration time, so
+   --  the compiler can in general remove the code for the other mode.
+
+   -------------------
+   -- Group probing --
+   -------------------
+   --  With Group_Probing, each slot has a control byte, stored in
+   --  Self.Control. This is either Ctrl_Empty, Ctrl_Deleted, or the Tag
+   --  of the hash of the key stored in the slot. The Kind of the slots is
+   --  still maintained, so that iteration is the same in all modes.
+   --  Groups are aligned on multiple of Group_Width in the table, so that
+   --  their control bytes are read as a single word.
+
+   Group_Width  : constant := 8;
+   Lsbs         : constant Control_Word := 16#0101_0101_0101_0101#;
+   Msbs         : constant Control_Word := 16#8080_8080_8080_8080#;
+   Ctrl_Empty   : constant Control_Word := 16#80#;
+   Ctrl_Deleted : constant Control_Word := 16#FE#;
+
+   function Is_Grouped return Boolean;
+   --  Whether the Probing formal parameter is a Group_Probing
+
+   function Spread (H : Hash_Type) return Hash_Type
+     is (H * 16#9E37_79B1#)
+     with Inline;
+   --  Mix the bits of the hash (Fibonacci hashing). The high bits of the
+   --  result depend on all the bits of H, even for identity-like hashes of
+   --  small integer keys, whose own high bits are always 0. Since the
+   --  multiplier is odd, distinct hashes remain distinct.
+
+   function First_Group (H : Hash_Type; Last : Hash_Type) return Hash_Type
+     is ((Spread (H) / Group_Width) and Last)
+     with Inline;
+   --  The first group to look at for a hash, given the index of the last
+   --  group in the control table.
+
+   function Tag (H : Hash_Type) return Control_Word
+     is (Control_Word (Spread (H) / 2 ** (Hash_Type'Size - 7)))
+     with Inline;
+   --  The control byte for a full slot: the 7 high bits of the spread hash,
+   --  since the low bits are used to find the group itself.
+
+   function Match_Tag (Word, T : Control_Word) return Control_Word
+     with Inline;
+   --  Return a mask where the high bit of each byte of Word is set if that
+   --  byte is T. There might be false positives (only for slots that are
+   --  full), so the caller needs to check the hash and key anyway.
+
+   function Match_Empty (Word : Control_Word) return Control_Word
+     is (Word and Shift_Left (not Word, 6) and Msbs)
+     with Inline;
+   --  Return a mask where the high bit of each byte of Word is set if that
+   --  byte is Ctrl_Empty (the only value with bit 7 set and bit 1 unset).
+
+   function Match_Free (Word : Control_Word) return Control_Word
+     is (Word and Msbs)
+     with Inline;
+   --  Return a mask where the high bit of each byte of Word is set if that
+   --  byte is Ctrl_Empty or Ctrl_Deleted.
+
+   function Lowest_Byte (Mask : Control_Word) return Hash_Type
+     with Inline;
+   --  Return the index of the first byte with its high bit set in Mask,
+   --  which must not be null.
+
+   function Get_Control
+     (Control : Control_Table; Index : Hash_Type) return Control_Word
+     is (Shift_Right
+           (Control (Index / Group_Width),
+            Natural (Index mod Group_Width) * 8) and 16#FF#)
+     with Inline;
+   procedure Set_Control
+     (Control : in out Control_Table;
+      Index   : Hash_Type;
+      Value   : Control_Word)
+     with Inline;
+   --  Get or set the control byte for a given slot
+
+   function Find_Free
+     (Control : Control_Table; H : Hash_Type) return Hash_Type;
+   --  Return the first slot that is either empty or deleted in the probe
+   --  sequence for H.
+
+   procedure Group_Insert (Self : in out Base_Map'Class; S : Slot);
+   --  Store S (a full slot) in Self, whose Used and Fill are updated.
+   --  The key must not already be in the table.
+
+   procedure Group_Delete (Self : in out Base_Map'Class; Index : Hash_Type);
+   --  Free the slot at Index
+
+   ----------------
+   -- Is_Grouped --
+   ----------------
+
+   function Is_Grouped return Boolean is
+      Prob : Probing;
+   begin
+      return Probing_Strategy'Class (Prob) in Group_Probing'Class;
+   end Is_Grouped;
+
+   Grouped : constant Boolean := Is_Grouped and then not Bounded;
+   --  Whether to use the control bytes. Bounded maps cannot allocate them,
+   --  and use linear probing instead.
+
+   Incremental : constant Boolean :=
+     Migration_Step /= 0
+     and then not Bounded
+     and then not Grouped
+     and then not Robin_Hood;
+   --  Whether to resize the table incrementally. The other modes cannot
+   --  leave dummy slots in the old table to mark the elements that have
+   --  already been moved.
+
+   ---------------
+   -- Match_Tag --
+   ---------------
+
+   function Match_Tag (Word, T : Control_Word) return Control_Word is
+      X : constant Control_Word := Word xor (Lsbs * T);
+   begin
+      --  Bytes of X are null where Word matches. The subtraction sets their
+      --  high bit, which is then kept only for bytes that were less than
+      --  16#80# in X.
+      return (X - Lsbs) and not X and Msbs;
+   end Match_Tag;
+
+   -----------------
+   -- Lowest_Byte --
+   -----------------
+
+   function Lowest_Byte (Mask : Control_Word) return Hash_Type is
+      Result : Hash_Type := 0;
+      M      : Control_Word := Mask;
+   begin
+      while (M and 16#80#) = 0 loop
+         M := Shift_Right (M, 8);
+         Result := Result + 1;
+      end loop;
+      return Result;
+   end Lowest_Byte;
+
+   -----------------
+   -- Set_Control --
+   -----------------
+
+   procedure Set_Control
+     (Control : in out Control_Table;
+      Index   : Hash_Type;
+      Value   : Control_Word)
+   is
+      Shift : constant Natural := Natural (Index mod Group_Width) * 8;
+      Word  : Control_Word renames Control (Index / Group_Width);
+   begin
+      Word := (Word and not Shift_Left (16#FF#, Shift))
+        or Shift_Left (Value, Shift);
+   end Set_Control;
+
+   ---------------
+   -- Find_Free --
+   ---------------
+
+   function Find_Free
+     (Control : Control_Table; H : Hash_Type) return Hash_Type
+   is
+      Group : Hash_Type := First_Group (H, Control'Last);
+      Step  : Hash_Type := 0;
+      M     : Control_Word;
+   begin
+      --  Quadratic probing on the groups (by triangular numbers), which
+      --  visits all groups since their number is a power of 2.
+
+      loop
+         M := Match_Free (Control (Group));
+         if M /= 0 then
+            return Group * Group_Width + Lowest_Byte (M);
+         end if;
+
+         Step := Step + 1;
+         Group := (Group + Step) and Control'Last;
+      end loop;
+   end Find_Free;
+
+   ------------------
+   -- Group_Insert --
+   ------------------
+
+   procedure Group_Insert (Self : in out Base_Map'Class; S : Slot) is
+      Index : constant Hash_Type := Find_Free (Self.Control.all, S.Hash);
+   begin
+      if Get_Control (Self.Control.all, Index) = Ctrl_Empty then
+         Self.Fill := Self.Fill + 1;
+      end if;
+
+      Set_Control (Self.Control.all, Index, Tag (S.Hash));
+      Self.Table.Slots (Index) := S;
+      Self.Used := Self.Used + 1;
+   end Group_Insert;
+
+   ------------------
+   -- Group_Delete --
+   ------------------
+
+   procedure Group_Delete (Self : in out Base_Map'Class; Index : Hash_Type)
+   is
+   begin
+      --  If the group already has an empty slot, no lookup ever went past
+      --  it, so the slot can be marked as empty rather than deleted.
+
+      if Match_Empty (Self.Control (Index / Group_Width)) /= 0 then
+         Set_Control (Self.Control.all, Index, Ctrl_Empty);
+         Self.Table.Slots (Index).Kind := Empty;
+         Self.Fill := Self.Fill - 1;
+      else
+         Set_Control (Self.Control.all, Index, Ctrl_Deleted);
+         Self.Table.Slots (Index).Kind := Dummy;
+      end if;
+
+      Self.Used := Self.Used - 1;
+   end Group_Delete;
 
    -----------
    -- Model --
@@ -55,40 +372,23 @@ package body Conts.Maps.Impl with SPARK_Mode => Off is
          return R;
       end if;
 
-      --  Search for the first non-empty slot in Self.
-
-      C.Index := Self.Table'First;
-      while C.Index <= Self.Table'Last
-        and then Self.Table (C.Index).Kind /= Full
-      loop
-         C.Index := C.Index + 1;
-      end loop;
-
-      --  Loop over the content of Self.
+      --  Loop over the content of Self, which might be in two tables
+      --  while the map is being resized.
 
-      while C.Index <= Self.Table'Last loop
-         pragma Assert (Self.Table (C.Index).Kind = Full);
+      C := First (Self);
+      while Has_Element (Self, C) loop
 
          --  Store the current element in R.
 
          declare
-            S : constant Slot := Self.Table (C.Index);
-            K : constant Key_Type := Keys.To_Element
-              (Keys.To_Constant_Returned (S.Key));
-            V : constant Element_Type := Elements.To_Element
-              (Elements.To_Constant_Returned (S.Value));
+            K : constant Key_Type := Keys.To_Element (Key (Self, C));
+            V : constant Element_Type :=
+              Elements.To_Element (Element (Self, C));
          begin
             R := M.Add (R, K, V);
          end;
 
-         --  Go to the next non-empty slot.
-
-         C := (Index => C.Index + 1);
-         while C.Index <= Self.Table'Last
-           and then Self.Table (C.Index).Kind /= Full
-         loop
-            C.Index := C.Index + 1;
-         end loop;
+         C := Next (Self, C);
       end loop;
 
       return R;
@@ -109,38 +409,12 @@ package body Conts.Maps.Impl with SPARK_Mode => Off is
          return R;
       end if;
 
-      --  Search for the first non-empty slot in Self.
+      --  Loop over the content of Self, and store the current key in R.
 
-      C.Index := Self.Table'First;
-      while C.Index <= Self.Table'Last
-        and then Self.Table (C.Index).Kind /= Full
-      loop
-         C.Index := C.Index + 1;
-      end loop;
-
-      --  Loop over the content of Self.
-
-      while C.Index <= Self.Table'Last loop
-         pragma Assert (Self.Table (C.Index).Kind = Full);
-
-         --  Store the current key in R.
-
-         declare
-            S : constant Slot := Self.Table (C.Index);
-            L : constant Key_Type := Keys.To_Element
-              (Keys.To_Constant_Returned (S.Key));
-         begin
-            R := K.Add (R, L);
-         end;
-
-         --  Go to the next non-empty slot.
-
-         C := (Index => C.Index + 1);
-         while C.Index <= Self.Table'Last
-           and then Self.Table (C.Index).Kind /= Full
-         loop
-            C.Index := C.Index + 1;
-         end loop;
+      C := First (Self);
+      while Has_Element (Self, C) loop
+         R := K.Add (R, Keys.To_Element (Key (Self, C)));
+         C := Next (Self, C);
       end loop;
 
       return R;
@@ -162,33 +436,14 @@ package body Conts.Maps.Impl with SPARK_Mode => Off is
          return (Content => R);
       end if;
 
-      --  Search for the first non-empty slot in Self.
-
-      C.Index := Self.Table'First;
-      while C.Index <= Self.Table'Last
-        and then Self.Table (C.Index).Kind /= Full
-      loop
-         C.Index := C.Index + 1;
-      end loop;
-
-      --  Loop over the content of Self.
-
-      while C.Index <= Self.Table'Last loop
-         pragma Assert (Self.Table (C.Index).Kind = Full);
-
-         --  Store the current cursor in R at position I + 1.
+      --  Loop over the content of Self, and store the current cursor in R
+      --  at position I + 1.
 
+      C := First (Self);
+      while Has_Element (Self, C) loop
          I := I + 1;
          R := P.Add (R, C, I);
-
-         --  Go to the next non-empty slot.
-
-         C := (Index => C.Index + 1);
-         while C.Index <= Self.Table'Last
-           and then Self.Table (C.Index).Kind /= Full
-         loop
-            C.Index := C.Index + 1;
-         end loop;
+         C := Next (Self, C);
       end loop;
 
       return (Content => R);
@@ -209,15 +464,15 @@ package body Conts.Maps.Impl with SPARK_Mode => Off is
       Key   : Keys.Element_Type;
       H     : Hash_Type) return Hash_Type
    is
-      Candidate   : Hash_Type := H and Self.Table'Last;
+      Candidate   : Hash_Type := H and Self.Table.Slots'Last;
       First_Dummy : Hash_Type := Hash_Type'Last;
       S           : Slot;
       Prob        : Probing;
    begin
-      Prob.Initialize_Probing (Hash => H, Size => Self.Table'Last);
+      Prob.Initialize_Probing (Hash => H, Size => Self.Table.Slots'Last);
 
       loop
-         S := Self.Table (Candidate);
+         S := Self.Table.Slots (Candidate);
          case S.Kind is
             when Empty =>
                exit;
@@ -231,12 +486,17 @@ package body Conts.Maps.Impl with SPARK_Mode => Off is
                end if;
 
             when Full =>
-               exit when S.Hash = H and then "=" (Key, S.Key);
+               if S.Hash = H and then "=" (Key, S.Key) then
+                  return Candidate;
+               end if;
          end case;
 
-         Candidate := Prob.Next_Probing (Candidate) and Self.Table'Last;
+         Candidate := Prob.Next_Probing (Candidate) and Self.Table.Slots'Last;
       end loop;
 
+      --  The key is not in the table: reuse the first dummy slot we saw,
+      --  if any, rather than the empty one.
+
       if First_Dummy /= Hash_Type'Last then
          return First_Dummy;
       else
@@ -244,15 +504,209 @@ package body Conts.Maps.Impl with SPARK_Mode => Off is
       end if;
    end Find_Slot;
 
+   --------------------
+   -- Generic_Lookup --
+   --------------------
+
+   function Generic_Lookup
+     (Self  : Base_Map'Class;
+      Key   : Lookup_Key;
+      H     : Hash_Type) return Hash_Type
+   is
+      Candidate : Hash_Type := H and Self.Table.Slots'Last;
+      Dist      : Hash_Type := 0;
+      Prob      : Probing;
+   begin
+      if Grouped then
+         declare
+            T     : constant Control_Word := Tag (H);
+            Group : Hash_Type := First_Group (H, Self.Control'Last);
+            Step  : Hash_Type := 0;
+            Word  : Control_Word;
+            M     : Control_Word;
+            Index : Hash_Type;
+         begin
+            loop
+               Word := Self.Control (Group);
+
+               M := Match_Tag (Word, T);
+               while M /= 0 loop
+                  Index := Group * Group_Width + Lowest_Byte (M);
+                  if Self.Table.Slots (Index).Hash = H
+                    and then "=" (Key, Self.Table.Slots (Index).Key)
+                  then
+                     return Index;
+                  end if;
+                  M := M and (M - 1);   --  clear the lowest bit
+               end loop;
+
+               --  An insertion would have used the empty slot, so the key
+               --  cannot be in a later group.
+
+               if Match_Empty (Word) /= 0 then
+                  return No_Slot;
+               end if;
+
+               Step := Step + 1;
+               Group := (Group + Step) and Self.Control'Last;
+            end loop;
+         end;
+
+      elsif not Robin_Hood then
+         --  Dummy slots do not stop the search, since the key might have
+         --  been inserted before the element that was deleted there.
+
+         Prob.Initialize_Probing (Hash => H, Size => Self.Table.Slots'Last);
+         loop
+            declare
+               S : Slot renames Self.Table.Slots (Candidate);
+            begin
+               if S.Kind = Empty then
+                  exit;
+               elsif S.Kind = Full
+                 and then S.Hash = H
+                 and then "=" (Key, S.Key)
+               then
+                  return Candidate;
+               end if;
+            end;
+
+            Candidate :=
+              Prob.Next_Probing (Candidate) and Self.Table.Slots'Last;
+         end loop;
+
+         if not Incremental or else Self.Old = null then
+            return No_Slot;
+         end if;
+
+         --  The key might not have been moved to the new table yet. Slots
+         --  of the old table are returned after those of the new table.
+
+         Candidate := H and Self.Old.Slots'Last;
+         Prob.Initialize_Probing (Hash => H, Size => Self.Old.Slots'Last);
+         loop
+            declare
+               S : Slot renames Self.Old.Slots (Candidate);
+            begin
+               if S.Kind = Empty then
+                  return No_Slot;
+               elsif S.Kind = Full
+                 and then S.Hash = H
+                 and then "=" (Key, S.Key)
+               then
+                  return Self.Table.Slots'Length + Candidate;
+               end if;
+            end;
+
+            Candidate :=
+              Prob.Next_Probing (Candidate) and Self.Old.Slots'Last;
+         end loop;
+      end if;
+
+      --  With Robin Hood probing, we can stop as soon as we find a key
+      --  closer to its preferred slot than our key would be, since an
+      --  insertion would have displaced it.
+
+      loop
+         declare
+            S : Slot renames Self.Table.Slots (Candidate);
+         begin
+            if S.Kind /= Full
+              or else Probe_Distance (Self.Table.Slots, Candidate) < Dist
+            then
+               return No_Slot;
+            elsif S.Hash = H and then "=" (Key, S.Key) then
+               return Candidate;
+            end if;
+         end;
+
+         Candidate := (Candidate + 1) and Self.Table.Slots'Last;
+         Dist := Dist + 1;
+      end loop;
+   end Generic_Lookup;
+
+   function Lookup is new Generic_Lookup (Keys.Element_Type);
+
+   -----------------------
+   -- Robin_Hood_Insert --
+   -----------------------
+
+   procedure Robin_Hood_Insert (Table : in out Slot_Table; S : Slot) is
+      Current   : Slot := S;
+      Tmp       : Slot;
+      Candidate : Hash_Type := S.Hash and Table'Last;
+      Dist      : Hash_Type := 0;
+      D         : Hash_Type;
+   begin
+      loop
+         if Table (Candidate).Kind /= Full then
+            Table (Candidate) := Current;
+            return;
+         end if;
+
+         D := Probe_Distance (Table, Candidate);
+         if D < Dist then
+            --  Take the place of the richer key, and continue with it
+            Tmp := Table (Candidate);
+            Table (Candidate) := Current;
+            Current := Tmp;
+            Dist := D;
+         end if;
+
+         Candidate := (Candidate + 1) and Table'Last;
+         Dist := Dist + 1;
+      end loop;
+   end Robin_Hood_Insert;
+
+   -----------------------
+   -- Robin_Hood_Delete --
+   -----------------------
+
+   procedure Robin_Hood_Delete
+     (Table : in out Slot_Table; Index : Hash_Type)
+   is
+      Hole : Hash_Type := Index;
+      Next : Hash_Type := (Index + 1) and Table'Last;
+   begin
+      --  Backward shift: move back all the keys that follow, until we find
+      --  an empty slot or a key that is already in its preferred slot.
+
+      while Table (Next).Kind = Full
+        and then Probe_Distance (Table, Next) /= 0
+      loop
+         Table (Hole) := Table (Next);
+         Hole := Next;
+         Next := (Next + 1) and Table'Last;
+      end loop;
+
+      Table (Hole).Kind := Empty;
+   end Robin_Hood_Delete;
+
    ------------
    -- Assign --
    ------------
 
    procedure Assign (Self : in out Base_Map'Class; Source : Base_Map'Class) is
    begin
+      if Self'Address = Source'Address then
+         return;
+      end if;
+
+      --  Release the elements and tables of Self, which would otherwise
+      --  leak when they are replaced by those of Source.
+
+      Clear (Self);
+
       Self.Used := Source.Used;
       Self.Fill := Source.Fill;
-      Self.Table := Source.Table;
+      Self.Allocated := Source.Allocated;
+      Self.Fixed_Used := Source.Fixed_Used;
+      if Bounded then
+         Self.Fixed := Source.Fixed;
+      end if;
+      Self.Control := Source.Control;
+      Self.Old := Source.Old;
+      Self.Migrated := Source.Migrated;
       Self.Adjust;
    end Assign;
 
@@ -261,33 +715,72 @@ package body Conts.Maps.Impl with SPARK_Mode => Off is
    ------------
 
    procedure Adjust (Self : in out Base_Map) is
-      Tmp : constant Slot_Table_Access := Self.Table;
+      Tmp : constant Table_Access := Self.Table;
    begin
-      if Tmp /= null then
+      if Self.Control /= null then
+         Self.Control := new Control_Table'(Self.Control.all);
+      end if;
 
-         if Elements.Copyable and then Keys.Copyable then
-            Self.Table := new Slot_Table'(Tmp.all);
+      if Tmp /= null then
+         --  The table of bounded maps was copied along with the map. For
+         --  unbounded maps, Tmp is still the table of the map we were
+         --  copied from.
+
+         if Bounded then
+            null;
+         elsif Elements.Copyable and then Keys.Copyable then
+            Self.Allocated := new Table_Record'(Tmp.all);
          else
-            Self.Table := new Slot_Table (Tmp'Range);
-            for E in Self.Table'Range loop
-               if Tmp (E).Kind = Full then
-                  Self.Table (E) :=
-                    (Hash  => Tmp (E).Hash,
+            Self.Allocated := new Table_Record (Tmp.First, Tmp.Last);
+         end if;
+
+         if not Elements.Copyable or else not Keys.Copyable then
+            for E in Self.Table.Slots'Range loop
+               if Tmp.Slots (E).Kind = Full then
+                  Self.Table.Slots (E) :=
+                    (Hash  => Tmp.Slots (E).Hash,
                      Kind  => Full,
                      Key   =>
                        (if Keys.Copyable
-                        then Tmp (E).Key
-                        else Keys.Copy (Tmp (E).Key)),
+                        then Tmp.Slots (E).Key
+                        else Keys.Copy (Tmp.Slots (E).Key)),
                      Value =>
                        (if Elements.Copyable
-                        then Tmp (E).Value
-                        else Elements.Copy (Tmp (E).Value)));
+                        then Tmp.Slots (E).Value
+                        else Elements.Copy (Tmp.Slots (E).Value)));
                else
-                  Self.Table (E) := Tmp (E);
+                  Self.Table.Slots (E) := Tmp.Slots (E);
                end if;
             end loop;
          end if;
       end if;
+
+      --  If the map was being resized, the copy gets all its elements in
+      --  the new table.
+
+      if Incremental and then Self.Old /= null then
+         declare
+            Old : constant Table_Access := Self.Old;
+         begin
+            Self.Old := null;
+            Self.Migrated := 0;
+
+            for S of Old.Slots loop
+               if S.Kind = Full then
+                  Move_Slot
+                    (Self,
+                     (Hash  => S.Hash,
+                      Kind  => Full,
+                      Key   =>
+                        (if Keys.Copyable then S.Key else Keys.Copy (S.Key)),
+                      Value =>
+                        (if Elements.Copyable
+                         then S.Value
+                         else Elements.Copy (S.Value))));
+               end if;
+            end loop;
+         end;
+      end if;
    end Adjust;
 
    --------------
@@ -310,18 +803,15 @@ package body Conts.Maps.Impl with SPARK_Mode => Off is
          return No_Element;
       end if;
 
-      C.Index := Self.Table'First;
-      loop
-         if C.Index > Self.Table'Last then
+      C.Index := Self.Table.Slots'First;
+      if Self.Table.Slots (C.Index).Kind /= Full then
+         C := Next (Self, C);
+         if not Has_Element (Self, C) then
             return No_Element;
          end if;
+      end if;
 
-         if Self.Table (C.Index).Kind = Full then
-            return C;
-         end if;
-
-         C.Index := C.Index + 1;
-      end loop;
+      return C;
    end First;
 
    -----------------
@@ -331,7 +821,11 @@ package body Conts.Maps.Impl with SPARK_Mode => Off is
    function Has_Element
      (Self : Base_Map'Class; Position : Cursor) return Boolean is
    begin
-      return Position.Index <= Self.Table'Last;
+      if Incremental and then Self.Old /= null then
+         return Position.Index
+           < Self.Table.Slots'Length + Self.Old.Slots'Length;
+      end if;
+      return Position.Index <= Self.Table.Slots'Last;
    end Has_Element;
 
    ----------
@@ -343,11 +837,28 @@ package body Conts.Maps.Impl with SPARK_Mode => Off is
    is
       C : Cursor := (Index => Position.Index + 1);
    begin
-      while C.Index <= Self.Table'Last
-        and then Self.Table (C.Index).Kind /= Full
+      while C.Index <= Self.Table.Slots'Last
+        and then Self.Table.Slots (C.Index).Kind /= Full
       loop
          C.Index := C.Index + 1;
       end loop;
+
+      --  Then iterate on the elements not moved to the new table yet
+
+      if Incremental
+        and then Self.Old /= null
+        and then C.Index > Self.Table.Slots'Last
+      then
+         C.Index := Hash_Type'Max
+           (C.Index, Self.Table.Slots'Length + Self.Migrated);
+         while C.Index - Self.Table.Slots'Length <= Self.Old.Slots'Last
+           and then Self.Old.Slots (C.Index - Self.Table.Slots'Length).Kind
+             /= Full
+         loop
+            C.Index := C.Index + 1;
+         end loop;
+      end if;
+
       return C;
    end Next;
 
@@ -357,11 +868,13 @@ package body Conts.Maps.Impl with SPARK_Mode => Off is
 
    function Key
      (Self : Base_Map'Class; Position : Cursor)
-         return Constant_Returned_Key_Type
-   is
-      P : Slot renames Self.Table (Position.Index);
+         return Constant_Returned_Key_Type is
    begin
-      return Keys.To_Constant_Returned (P.Key);
+      if Incremental and then Position.Index > Self.Table.Slots'Last then
+         return Keys.To_Constant_Returned
+           (Self.Old.Slots (Position.Index - Self.Table.Slots'Length).Key);
+      end if;
+      return Keys.To_Constant_Returned (Self.Table.Slots (Position.Index).Key);
    end Key;
 
    -------------
@@ -370,11 +883,14 @@ package body Conts.Maps.Impl with SPARK_Mode => Off is
 
    function Element
      (Self : Base_Map'Class; Position : Cursor)
-         return Constant_Returned_Type
-   is
-      P : Slot renames Self.Table (Position.Index);
+         return Constant_Returned_Type is
    begin
-      return Elements.To_Constant_Returned (P.Value);
+      if Incremental and then Position.Index > Self.Table.Slots'Last then
+         return Elements.To_Constant_Returned
+           (Self.Old.Slots (Position.Index - Self.Table.Slots'Length).Value);
+      end if;
+      return Elements.To_Constant_Returned
+        (Self.Table.Slots (Position.Index).Value);
    end Element;
 
    --------------
@@ -386,7 +902,7 @@ package body Conts.Maps.Impl with SPARK_Mode => Off is
       if Self.Table = null then
          return 0;
       else
-         return Self.Table'Length;
+         return Self.Table.Slots'Length;
       end if;
    end Capacity;
 
@@ -396,6 +912,67 @@ package body Conts.Maps.Impl with SPARK_Mode => Off is
 
    function Length (Self : Base_Map'Class) return Count_Type is (Self.Used);
 
+   ---------------------
+   -- Rehash_In_Place --
+   ---------------------
+
+   procedure Rehash_In_Place (Self : in out Base_Map'Class) is
+      Table     : Slot_Table renames Self.Table.Slots;
+      Candidate : Hash_Type;
+      Tmp       : Slot;
+      Prob      : Probing;
+   begin
+      --  All dummy slots become empty, and all full slots are marked as
+      --  dummy, meaning that they still need to be reinserted. This is
+      --  the only place where a dummy slot contains a valid key.
+
+      for S of Table loop
+         case S.Kind is
+            when Empty => null;
+            when Dummy => S.Kind := Empty;
+            when Full  => S.Kind := Dummy;
+         end case;
+      end loop;
+
+      --  Now reinsert each key in the first slot of its probe sequence
+      --  that is not already used by a reinserted key. When this is
+      --  another key still to be reinserted, we swap them and process the
+      --  other key in turn.
+      --  Keys that have been reinserted are never moved again, and all the
+      --  slots before them in their probe sequence are full, so lookups
+      --  will find them.
+
+      for E in Table'Range loop
+         while Table (E).Kind = Dummy loop
+            Prob.Initialize_Probing
+              (Hash => Table (E).Hash, Size => Table'Last);
+
+            Candidate := Table (E).Hash and Table'Last;
+            while Table (Candidate).Kind = Full loop
+               Candidate := Prob.Next_Probing (Candidate)
+                 and Table'Last;
+            end loop;
+
+            if Candidate = E then
+               Table (E).Kind := Full;
+
+            elsif Table (Candidate).Kind = Empty then
+               Table (Candidate) := Table (E);
+               Table (Candidate).Kind := Full;
+               Table (E).Kind := Empty;
+
+            else
+               Tmp := Table (Candidate);
+               Table (Candidate) := Table (E);
+               Table (Candidate).Kind := Full;
+               Table (E) := Tmp;
+            end if;
+         end loop;
+      end loop;
+
+      Self.Fill := Self.Used;
+   end Rehash_In_Place;
+
    ------------
    -- Resize --
    ------------
@@ -410,18 +987,61 @@ package body Conts.Maps.Impl with SPARK_Mode => Off is
       Min_New_Size : constant Hash_Type := Hash_Type'Max
          (Hash_Type (New_Size), Hash_Type (Self.Used));
 
-      Tmp       : Slot_Table_Access;
+      Tmp       : Table_Access;
       Candidate : Hash_Type;
       Prob      : Probing;
    begin
+      --  Bounded maps always use the same table, we can at most remove the
+      --  dummy slots.
+
+      if Bounded then
+         if not Self.Fixed_Used then
+            Self.Fixed_Used := True;
+         elsif Self.Fill > Self.Used then
+            Rehash_In_Place (Self);
+         end if;
+         return;
+      end if;
+
+      --  Finish any incremental resize first, so that all elements are in
+      --  Self.Table.
+
+      if Incremental then
+         Migrate (Self, Hash_Type'Last);
+      end if;
+
       --  Find smallest valid size greater than New_Size
 
       while Size < Min_New_Size loop
          Size := Size * 2;
       end loop;
 
+      --  If the size doesn't change, we only need to get rid of the dummy
+      --  slots, which can be done without allocating a new table. There
+      --  are never any dummy slots with Robin Hood probing. With group
+      --  probing, we simply reallocate the table.
+
+      if Self.Table /= null
+        and then Size = Self.Table.Slots'Length
+        and then (Self.Fill = Self.Used or else not Grouped)
+      then
+         if Self.Fill > Self.Used then
+            Rehash_In_Place (Self);
+         end if;
+         return;
+      end if;
+
       Tmp := Self.Table;
-      Self.Table := new Slot_Table (0 .. Size - 1);
+      Self.Allocated := new Table_Record (First => 0, Last => Size - 1);
+      Self.Fill := Self.Used;
+
+      if Grouped then
+         if Self.Control /= null then
+            Unchecked_Free (Self.Control);
+         end if;
+         Self.Control := new Control_Table'
+           (0 .. Size / Group_Width - 1 => Lsbs * Ctrl_Empty);
+      end if;
 
       --  Reinsert all the elements in the new table. We do not need to
       --  recompute their hashes, which are unchanged an cached. Since we
@@ -430,32 +1050,253 @@ package body Conts.Maps.Impl with SPARK_Mode => Off is
       --  There are also no dummy slots
 
       if Tmp /= null then
-         for E in Tmp'Range loop
-            if Tmp (E).Kind = Full then
-               Prob.Initialize_Probing
-                 (Hash => Tmp (E).Hash, Size => Self.Table'Last);
-
-               Candidate := Tmp (E).Hash and Self.Table'Last;
-               loop
-                  if Self.Table (Candidate).Kind = Empty then
-                     Self.Table (Candidate) :=
-                       (Hash  => Tmp (E).Hash,
-                        Kind  => Full,
-                        Key   => Tmp (E).Key,
-                        Value => Tmp (E).Value);
-                     exit;
-                  end if;
+         for E in Tmp.Slots'Range loop
+            declare
+               S : Slot renames Tmp.Slots (E);
+            begin
+               if S.Kind /= Full then
+                  null;
 
-                  Candidate := Prob.Next_Probing (Candidate)
-                    and Self.Table'Last;
-               end loop;
-            end if;
+               elsif Robin_Hood then
+                  Robin_Hood_Insert (Self.Table.Slots, S);
+
+               elsif Grouped then
+                  Candidate := Find_Free (Self.Control.all, S.Hash);
+                  Set_Control (Self.Control.all, Candidate, Tag (S.Hash));
+                  Self.Table.Slots (Candidate) := S;
+
+               else
+                  Prob.Initialize_Probing
+                    (Hash => S.Hash, Size => Self.Table.Slots'Last);
+
+                  Candidate := S.Hash and Self.Table.Slots'Last;
+                  while Self.Table.Slots (Candidate).Kind /= Empty loop
+                     Candidate := Prob.Next_Probing (Candidate)
+                       and Self.Table.Slots'Last;
+                  end loop;
+
+                  Self.Table.Slots (Candidate) := S;
+               end if;
+            end;
          end loop;
 
          Unchecked_Free (Tmp);
       end if;
    end Resize;
 
+   ---------------
+   -- Move_Slot --
+   ---------------
+
+   procedure Move_Slot (Self : in out Base_Map'Class; S : Slot) is
+      Candidate : Hash_Type := S.Hash and Self.Table.Slots'Last;
+      Prob      : Probing;
+   begin
+      Prob.Initialize_Probing (Hash => S.Hash, Size => Self.Table.Slots'Last);
+      while Self.Table.Slots (Candidate).Kind = Full loop
+         Candidate := Prob.Next_Probing (Candidate) and Self.Table.Slots'Last;
+      end loop;
+
+      if Self.Table.Slots (Candidate).Kind = Empty then
+         Self.Fill := Self.Fill + 1;
+      end if;
+      Self.Table.Slots (Candidate) := S;
+   end Move_Slot;
+
+   -------------
+   -- Migrate --
+   -------------
+
+   procedure Migrate (Self : in out Base_Map'Class; Count : Hash_Type) is
+      Remaining : Hash_Type := Count;
+   begin
+      while Self.Old /= null and then Remaining /= 0 loop
+         declare
+            S : Slot renames Self.Old.Slots (Self.Migrated);
+         begin
+            --  The slot becomes a dummy rather than empty, so that lookups
+            --  in the old table still go past it.
+
+            if S.Kind = Full then
+               Move_Slot (Self, S);
+               S.Kind := Dummy;
+            end if;
+         end;
+
+         if Self.Migrated = Self.Old.Slots'Last then
+            Unchecked_Free (Self.Old);
+            Self.Migrated := 0;
+         else
+            Self.Migrated := Self.Migrated + 1;
+         end if;
+
+         Remaining := Remaining - 1;
+      end loop;
+   end Migrate;
+
+   ---------------------
+   -- Start_Migration --
+   ---------------------
+
+   procedure Start_Migration
+     (Self     : in out Base_Map'Class;
+      New_Size : Count_Type)
+   is
+      Size : Hash_Type := Hash_Type (Min_Size);
+      Min_New_Size : constant Hash_Type := Hash_Type'Max
+         (Hash_Type (New_Size), Hash_Type (Self.Used));
+   begin
+      --  Only one table can be in the process of being moved. If a
+      --  migration is already running, let the following calls to Set and
+      --  Delete complete it rather than stalling this one. The current
+      --  table is only forced to completion when it might not have room
+      --  for the elements still in the old table.
+
+      if Self.Old /= null then
+         if Self.Fill + Self.Used < Self.Capacity then
+            return;
+         end if;
+
+         Migrate (Self, Hash_Type'Last);
+      end if;
+
+      while Size < Min_New_Size loop
+         Size := Size * 2;
+      end loop;
+
+      Self.Old := Self.Table;
+      Self.Migrated := 0;
+      Self.Allocated := new Table_Record (First => 0, Last => Size - 1);
+      Self.Fill := 0;
+
+      Migrate (Self, Hash_Type (Migration_Step));
+   end Start_Migration;
+
+   ------------
+   -- Insert --
+   ------------
+
+   procedure Insert
+     (Self     : in out Base_Map'Class;
+      Key      : Keys.Element_Type;
+      Value    : Elements.Element_Type)
+   is
+      H : constant Hash_Type := Hash (Key);
+   begin
+      if Robin_Hood or else Grouped then
+         declare
+            Index : constant Hash_Type := Lookup (Self, Key, H);
+            S     : Slot;
+         begin
+            if Index /= No_Slot then
+               Elements.Release (Self.Table.Slots (Index).Value);
+               Self.Table.Slots (Index).Value := Elements.To_Stored (Value);
+            else
+               S := (Hash  => H,
+                     Kind  => Full,
+                     Key   => Keys.To_Stored (Key),
+                     Value => Elements.To_Stored (Value));
+
+               if Grouped then
+                  Group_Insert (Self, S);
+               else
+                  Robin_Hood_Insert (Self.Table.Slots, S);
+                  Self.Used := Self.Used + 1;
+                  Self.Fill := Self.Fill + 1;
+               end if;
+            end if;
+         end;
+
+      else
+         --  While the table is being resized, the key might still be in
+         --  the old table, and we must not insert it in the new one.
+
+         if Incremental and then Self.Old /= null then
+            declare
+               Index : constant Hash_Type := Lookup (Self, Key, H);
+            begin
+               if Index /= No_Slot
+                 and then Index > Self.Table.Slots'Last
+               then
+                  declare
+                     S : Slot renames
+                       Self.Old.Slots (Index - Self.Table.Slots'Length);
+                  begin
+                     Elements.Release (S.Value);
+                     S.Value := Elements.To_Stored (Value);
+                     return;
+                  end;
+               end if;
+            end;
+         end if;
+
+         declare
+            Index    : constant Hash_Type := Find_Slot (Self, Key, H);
+            S        : Slot renames Self.Table.Slots (Index);
+         begin
+            case S.Kind is
+               when Empty =>
+                  S := (Hash  => H,
+                        Kind  => Full,
+                        Key   => Keys.To_Stored (Key),
+                        Value => Elements.To_Stored (Value));
+                  Self.Used := Self.Used + 1;
+                  Self.Fill := Self.Fill + 1;
+
+               when Dummy =>
+                  S := (Hash  => H,
+                        Kind  => Full,
+                        Key   => Keys.To_Stored (Key),
+                        Value => Elements.To_Stored (Value));
+                  Self.Used := Self.Used + 1;
+
+               when Full =>
+                  Elements.Release (S.Value);
+                  S.Value := Elements.To_Stored (Value);
+            end case;
+         end;
+      end if;
+   end Insert;
+
+   ----------------------
+   -- Reserve_Capacity --
+   ----------------------
+
+   procedure Reserve_Capacity
+     (Self     : in out Base_Map'Class;
+      Capacity : Count_Type)
+   is
+      Count : constant Count_Type := Count_Type'Max (Capacity, Self.Used);
+      Size  : Count_Type := Min_Size;
+   begin
+      if Bounded then
+         if Capacity > Fixed_Capacity then
+            raise Constraint_Error with "Bounded map is too small";
+         end if;
+
+         Resize (Self, Capacity);
+         return;
+      end if;
+
+      --  Find the smallest table that can store Count elements, without
+      --  the resize strategy asking for a larger one.
+
+      while Size < Count_Type'Last / 2
+        and then Resize_Strategy
+          (Used => Count, Fill => Count, Capacity => Size) /= 0
+      loop
+         Size := Size * 2;
+      end loop;
+
+      if Self.Table = null or else Size > Self.Table.Slots'Length then
+         Resize (Self, Size);
+
+      elsif Self.Fill > Self.Used then
+         --  Dummy slots would also count towards the fill ratio
+         Resize (Self, Self.Table.Slots'Length);
+      end if;
+   end Reserve_Capacity;
+
    ---------
    -- Set --
    ---------
@@ -465,7 +1306,6 @@ package body Conts.Maps.Impl with SPARK_Mode => Off is
       Key      : Keys.Element_Type;
       Value    : Elements.Element_Type)
    is
-      H        : constant Hash_Type := Hash (Key);
       Used     : constant Count_Type := Self.Used;
       New_Size : Count_Type;
    begin
@@ -478,6 +1318,17 @@ package body Conts.Maps.Impl with SPARK_Mode => Off is
          Resize (Self, Min_Size);
       end if;
 
+      if Incremental then
+         Migrate (Self, Hash_Type (Migration_Step));
+      end if;
+
+      if Bounded
+        and then Self.Used = Fixed_Capacity
+        and then Lookup (Self, Key, Hash (Key)) = No_Slot
+      then
+         raise Constraint_Error with "Bounded map is full";
+      end if;
+
       --  Do the actual insert. Find_Slot expects to find an empy slot
       --  eventually, and the less full the table the more chance of
       --  finding this slot early on. But we can't systematically resize
@@ -488,31 +1339,7 @@ package body Conts.Maps.Impl with SPARK_Mode => Off is
       --  means we might be resizing even though the user won't be adding a
       --  new element ever after.
 
-      declare
-         Index    : constant Hash_Type := Find_Slot (Self, Key, H);
-         S        : Slot renames Self.Table (Index);
-      begin
-         case S.Kind is
-            when Empty =>
-               S := (Hash  => H,
-                     Kind  => Full,
-                     Key   => Keys.To_Stored (Key),
-                     Value => Elements.To_Stored (Value));
-               Self.Used := Self.Used + 1;
-               Self.Fill := Self.Fill + 1;
-
-            when Dummy =>
-               S := (Hash  => H,
-                     Kind  => Full,
-                     Key   => Keys.To_Stored (Key),
-                     Value => Elements.To_Stored (Value));
-               Self.Used := Self.Used + 1;
-
-            when Full =>
-               Elements.Release (S.Value);
-               S.Value := Elements.To_Stored (Value);
-         end case;
-      end;
+      Insert (Self, Key, Value);
 
       --  If the table is now too full, we need to resize it for the next
       --  time we want to insert an element.
@@ -522,12 +1349,59 @@ package body Conts.Maps.Impl with SPARK_Mode => Off is
            (Used     => Self.Used,
             Fill     => Self.Fill,
             Capacity => Self.Capacity);
-         if New_Size /= 0 then
+         if New_Size = 0 then
+            null;
+         elsif Incremental and then New_Size > Self.Capacity then
+            Start_Migration (Self, New_Size);
+         else
             Resize (Self, New_Size);
          end if;
       end if;
    end Set;
 
+   --------------
+   -- Set_Many --
+   --------------
+
+   procedure Set_Many
+     (Self   : in out Base_Map'Class;
+      Source : Cursors.Container)
+   is
+      C     : Cursors.Cursor := Cursors.First (Source);
+      Count : Count_Type := 0;
+   begin
+      if Bounded then
+         --  The table never needs resizing, but Set checks whether the map
+         --  is full.
+
+         while Cursors.Has_Element (Source, C) loop
+            Set (Self,
+                 Key   => Get_Keys.Get (Source, C),
+                 Value => Get_Elements.Get (Source, C));
+            C := Cursors.Next (Source, C);
+         end loop;
+         return;
+      end if;
+
+      while Cursors.Has_Element (Source, C) loop
+         Count := Count + 1;
+         C := Cursors.Next (Source, C);
+      end loop;
+
+      --  Make sure all elements fit, so that we never need to check whether
+      --  the table should be resized.
+
+      Reserve_Capacity (Self, Self.Used + Count);
+
+      C := Cursors.First (Source);
+      while Cursors.Has_Element (Source, C) loop
+         Insert (Self,
+                 Key   => Get_Keys.Get (Source, C),
+                 Value => Get_Elements.Get (Source, C));
+         C := Cursors.Next (Source, C);
+      end loop;
+   end Set_Many;
+
    ---------
    -- Get --
    ---------
@@ -539,12 +1413,10 @@ package body Conts.Maps.Impl with SPARK_Mode => Off is
    begin
       if Self.Table /= null then
          declare
-            H     : constant Hash_Type := Hash (Key);
-            Index : constant Hash_Type := Find_Slot (Self, Key, H);
+            Index : constant Hash_Type := Lookup (Self, Key, Hash (Key));
          begin
-            if Self.Table (Index).Kind = Full then
-               return Elements.To_Constant_Returned
-                 (Self.Table (Index).Value);
+            if Index /= No_Slot then
+               return Element (Self, (Index => Index));
             end if;
          end;
       end if;
@@ -558,14 +1430,7 @@ package body Conts.Maps.Impl with SPARK_Mode => Off is
    function Contains (Self : Base_Map'Class; Key : Key_Type) return Boolean  is
    begin
       if Self.Table /= null then
-         declare
-            H     : constant Hash_Type := Hash (Key);
-            Index : constant Hash_Type := Find_Slot (Self, Key, H);
-         begin
-            if Self.Table (Index).Kind = Full then
-               return True;
-            end if;
-         end;
+         return Lookup (Self, Key, Hash (Key)) /= No_Slot;
       end if;
       return False;
    end Contains;
@@ -580,21 +1445,112 @@ package body Conts.Maps.Impl with SPARK_Mode => Off is
    begin
       if Self.Table /= null then
          declare
-            H     : constant Hash_Type := Hash (Key);
-            Index : constant Hash_Type := Find_Slot (Self, Key, H);
-            S     : Slot renames Self.Table (Index);
+            Index : constant Hash_Type := Lookup (Self, Key, Hash (Key));
          begin
-            if S.Kind = Full then
-               Keys.Release (S.Key);
-               Elements.Release (S.Value);
-               S.Kind := Dummy;
-               Self.Used := Self.Used - 1;
-               --   unchanged: Self.Fill
+            if Index /= No_Slot then
+               Delete_Slot (Self, Index);
             end if;
          end;
       end if;
    end Delete;
 
+   -----------------
+   -- Delete_Slot --
+   -----------------
+
+   procedure Delete_Slot (Self : in out Base_Map'Class; Index : Hash_Type) is
+   begin
+      if Incremental and then Index > Self.Table.Slots'Last then
+         declare
+            S : Slot renames Self.Old.Slots (Index - Self.Table.Slots'Length);
+         begin
+            Keys.Release (S.Key);
+            Elements.Release (S.Value);
+            S.Kind := Dummy;
+         end;
+      else
+         Keys.Release (Self.Table.Slots (Index).Key);
+         Elements.Release (Self.Table.Slots (Index).Value);
+
+         if Grouped then
+            Group_Delete (Self, Index);   --  also updates Self.Used
+            return;
+         elsif Robin_Hood then
+            Robin_Hood_Delete (Self.Table.Slots, Index);
+            Self.Fill := Self.Fill - 1;
+         else
+            Self.Table.Slots (Index).Kind := Dummy;
+            --   unchanged: Self.Fill
+         end if;
+      end if;
+
+      Self.Used := Self.Used - 1;
+
+      if Incremental then
+         Migrate (Self, Hash_Type (Migration_Step));
+      end if;
+   end Delete_Slot;
+
+   --------------------
+   -- Alternate_Keys --
+   --------------------
+
+   package body Alternate_Keys is
+
+      function Alternate_Lookup is new Generic_Lookup (Alternate_Key, "=");
+
+      ---------
+      -- Get --
+      ---------
+
+      function Get
+        (Self : Base_Map'Class;
+         Key  : Alternate_Key) return Elements.Constant_Returned_Type is
+      begin
+         if Self.Table /= null then
+            declare
+               Index : constant Hash_Type :=
+                 Alternate_Lookup (Self, Key, Hash (Key));
+            begin
+               if Index /= No_Slot then
+                  return Element (Self, (Index => Index));
+               end if;
+            end;
+         end if;
+         raise Constraint_Error with "Key not in map";
+      end Get;
+
+      --------------
+      -- Contains --
+      --------------
+
+      function Contains
+        (Self : Base_Map'Class; Key : Alternate_Key) return Boolean is
+      begin
+         return Self.Table /= null
+           and then Alternate_Lookup (Self, Key, Hash (Key)) /= No_Slot;
+      end Contains;
+
+      ------------
+      -- Delete --
+      ------------
+
+      procedure Delete (Self : in out Base_Map'Class; Key : Alternate_Key) is
+      begin
+         if Self.Table /= null then
+            declare
+               Index : constant Hash_Type :=
+                 Alternate_Lookup (Self, Key, Hash (Key));
+            begin
+               if Index /= No_Slot then
+                  Delete_Slot (Self, Index);
+               end if;
+            end;
+         end if;
+      end Delete;
+
+   end Alternate_Keys;
+
    -----------
    -- Clear --
    -----------
@@ -602,13 +1558,36 @@ package body Conts.Maps.Impl with SPARK_Mode => Off is
    procedure Clear (Self : in out Base_Map'Class) is
    begin
       if Self.Table /= null then
-         for S of Self.Table.all loop
+         for S of Self.Table.Slots loop
             if S.Kind = Full then
                Keys.Release (S.Key);
                Elements.Release (S.Value);
             end if;
          end loop;
-         Unchecked_Free (Self.Table);
+
+         if Self.Old /= null then
+            for S of Self.Old.Slots loop
+               if S.Kind = Full then
+                  Keys.Release (S.Key);
+                  Elements.Release (S.Value);
+               end if;
+            end loop;
+            Unchecked_Free (Self.Old);
+            Self.Migrated := 0;
+         end if;
+
+         if Bounded then
+            for S of Self.Table.Slots loop
+               S.Kind := Empty;
+            end loop;
+            Self.Fixed_Used := False;
+         else
+            Unchecked_Free (Self.Allocated);
+         end if;
+
+         if Self.Control /= null then
+            Unchecked_Free (Self.Control);
+         end if;
          Self.Used := 0;
          Self.Fill := 0;
       end if;
@@ -0,0 +1,864 @@
+------------------------------------------------------------------------------
+--                     Copyright (C) 2016, AdaCore                          --
+--                                                                          --
+-- This library is free software;  you can redistribute it and/or modify it --
+-- under terms of the  GNU General Public License  as published by the Free --
+-- Software  Foundation;  either version 3,  or (at your  option) any later --
+-- version. This library is distributed in the hope that it will be useful, --
+-- but WITHOUT ANY WARRANTY;  without even the implied warranty of MERCHAN- --
+-- TABILITY or FITNESS FOR A PARTICULAR PURPOSE.                            --
+--                                                                          --
+-- As a special exception under Section 7 of GPL version 3, you are granted --
+-- additional permissions described in the GCC Runtime Library Exception,   --
+-- version 3.1, as published by the Free Software Foundation.               --
+--                                                                          --
+-- You should have received a copy of the GNU General Public License and    --
+-- a copy of the GCC Runtime Library Exception along with this program;     --
+-- see the files COPYING3 and COPYING.RUNTIME respectively.  If not, see    --
+-- <http://www.gnu.org/licenses/>.                                          --
+--                                                                          --
+------------------------------------------------------------------------------
+
+pragma Ada_2012;
+with Ada.Unchecked_Deallocation;
+with System;                 use System;
+
+package body Conts.Maps.Ordered is
+
+   Min_Keys : constant Natural := Node_Capacity / 2;
+   --  Minimum number of keys in all nodes except the root. Merging two
+   --  siblings that have Min_Keys - 1 and Min_Keys keys (and the separator
+   --  between them for inner nodes) always fits in a single node.
+
+   procedure Free is new Ada.Unchecked_Deallocation (Node, Node_Access);
+
+   function Copy_Key (K : Keys.Stored_Type) return Keys.Stored_Type
+     is (if Keys.Copyable then K else Keys.Copy (K)) with Inline;
+
+   function Lower_Bound (N : Node; Key : Key_Type) return Positive
+     with Inline;
+   --  The index of the first key in N greater than or equal to Key, or
+   --  N.Count + 1 if there is none.
+
+   function Child_Index (N : Node; Key : Key_Type) return Positive
+     with Inline;
+   --  The index of the child of the inner node N that might contain Key
+
+   function Find_Leaf
+     (Self : Base_Map'Class; Key : Key_Type) return Node_Access;
+   --  The leaf that might contain Key, or null if the map is empty
+
+   function Next (Position : Cursor) return Cursor with Inline;
+   function Previous (Position : Cursor) return Cursor with Inline;
+   --  Move to the next or previous key
+
+   procedure Insert
+     (N         : Node_Access;
+      Key       : Key_Type;
+      Value     : Element_Type;
+      Inserted  : out Boolean;
+      Split     : out Node_Access;
+      Separator : out Keys.Stored_Type);
+   --  Insert or replace Key in the subtree rooted at N.
+   --  Inserted is False if Key was already in the map.
+   --  If N had to be split, Split is the new node to insert just after N in
+   --  the parent node, and Separator is the key that separates them. It
+   --  is then owned by the parent.
+
+   procedure Remove
+     (N       : Node_Access;
+      Key     : Key_Type;
+      Removed : out Boolean);
+   --  Remove Key from the subtree rooted at N. This might leave N with fewer
+   --  than Min_Keys keys, which must be fixed by the caller.
+
+   procedure Rebalance (Parent : Node_Access; Index : Positive);
+   --  Fix the child Index of Parent, which has fewer than Min_Keys keys, by
+   --  either moving one key from one of its siblings, or merging it with one
+   --  of them.
+
+   procedure Merge (Parent : Node_Access; Index : Positive);
+   --  Merge the child Index + 1 of Parent into the child Index
+
+   procedure Free_Node (N : in out Node_Access);
+   --  Free N and all its children, and release all keys and elements
+
+   function Copy_Node
+     (N         : Node_Access;
+      Prev_Leaf : in out Node_Access) return Node_Access;
+   --  Return a deep copy of N. Prev_Leaf is the last leaf copied so far,
+   --  which is linked to the new leaves.
+
+   -----------------
+   -- Lower_Bound --
+   -----------------
+
+   function Lower_Bound (N : Node; Key : Key_Type) return Positive is
+      Low  : Positive := 1;
+      High : Positive := N.Count + 1;
+      Mid  : Positive;
+   begin
+      while Low < High loop
+         Mid := (Low + High) / 2;
+         if N.Key (Mid) < Key then
+            Low := Mid + 1;
+         else
+            High := Mid;
+         end if;
+      end loop;
+      return Low;
+   end Lower_Bound;
+
+   -----------------
+   -- Child_Index --
+   -----------------
+
+   function Child_Index (N : Node; Key : Key_Type) return Positive is
+      Low  : Positive := 1;
+      High : Positive := N.Count + 1;
+      Mid  : Positive;
+   begin
+      while Low < High loop
+         Mid := (Low + High) / 2;
+         if Key < N.Key (Mid) then
+            High := Mid;
+         else
+            Low := Mid + 1;
+         end if;
+      end loop;
+      return Low;
+   end Child_Index;
+
+   ---------------
+   -- Find_Leaf --
+   ---------------
+
+   function Find_Leaf
+     (Self : Base_Map'Class; Key : Key_Type) return Node_Access
+   is
+      N : Node_Access := Self.Root;
+   begin
+      if N /= null then
+         while not N.Is_Leaf loop
+            N := N.Child (Child_Index (N.all, Key));
+         end loop;
+      end if;
+      return N;
+   end Find_Leaf;
+
+   ------------
+   -- Insert --
+   ------------
+
+   procedure Insert
+     (N         : Node_Access;
+      Key       : Key_Type;
+      Value     : Element_Type;
+      Inserted  : out Boolean;
+      Split     : out Node_Access;
+      Separator : out Keys.Stored_Type)
+   is
+      Last : constant Positive := Node_Capacity + 1;
+      I    : Positive;
+   begin
+      Split := null;
+
+      if N.Is_Leaf then
+         I := Lower_Bound (N.all, Key);
+         if I <= N.Count and then not (Key < N.Key (I)) then
+            Elements.Release (N.Value (I));
+            N.Value (I) := Elements.To_Stored (Value);
+            Inserted := False;
+            return;
+         end if;
+
+         Inserted := True;
+
+         if N.Count < Node_Capacity then
+            N.Key (I + 1 .. N.Count + 1) := N.Key (I .. N.Count);
+            N.Value (I + 1 .. N.Count + 1) := N.Value (I .. N.Count);
+            N.Key (I) := Keys.To_Stored (Key);
+            N.Value (I) := Elements.To_Stored (Value);
+            N.Count := N.Count + 1;
+            return;
+         end if;
+
+         --  The leaf is full: split it in two, the first half remains in N
+
+         declare
+            Left    : constant Positive := Last / 2;
+            K       : Key_Array (1 .. Last);
+            V       : Value_Array (1 .. Last);
+         begin
+            K (1 .. I - 1) := N.Key (1 .. I - 1);
+            K (I) := Keys.To_Stored (Key);
+            K (I + 1 .. Last) := N.Key (I .. Node_Capacity);
+            V (1 .. I - 1) := N.Value (1 .. I - 1);
+            V (I) := Elements.To_Stored (Value);
+            V (I + 1 .. Last) := N.Value (I .. Node_Capacity);
+
+            Split := new Node (Is_Leaf => True);
+            Split.Count := Last - Left;
+            Split.Key (1 .. Split.Count) := K (Left + 1 .. Last);
+            Split.Value (1 .. Split.Count) := V (Left + 1 .. Last);
+            N.Count := Left;
+            N.Key (1 .. Left) := K (1 .. Left);
+            N.Value (1 .. Left) := V (1 .. Left);
+
+            Split.Previous := N;
+            Split.Next := N.Next;
+            if N.Next /= null then
+               N.Next.Previous := Split;
+            end if;
+            N.Next := Split;
+
+            Separator := Copy_Key (Split.Key (1));
+         end;
+
+      else
+         I := Child_Index (N.all, Key);
+
+         declare
+            Child_Split : Node_Access;
+            Child_Sep   : Keys.Stored_Type;
+         begin
+            Insert (N.Child (I), Key, Value, Inserted, Child_Split, Child_Sep);
+            if Child_Split = null then
+               return;
+            end if;
+
+            if N.Count < Node_Capacity then
+               N.Key (I + 1 .. N.Count + 1) := N.Key (I .. N.Count);
+               N.Child (I + 2 .. N.Count + 2) :=
+                 N.Child (I + 1 .. N.Count + 1);
+               N.Key (I) := Child_Sep;
+               N.Child (I + 1) := Child_Split;
+               N.Count := N.Count + 1;
+               return;
+            end if;
+
+            --  The node is full: split it in two. The middle key moves up
+            --  to the parent.
+
+            declare
+               Mid : constant Positive := Node_Capacity / 2 + 1;
+               K   : Key_Array (1 .. Last);
+               C   : Child_Array (1 .. Last + 1);
+            begin
+               K (1 .. I - 1) := N.Key (1 .. I - 1);
+               K (I) := Child_Sep;
+               K (I + 1 .. Last) := N.Key (I .. Node_Capacity);
+               C (1 .. I) := N.Child (1 .. I);
+               C (I + 1) := Child_Split;
+               C (I + 2 .. Last + 1) := N.Child (I + 1 .. Last);
+
+               Split := new Node (Is_Leaf => False);
+               Split.Count := Last - Mid;
+               Split.Key (1 .. Split.Count) := K (Mid + 1 .. Last);
+               Split.Child (1 .. Split.Count + 1) := C (Mid + 1 .. Last + 1);
+               N.Count := Mid - 1;
+               N.Key (1 .. Mid - 1) := K (1 .. Mid - 1);
+               N.Child (1 .. Mid) := C (1 .. Mid);
+
+               Separator := K (Mid);
+            end;
+         end;
+      end if;
+   end Insert;
+
+   ---------
+   -- Set --
+   ---------
+
+   procedure Set
+     (Self     : in out Base_Map'Class;
+      Key      : Keys.Element_Type;
+      Value    : Elements.Element_Type)
+   is
+      Inserted  : Boolean;
+      Split     : Node_Access;
+      Separator : Keys.Stored_Type;
+      Root      : Node_Access;
+   begin
+      if Self.Root = null then
+         Self.Root := new Node (Is_Leaf => True);
+      end if;
+
+      Insert (Self.Root, Key, Value, Inserted, Split, Separator);
+
+      if Split /= null then
+         Root := new Node (Is_Leaf => False);
+         Root.Count := 1;
+         Root.Key (1) := Separator;
+         Root.Child (1) := Self.Root;
+         Root.Child (2) := Split;
+         Self.Root := Root;
+      end if;
+
+      if Inserted then
+         Self.Count := Self.Count + 1;
+      end if;
+   end Set;
+
+   -----------
+   -- Merge --
+   -----------
+
+   procedure Merge (Parent : Node_Access; Index : Positive) is
+      Left  : constant Node_Access := Parent.Child (Index);
+      Right : Node_Access := Parent.Child (Index + 1);
+      L     : constant Natural := Left.Count;
+      R     : constant Natural := Right.Count;
+   begin
+      if Left.Is_Leaf then
+         Left.Key (L + 1 .. L + R) := Right.Key (1 .. R);
+         Left.Value (L + 1 .. L + R) := Right.Value (1 .. R);
+         Left.Count := L + R;
+         Left.Next := Right.Next;
+         if Right.Next /= null then
+            Right.Next.Previous := Left;
+         end if;
+         Keys.Release (Parent.Key (Index));
+      else
+         Left.Key (L + 1) := Parent.Key (Index);
+         Left.Key (L + 2 .. L + R + 1) := Right.Key (1 .. R);
+         Left.Child (L + 2 .. L + R + 2) := Right.Child (1 .. R + 1);
+         Left.Count := L + R + 1;
+      end if;
+
+      Parent.Key (Index .. Parent.Count - 1) :=
+        Parent.Key (Index + 1 .. Parent.Count);
+      Parent.Child (Index + 1 .. Parent.Count) :=
+        Parent.Child (Index + 2 .. Parent.Count + 1);
+      Parent.Count := Parent.Count - 1;
+
+      Free (Right);
+   end Merge;
+
+   ---------------
+   -- Rebalance --
+   ---------------
+
+   procedure Rebalance (Parent : Node_Access; Index : Positive) is
+      N       : constant Node_Access := Parent.Child (Index);
+      Sibling : Node_Access;
+   begin
+      if Index > 1 and then Parent.Child (Index - 1).Count > Min_Keys then
+         --  Move the last key of the left sibling
+
+         Sibling := Parent.Child (Index - 1);
+         N.Key (2 .. N.Count + 1) := N.Key (1 .. N.Count);
+
+         if N.Is_Leaf then
+            N.Value (2 .. N.Count + 1) := N.Value (1 .. N.Count);
+            N.Key (1) := Sibling.Key (Sibling.Count);
+            N.Value (1) := Sibling.Value (Sibling.Count);
+            Keys.Release (Parent.Key (Index - 1));
+            Parent.Key (Index - 1) := Copy_Key (N.Key (1));
+         else
+            N.Child (2 .. N.Count + 2) := N.Child (1 .. N.Count + 1);
+            N.Key (1) := Parent.Key (Index - 1);
+            N.Child (1) := Sibling.Child (Sibling.Count + 1);
+            Parent.Key (Index - 1) := Sibling.Key (Sibling.Count);
+         end if;
+
+         N.Count := N.Count + 1;
+         Sibling.Count := Sibling.Count - 1;
+
+      elsif Index <= Parent.Count
+        and then Parent.Child (Index + 1).Count > Min_Keys
+      then
+         --  Move the first key of the right sibling
+
+         Sibling := Parent.Child (Index + 1);
+
+         if N.Is_Leaf then
+            N.Key (N.Count + 1) := Sibling.Key (1);
+            N.Value (N.Count + 1) := Sibling.Value (1);
+            Sibling.Value (1 .. Sibling.Count - 1) :=
+              Sibling.Value (2 .. Sibling.Count);
+            Sibling.Key (1 .. Sibling.Count - 1) :=
+              Sibling.Key (2 .. Sibling.Count);
+            Keys.Release (Parent.Key (Index));
+            Parent.Key (Index) := Copy_Key (Sibling.Key (1));
+         else
+            N.Key (N.Count + 1) := Parent.Key (Index);
+            N.Child (N.Count + 2) := Sibling.Child (1);
+            Parent.Key (Index) := Sibling.Key (1);
+            Sibling.Key (1 .. Sibling.Count - 1) :=
+              Sibling.Key (2 .. Sibling.Count);
+            Sibling.Child (1 .. Sibling.Count) :=
+              Sibling.Child (2 .. Sibling.Count + 1);
+         end if;
+
+         N.Count := N.Count + 1;
+         Sibling.Count := Sibling.Count - 1;
+
+      elsif Index > 1 then
+         Merge (Parent, Index - 1);
+      else
+         Merge (Parent, Index);
+      end if;
+   end Rebalance;
+
+   ------------
+   -- Remove --
+   ------------
+
+   procedure Remove
+     (N       : Node_Access;
+      Key     : Key_Type;
+      Removed : out Boolean)
+   is
+      I : Positive;
+   begin
+      if N.Is_Leaf then
+         I := Lower_Bound (N.all, Key);
+         Removed := I <= N.Count and then not (Key < N.Key (I));
+         if Removed then
+            Keys.Release (N.Key (I));
+            Elements.Release (N.Value (I));
+            N.Key (I .. N.Count - 1) := N.Key (I + 1 .. N.Count);
+            N.Value (I .. N.Count - 1) := N.Value (I + 1 .. N.Count);
+            N.Count := N.Count - 1;
+         end if;
+
+         --  The separators in the parent nodes do not need to be updated:
+         --  they remain greater than all keys on their left, and less than
+         --  or equal to all keys on their right.
+
+      else
+         I := Child_Index (N.all, Key);
+         Remove (N.Child (I), Key, Removed);
+         if Removed and then N.Child (I).Count < Min_Keys then
+            Rebalance (N, I);
+         end if;
+      end if;
+   end Remove;
+
+   ------------
+   -- Delete --
+   ------------
+
+   procedure Delete
+     (Self     : in out Base_Map'Class;
+      Key      : Keys.Element_Type)
+   is
+      Removed : Boolean;
+      Old     : Node_Access;
+   begin
+      if Self.Root = null then
+         return;
+      end if;
+
+      Remove (Self.Root, Key, Removed);
+
+      if Removed then
+         Self.Count := Self.Count - 1;
+
+         if Self.Root.Count = 0 then
+            Old := Self.Root;
+            if Old.Is_Leaf then
+               Self.Root := null;
+            else
+               Self.Root := Old.Child (1);
+            end if;
+            Free (Old);
+         end if;
+      end if;
+   end Delete;
+
+   ---------------
+   -- Free_Node --
+   ---------------
+
+   procedure Free_Node (N : in out Node_Access) is
+   begin
+      for K in 1 .. N.Count loop
+         Keys.Release (N.Key (K));
+      end loop;
+
+      if N.Is_Leaf then
+         for V in 1 .. N.Count loop
+            Elements.Release (N.Value (V));
+         end loop;
+      else
+         for C in 1 .. N.Count + 1 loop
+            Free_Node (N.Child (C));
+         end loop;
+      end if;
+
+      Free (N);
+   end Free_Node;
+
+   -----------
+   -- Clear --
+   -----------
+
+   procedure Clear (Self : in out Base_Map'Class) is
+   begin
+      if Self.Root /= null then
+         Free_Node (Self.Root);
+      end if;
+      Self.Count := 0;
+   end Clear;
+
+   ---------------
+   -- Copy_Node --
+   ---------------
+
+   function Copy_Node
+     (N         : Node_Access;
+      Prev_Leaf : in out Node_Access) return Node_Access
+   is
+      Result : constant Node_Access := new Node (Is_Leaf => N.Is_Leaf);
+   begin
+      Result.Count := N.Count;
+
+      if Keys.Copyable then
+         Result.Key (1 .. N.Count) := N.Key (1 .. N.Count);
+      else
+         for K in 1 .. N.Count loop
+            Result.Key (K) := Keys.Copy (N.Key (K));
+         end loop;
+      end if;
+
+      if N.Is_Leaf then
+         if Elements.Copyable then
+            Result.Value (1 .. N.Count) := N.Value (1 .. N.Count);
+         else
+            for V in 1 .. N.Count loop
+               Result.Value (V) := Elements.Copy (N.Value (V));
+            end loop;
+         end if;
+
+         Result.Previous := Prev_Leaf;
+         if Prev_Leaf /= null then
+            Prev_Leaf.Next := Result;
+         end if;
+         Prev_Leaf := Result;
+
+      else
+         for C in 1 .. N.Count + 1 loop
+            Result.Child (C) := Copy_Node (N.Child (C), Prev_Leaf);
+         end loop;
+      end if;
+
+      return Result;
+   end Copy_Node;
+
+   ------------
+   -- Adjust --
+   ------------
+
+   procedure Adjust (Self : in out Base_Map) is
+      Prev_Leaf : Node_Access;
+   begin
+      if Self.Root /= null then
+         Self.Root := Copy_Node (Self.Root, Prev_Leaf);
+      end if;
+   end Adjust;
+
+   --------------
+   -- Finalize --
+   --------------
+
+   procedure Finalize (Self : in out Base_Map) is
+   begin
+      Clear (Self);
+   end Finalize;
+
+   ------------
+   -- Assign --
+   ------------
+
+   procedure Assign
+     (Self : in out Base_Map'Class; Source : Base_Map'Class)
+   is
+      Prev_Leaf : Node_Access;
+   begin
+      if Self'Address = Source'Address then
+         return;
+      end if;
+
+      Clear (Self);
+      if Source.Root /= null then
+         Self.Root := Copy_Node (Source.Root, Prev_Leaf);
+      end if;
+      Self.Count := Source.Count;
+   end Assign;
+
+   ---------
+   -- Get --
+   ---------
+
+   function Get
+     (Self     : Base_Map'Class;
+      Key      : Keys.Element_Type)
+      return Elements.Constant_Returned_Type
+   is
+      Position : constant Cursor := Find (Self, Key);
+   begin
+      if Position.Leaf = null then
+         raise Constraint_Error with "Key not in map";
+      end if;
+      return Elements.To_Constant_Returned
+        (Position.Leaf.Value (Position.Index));
+   end Get;
+
+   --------------
+   -- Contains --
+   --------------
+
+   function Contains
+     (Self     : Base_Map'Class;
+      Key      : Keys.Element_Type) return Boolean is
+   begin
+      return Find (Self, Key).Leaf /= null;
+   end Contains;
+
+   ----------
+   -- Find --
+   ----------
+
+   function Find
+     (Self : Base_Map'Class; Key : Keys.Element_Type) return Cursor
+   is
+      Leaf : constant Node_Access := Find_Leaf (Self, Key);
+      I    : Positive;
+   begin
+      if Leaf /= null then
+         I := Lower_Bound (Leaf.all, Key);
+         if I <= Leaf.Count and then not (Key < Leaf.Key (I)) then
+            return (Leaf => Leaf, Index => I);
+         end if;
+      end if;
+      return No_Element;
+   end Find;
+
+   -----------
+   -- Floor --
+   -----------
+
+   function Floor
+     (Self : Base_Map'Class; Key : Keys.Element_Type) return Cursor
+   is
+      Leaf : constant Node_Access := Find_Leaf (Self, Key);
+      I    : Positive;
+   begin
+      if Leaf = null then
+         return No_Element;
+      end if;
+
+      I := Lower_Bound (Leaf.all, Key);
+      if I <= Leaf.Count and then not (Key < Leaf.Key (I)) then
+         return (Leaf => Leaf, Index => I);
+      end if;
+
+      --  All keys before I are less than Key. If there are none, the
+      --  largest such key is the last one in the previous leaf.
+
+      return Previous ((Leaf => Leaf, Index => I));
+   end Floor;
+
+   -------------
+   -- Ceiling --
+   -------------
+
+   function Ceiling
+     (Self : Base_Map'Class; Key : Keys.Element_Type) return Cursor
+   is
+      Leaf : constant Node_Access := Find_Leaf (Self, Key);
+      I    : Positive;
+   begin
+      if Leaf = null then
+         return No_Element;
+      end if;
+
+      I := Lower_Bound (Leaf.all, Key);
+      if I <= Leaf.Count then
+         return (Leaf => Leaf, Index => I);
+      end if;
+
+      --  All keys in the leaf are less than Key, so the first key greater
+      --  than Key is the first one in the next leaf.
+
+      return Next ((Leaf => Leaf, Index => Leaf.Count));
+   end Ceiling;
+
+   -----------
+   -- First --
+   -----------
+
+   function First (Self : Base_Map'Class) return Cursor is
+      N : Node_Access := Self.Root;
+   begin
+      if N = null then
+         return No_Element;
+      end if;
+
+      while not N.Is_Leaf loop
+         N := N.Child (1);
+      end loop;
+      return (Leaf => N, Index => 1);
+   end First;
+
+   ----------
+   -- Last --
+   ----------
+
+   function Last (Self : Base_Map'Class) return Cursor is
+      N : Node_Access := Self.Root;
+   begin
+      if N = null then
+         return No_Element;
+      end if;
+
+      while not N.Is_Leaf loop
+         N := N.Child (N.Count + 1);
+      end loop;
+      return (Leaf => N, Index => N.Count);
+   end Last;
+
+   ----------
+   -- Next --
+   ----------
+
+   function Next (Position : Cursor) return Cursor is
+   begin
+      if Position.Index < Position.Leaf.Count then
+         return (Leaf => Position.Leaf, Index => Position.Index + 1);
+      elsif Position.Leaf.Next /= null then
+         return (Leaf => Position.Leaf.Next, Index => 1);
+      else
+         return No_Element;
+      end if;
+   end Next;
+
+   --------------
+   -- Previous --
+   --------------
+
+   function Previous (Position : Cursor) return Cursor is
+   begin
+      if Position.Index > 1 then
+         return (Leaf => Position.Leaf, Index => Position.Index - 1);
+      elsif Position.Leaf.Previous /= null then
+         return (Leaf  => Position.Leaf.Previous,
+                 Index => Position.Leaf.Previous.Count);
+      else
+         return No_Element;
+      end if;
+   end Previous;
+
+   ----------
+   -- Next --
+   ----------
+
+   function Next
+     (Self : Base_Map'Class; Position : Cursor) return Cursor
+   is
+      pragma Unreferenced (Self);
+   begin
+      return Next (Position);
+   end Next;
+
+   --------------
+   -- Previous --
+   --------------
+
+   function Previous
+     (Self : Base_Map'Class; Position : Cursor) return Cursor
+   is
+      pragma Unreferenced (Self);
+   begin
+      return Previous (Position);
+   end Previous;
+
+   -----------------
+   -- Has_Element --
+   -----------------
+
+   function Has_Element
+     (Self : Base_Map'Class; Position : Cursor) return Boolean
+   is
+      pragma Unreferenced (Self);
+   begin
+      return Position.Leaf /= null;
+   end Has_Element;
+
+   ---------
+   -- Key --
+   ---------
+
+   function Key
+     (Self : Base_Map'Class; Position : Cursor)
+     return Constant_Returned_Key_Type
+   is
+      pragma Unreferenced (Self);
+   begin
+      return Keys.To_Constant_Returned (Position.Leaf.Key (Position.Index));
+   end Key;
+
+   -------------
+   -- Element --
+   -------------
+
+   function Element
+     (Self : Base_Map'Class; Position : Cursor) return Constant_Returned_Type
+   is
+      pragma Unreferenced (Self);
+   begin
+      return Elements.To_Constant_Returned
+        (Position.Leaf.Value (Position.Index));
+   end Element;
+
+   -------------
+   -- Between --
+   -------------
+
+   function Between
+     (Self      : Base_Map'Class;
+      Low, High : Keys.Element_Type) return Key_Range
+   is
+      First : constant Cursor := Ceiling (Self, Low);
+      Last  : constant Cursor := Floor (Self, High);
+   begin
+      --  The range is empty when there is no key in Low .. High, in which
+      --  case Last is before First (or one of them is No_Element).
+
+      if First.Leaf = null
+        or else Last.Leaf = null
+        or else High < First.Leaf.Key (First.Index)
+      then
+         return (First => No_Element, Last => No_Element);
+      end if;
+      return (First => First, Last => Last);
+   end Between;
+
+   -------------------
+   -- Next_In_Range --
+   -------------------
+
+   function Next_In_Range
+     (Self : Key_Range; Position : Cursor) return Cursor is
+   begin
+      if Position = Self.Last then
+         return No_Element;
+      end if;
+      return Next (Position);
+   end Next_In_Range;
+
+   --------------------------
+   -- Has_Element_In_Range --
+   --------------------------
+
+   function Has_Element_In_Range
+     (Self : Key_Range; Position : Cursor) return Boolean
+   is
+      pragma Unreferenced (Self);
+   begin
+      return Position.Leaf /= null;
+   end Has_Element_In_Range;
+
+end Conts.Maps.Ordered;
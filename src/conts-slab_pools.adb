@@ -0,0 +1,180 @@
+------------------------------------------------------------------------------
+--                     Copyright (C) 2016, AdaCore                          --
+--                                                                          --
+-- This library is free software;  you can redistribute it and/or modify it --
+-- under terms of the  GNU General Public License  as published by the Free --
+-- Software  Foundation;  either version 3,  or (at your  option) any later --
+-- version. This library is distributed in the hope that it will be useful, --
+-- but WITHOUT ANY WARRANTY;  without even the implied warranty of MERCHAN- --
+-- TABILITY or FITNESS FOR A PARTICULAR PURPOSE.                            --
+--                                                                          --
+-- As a special exception under Section 7 of GPL version 3, you are granted --
+-- additional permissions described in the GCC Runtime Library Exception,   --
+-- version 3.1, as published by the Free Software Foundation.               --
+--                                                                          --
+-- You should have received a copy of the GNU General Public License and    --
+-- a copy of the GCC Runtime Library Exception along with this program;     --
+-- see the files COPYING3 and COPYING.RUNTIME respectively.  If not, see    --
+-- <http://www.gnu.org/licenses/>.                                          --
+--                                                                          --
+------------------------------------------------------------------------------
+
+pragma Ada_2012;
+with Ada.Unchecked_Conversion;
+with System.Memory;
+
+package body Conts.Slab_Pools is
+
+   type Address_Access is access all System.Address;
+   pragma Warnings (Off);  --  no aliasing issue
+   function To_Access is new Ada.Unchecked_Conversion
+     (System.Address, Address_Access);
+   pragma Warnings (On);
+
+   function Use_Slab
+     (Size, Alignment : Storage_Count) return Boolean
+     is (Size <= Max_Block_Size and then Alignment <= Granularity)
+     with Inline;
+   --  Whether the block is allocated from the chunks
+
+   function Class_Of (Size : Storage_Count) return Size_Class
+     is (Size_Class
+           (Storage_Count'Max (1, (Size + Granularity - 1) / Granularity)))
+     with Inline;
+   --  The size class for a block
+
+   procedure Release_Chunks (Data : in out Class_Data);
+   --  Free all chunks for a size class
+
+   --------------------
+   -- Release_Chunks --
+   --------------------
+
+   procedure Release_Chunks (Data : in out Class_Data) is
+      C    : System.Address := Data.Chunks;
+      Next : System.Address;
+   begin
+      while C /= System.Null_Address loop
+         Next := To_Access (C).all;
+         System.Memory.Free (C);
+         C := Next;
+      end loop;
+      Data := (others => <>);
+   end Release_Chunks;
+
+   --------------
+   -- Allocate --
+   --------------
+
+   overriding procedure Allocate
+     (Pool                     : in out Slab_Pool;
+      Storage_Address          : out System.Address;
+      Size_In_Storage_Elements : Storage_Count;
+      Alignment                : Storage_Count)
+   is
+      Chunk : System.Address;
+   begin
+      if not Use_Slab (Size_In_Storage_Elements, Alignment) then
+         Storage_Address := System.Memory.Alloc
+           (System.Memory.size_t (Size_In_Storage_Elements));
+         return;
+      end if;
+
+      declare
+         C    : constant Size_Class := Class_Of (Size_In_Storage_Elements);
+         Data : Class_Data renames Pool.Classes (C);
+         Size : constant Storage_Offset := Storage_Offset (C) * Granularity;
+      begin
+         if Data.Free /= System.Null_Address then
+            Storage_Address := Data.Free;
+            Data.Free := To_Access (Data.Free).all;
+
+         else
+            if Data.Next = System.Null_Address
+              or else Data.Next + Size > Data.Last
+            then
+               Chunk := System.Memory.Alloc (Chunk_Size);
+               To_Access (Chunk).all := Data.Chunks;
+               Data.Chunks := Chunk;
+               Data.Next   := Chunk + Granularity;
+               Data.Last   := Chunk + Chunk_Size;
+            end if;
+
+            Storage_Address := Data.Next;
+            Data.Next := Data.Next + Size;
+         end if;
+
+         Data.In_Use := Data.In_Use + 1;
+      end;
+   end Allocate;
+
+   ----------------
+   -- Deallocate --
+   ----------------
+
+   overriding procedure Deallocate
+     (Pool                     : in out Slab_Pool;
+      Storage_Address          : System.Address;
+      Size_In_Storage_Elements : Storage_Count;
+      Alignment                : Storage_Count) is
+   begin
+      if not Use_Slab (Size_In_Storage_Elements, Alignment) then
+         System.Memory.Free (Storage_Address);
+         return;
+      end if;
+
+      declare
+         Data : Class_Data renames
+           Pool.Classes (Class_Of (Size_In_Storage_Elements));
+         C, Next : System.Address;
+      begin
+         Data.In_Use := Data.In_Use - 1;
+
+         if Data.In_Use = 0 then
+            --  Return all chunks but the last one to the system, and
+            --  start again from the beginning of that one, so that a list
+            --  that is cleared and filled again does not call malloc for
+            --  its first nodes.
+            C := To_Access (Data.Chunks).all;
+            while C /= System.Null_Address loop
+               Next := To_Access (C).all;
+               System.Memory.Free (C);
+               C := Next;
+            end loop;
+
+            To_Access (Data.Chunks).all := System.Null_Address;
+            Data.Free := System.Null_Address;
+            Data.Next := Data.Chunks + Granularity;
+            Data.Last := Data.Chunks + Chunk_Size;
+         else
+            To_Access (Storage_Address).all := Data.Free;
+            Data.Free := Storage_Address;
+         end if;
+      end;
+   end Deallocate;
+
+   -----------
+   -- Reset --
+   -----------
+
+   procedure Reset (Pool : in out Slab_Pool) is
+   begin
+      for Data of Pool.Classes loop
+         if Data.In_Use = 0 then
+            Release_Chunks (Data);
+         end if;
+      end loop;
+   end Reset;
+
+   --------------
+   -- Finalize --
+   --------------
+
+   overriding procedure Finalize (Pool : in out Slab_Pool) is
+   begin
+      for Data of Pool.Classes loop
+         Release_Chunks (Data);
+      end loop;
+   end Finalize;
+
+end Conts.Slab_Pools;
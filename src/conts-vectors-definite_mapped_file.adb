@@ -0,0 +1,59 @@
+------------------------------------------------------------------------------
+--                     Copyright (C) 2016, AdaCore                          --
+--                                                                          --
+-- This library is free software;  you can redistribute it and/or modify it --
+-- under terms of the  GNU General Public License  as published by the Free --
+-- Software  Foundation;  either version 3,  or (at your  option) any later --
+-- version. This library is distributed in the hope that it will be useful, --
+-- but WITHOUT ANY WARRANTY;  without even the implied warranty of MERCHAN- --
+-- TABILITY or FITNESS FOR A PARTICULAR PURPOSE.                            --
+--                                                                          --
+-- As a special exception under Section 7 of GPL version 3, you are granted --
+-- additional permissions described in the GCC Runtime Library Exception,   --
+-- version 3.1, as published by the Free Software Foundation.               --
+--                                                                          --
+-- You should have received a copy of the GNU General Public License and    --
+-- a copy of the GCC Runtime Library Exception along with this program;     --
+-- see the files COPYING3 and COPYING.RUNTIME respectively.  If not, see    --
+-- <http://www.gnu.org/licenses/>.                                          --
+--                                                                          --
+------------------------------------------------------------------------------
+
+pragma Ada_2012;
+
+package body Conts.Vectors.Definite_Mapped_File is
+
+   ----------
+   -- Open --
+   ----------
+
+   procedure Open (Self : in out Vector'Class; File_Name : String) is
+      Length : Count_Type;
+   begin
+      Close (Self);
+      Storage.Impl.Open (Self, File_Name, Length);
+      Vectors.Impl.Set_Length_Unchecked (Self, Length);
+   end Open;
+
+   -----------
+   -- Close --
+   -----------
+
+   procedure Close (Self : in out Vector'Class) is
+   begin
+      --  Definite elements need not be released. The file is closed first,
+      --  so that its length is not reset.
+      Storage.Impl.Release (Self);
+      Vectors.Impl.Set_Length_Unchecked (Self, 0);
+   end Close;
+
+   ----------
+   -- Sync --
+   ----------
+
+   procedure Sync (Self : in out Vector'Class) is
+   begin
+      Storage.Impl.Sync (Self, Self.Length);
+   end Sync;
+
+end Conts.Vectors.Definite_Mapped_File;
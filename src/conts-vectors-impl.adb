@@ -27,6 +27,21 @@ package body Conts.Vectors.Impl with SPARK_Mode => Off is
    pragma Assertion_Policy
       (Pre => Suppressible, Ghost => Suppressible, Post => Ignore);
 
+   procedure Set_Last (Self : in out Base_Vector'Class; Last : Count_Type)
+     with Inline;
+   --  Change the index of the last element of Self, and let the storage
+   --  record the new length.
+
+   --------------
+   -- Set_Last --
+   --------------
+
+   procedure Set_Last (Self : in out Base_Vector'Class; Last : Count_Type) is
+   begin
+      Self.Last := Last;
+      Storage.Set_Length (Self, Last - Min_Index + 1);
+   end Set_Last;
+
    -----------
    -- Model --
    -----------
@@ -119,6 +134,16 @@ package body Conts.Vectors.Impl with SPARK_Mode => Off is
       Storage.Resize (Self, Self.Last, Self.Last, Force => True);
    end Shrink_To_Fit;
 
+   --------------------------
+   -- Set_Length_Unchecked --
+   --------------------------
+
+   procedure Set_Length_Unchecked
+     (Self : in out Base_Vector'Class; Length : Count_Type) is
+   begin
+      Set_Last (Self, Length + Min_Index - 1);
+   end Set_Length_Unchecked;
+
    ------------
    -- Resize --
    ------------
@@ -134,7 +159,7 @@ package body Conts.Vectors.Impl with SPARK_Mode => Off is
          for J in Length + 1 .. Old_L loop
             Storage.Release_Element (Self, J);
          end loop;
-         Self.Last := Length;
+         Set_Last (Self, Length);
 
       elsif Length > Old_L then
          Self.Append (Element, Count => Length - Old_L);
@@ -170,7 +195,7 @@ package body Conts.Vectors.Impl with SPARK_Mode => Off is
            (Self, L + J, Storage.Elements.To_Stored (Element));
       end loop;
 
-      Self.Last := Self.Last + Count;
+      Set_Last (Self, Self.Last + Count);
    end Append;
 
    ------------
@@ -206,7 +231,7 @@ package body Conts.Vectors.Impl with SPARK_Mode => Off is
                  (Self, J, Storage.Elements.To_Stored (Element));
             end loop;
 
-            Self.Last := Self.Last + Count;
+            Set_Last (Self, Self.Last + Count);
          end;
       end if;
    end Insert;
@@ -224,7 +249,7 @@ package body Conts.Vectors.Impl with SPARK_Mode => Off is
 
       --  Deallocate all memory
       Storage.Resize (Self, 0, L, Force => True);
-      Self.Last := No_Last;
+      Set_Last (Self, No_Last);
    end Clear;
 
    ------------
@@ -250,7 +275,7 @@ package body Conts.Vectors.Impl with SPARK_Mode => Off is
          Source_To    => Self.Last,
          Self_From    => Idx);
 
-      Self.Last := Self.Last - Actual;
+      Set_Last (Self, Self.Last - Actual);
    end Delete;
 
    -----------------
@@ -260,7 +285,7 @@ package body Conts.Vectors.Impl with SPARK_Mode => Off is
    procedure Delete_Last (Self : in out Base_Vector'Class) is
    begin
       Storage.Release_Element (Self, Self.Last);
-      Self.Last := Self.Last - 1;
+      Set_Last (Self, Self.Last - 1);
    end Delete_Last;
 
    ------------------
@@ -282,7 +307,7 @@ package body Conts.Vectors.Impl with SPARK_Mode => Off is
      (Self : in out Base_Vector'Class; Source : Base_Vector'Class) is
    begin
       Storage.Assign (Self, Source, Last => Source.Last);
-      Self.Last := Source.Last;
+      Set_Last (Self, Source.Last);
    end Assign;
 
    ------------
@@ -300,7 +325,14 @@ package body Conts.Vectors.Impl with SPARK_Mode => Off is
 
    procedure Finalize (Self : in out Base_Vector) is
    begin
-      Clear (Self);
+      for J in Min_Index .. Self.Last loop
+         Storage.Release_Element (Self, J);
+      end loop;
+
+      --  Unlike Clear, do not record the new length, so that storages
+      --  which save their elements keep them.
+      Storage.Release (Self);
+      Self.Last := No_Last;
    end Finalize;
 
    -------------
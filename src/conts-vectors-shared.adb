@@ -0,0 +1,140 @@
+------------------------------------------------------------------------------
+--                     Copyright (C) 2016, AdaCore                          --
+--                                                                          --
+-- This library is free software;  you can redistribute it and/or modify it --
+-- under terms of the  GNU General Public License  as published by the Free --
+-- Software  Foundation;  either version 3,  or (at your  option) any later --
+-- version. This library is distributed in the hope that it will be useful, --
+-- but WITHOUT ANY WARRANTY;  without even the implied warranty of MERCHAN- --
+-- TABILITY or FITNESS FOR A PARTICULAR PURPOSE.                            --
+--                                                                          --
+-- As a special exception under Section 7 of GPL version 3, you are granted --
+-- additional permissions described in the GCC Runtime Library Exception,   --
+-- version 3.1, as published by the Free Software Foundation.               --
+--                                                                          --
+-- You should have received a copy of the GNU General Public License and    --
+-- a copy of the GCC Runtime Library Exception along with this program;     --
+-- see the files COPYING3 and COPYING.RUNTIME respectively.  If not, see    --
+-- <http://www.gnu.org/licenses/>.                                          --
+--                                                                          --
+------------------------------------------------------------------------------
+
+pragma Ada_2012;
+with Ada.Unchecked_Deallocation;
+
+package body Conts.Vectors.Shared is
+
+   use System.Atomic_Counters;
+
+   Empty : aliased Vectors.Vector;
+   --  Returned by Read for vectors that have no data
+
+   procedure Unchecked_Free is new Ada.Unchecked_Deallocation
+     (Shared_Data, Shared_Data_Access);
+
+   procedure Release (Shared : in out Shared_Data_Access);
+   --  Stop sharing Shared, and free it if it was the last reference
+
+   -------------
+   -- Release --
+   -------------
+
+   procedure Release (Shared : in out Shared_Data_Access) is
+   begin
+      if Shared /= null then
+         if Decrement (Shared.Count) then
+            Vectors.Clear (Shared.Data);
+            Unchecked_Free (Shared);
+         else
+            Shared := null;
+         end if;
+      end if;
+   end Release;
+
+   ----------
+   -- Read --
+   ----------
+
+   function Read (Self : Vector'Class) return Constant_Reference_Type is
+   begin
+      if Self.Shared = null then
+         return (Contents => Empty'Access);
+      else
+         return (Contents => Self.Shared.Data'Access);
+      end if;
+   end Read;
+
+   -----------
+   -- Write --
+   -----------
+
+   function Write (Self : in out Vector'Class) return Reference_Type is
+      Old : Shared_Data_Access;
+   begin
+      if Self.Shared = null then
+         Self.Shared := new Shared_Data;
+
+      elsif not Is_One (Self.Shared.Count) then
+         --  Detach from the other vectors
+
+         Old := Self.Shared;
+         Self.Shared := new Shared_Data;
+         Vectors.Assign (Self.Shared.Data, Old.Data);
+         Release (Old);
+      end if;
+
+      return (Contents => Self.Shared.Data'Access);
+   end Write;
+
+   ------------
+   -- Length --
+   ------------
+
+   function Length (Self : Vector'Class) return Count_Type is
+   begin
+      if Self.Shared = null then
+         return 0;
+      else
+         return Vectors.Length (Self.Shared.Data);
+      end if;
+   end Length;
+
+   ---------------
+   -- Is_Shared --
+   ---------------
+
+   function Is_Shared (Self : Vector'Class) return Boolean is
+   begin
+      return Self.Shared /= null and then not Is_One (Self.Shared.Count);
+   end Is_Shared;
+
+   -----------
+   -- Clear --
+   -----------
+
+   procedure Clear (Self : in out Vector'Class) is
+   begin
+      Release (Self.Shared);
+   end Clear;
+
+   ------------
+   -- Adjust --
+   ------------
+
+   overriding procedure Adjust (Self : in out Vector) is
+   begin
+      if Self.Shared /= null then
+         Increment (Self.Shared.Count);
+      end if;
+   end Adjust;
+
+   --------------
+   -- Finalize --
+   --------------
+
+   overriding procedure Finalize (Self : in out Vector) is
+   begin
+      Release (Self.Shared);
+   end Finalize;
+
+end Conts.Vectors.Shared;
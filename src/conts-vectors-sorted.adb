@@ -0,0 +1,136 @@
+------------------------------------------------------------------------------
+--                     Copyright (C) 2016, AdaCore                          --
+--                                                                          --
+-- This library is free software;  you can redistribute it and/or modify it --
+-- under terms of the  GNU General Public License  as published by the Free --
+-- Software  Foundation;  either version 3,  or (at your  option) any later --
+-- version. This library is distributed in the hope that it will be useful, --
+-- but WITHOUT ANY WARRANTY;  without even the implied warranty of MERCHAN- --
+-- TABILITY or FITNESS FOR A PARTICULAR PURPOSE.                            --
+--                                                                          --
+-- As a special exception under Section 7 of GPL version 3, you are granted --
+-- additional permissions described in the GCC Runtime Library Exception,   --
+-- version 3.1, as published by the Free Software Foundation.               --
+--                                                                          --
+-- You should have received a copy of the GNU General Public License and    --
+-- a copy of the GCC Runtime Library Exception along with this program;     --
+-- see the files COPYING3 and COPYING.RUNTIME respectively.  If not, see    --
+-- <http://www.gnu.org/licenses/>.                                          --
+--                                                                          --
+------------------------------------------------------------------------------
+
+pragma Ada_2012;
+with Conts.Algorithms;
+with Conts.Properties;
+
+package body Conts.Vectors.Sorted is
+
+   use type Vectors.Extended_Index;
+
+   function Key_At
+     (Self : Base_Vector'Class; Position : Extended_Index) return Key_Type
+     is (Key (Vectors.As_Element (Self, Position)))
+     with Inline;
+
+   package Keys is new Conts.Properties.Read_Only_Maps
+     (Map_Type     => Base_Vector'Class,
+      Key_Type     => Extended_Index,
+      Element_Type => Key_Type,
+      Get          => Key_At);
+   --  Views the vector as a sequence of keys, for the binary searches
+
+   function Lower is new Conts.Algorithms.Lower_Bound
+     (Vectors.Cursors.Random_Access, Keys, "<");
+   function Upper is new Conts.Algorithms.Upper_Bound
+     (Vectors.Cursors.Random_Access, Keys, "<");
+   function Search is new Conts.Algorithms.Binary_Search
+     (Vectors.Cursors.Random_Access, Keys, "<");
+
+   -----------------
+   -- Lower_Bound --
+   -----------------
+
+   function Lower_Bound
+     (Self : Base_Vector'Class; K : Key_Type) return Extended_Index is
+   begin
+      return Lower (Self, K);
+   end Lower_Bound;
+
+   -----------------
+   -- Upper_Bound --
+   -----------------
+
+   function Upper_Bound
+     (Self : Base_Vector'Class; K : Key_Type) return Extended_Index is
+   begin
+      return Upper (Self, K);
+   end Upper_Bound;
+
+   ----------
+   -- Find --
+   ----------
+
+   function Find
+     (Self : Base_Vector'Class; K : Key_Type) return Extended_Index is
+   begin
+      return Search (Self, K);
+   end Find;
+
+   --------------
+   -- Contains --
+   --------------
+
+   function Contains
+     (Self : Base_Vector'Class; K : Key_Type) return Boolean is
+   begin
+      return Find (Self, K) /= Vectors.No_Index;
+   end Contains;
+
+   ---------
+   -- Get --
+   ---------
+
+   function Get
+     (Self : Base_Vector'Class; K : Key_Type)
+     return Vectors.Constant_Returned_Type
+   is
+      Position : constant Extended_Index := Find (Self, K);
+   begin
+      if Position = Vectors.No_Index then
+         raise Constraint_Error with "Key not found";
+      end if;
+      return Vectors.Element (Self, Position);
+   end Get;
+
+   -------------
+   -- Include --
+   -------------
+
+   procedure Include
+     (Self : in out Base_Vector'Class; Element : Vectors.Element_Type)
+   is
+      K        : constant Key_Type := Key (Element);
+      Position : constant Extended_Index := Lower (Self, K);
+   begin
+      if Position = Vectors.No_Index then
+         Self.Append (Element);
+      elsif K < Key_At (Self, Position) then
+         Self.Insert (Position, Element);
+      else
+         Self.Replace_Element (Position, Element);
+      end if;
+   end Include;
+
+   ------------
+   -- Delete --
+   ------------
+
+   procedure Delete (Self : in out Base_Vector'Class; K : Key_Type) is
+      Position : constant Extended_Index := Find (Self, K);
+   begin
+      if Position /= Vectors.No_Index then
+         Self.Delete (Position);
+      end if;
+   end Delete;
+
+end Conts.Vectors.Sorted;
@@ -0,0 +1,294 @@
+------------------------------------------------------------------------------
+--                     Copyright (C) 2016, AdaCore                          --
+--                                                                          --
+-- This library is free software;  you can redistribute it and/or modify it --
+-- under terms of the  GNU General Public License  as published by the Free --
+-- Software  Foundation;  either version 3,  or (at your  option) any later --
+-- version. This library is distributed in the hope that it will be useful, --
+-- but WITHOUT ANY WARRANTY;  without even the implied warranty of MERCHAN- --
+-- TABILITY or FITNESS FOR A PARTICULAR PURPOSE.                            --
+--                                                                          --
+-- As a special exception under Section 7 of GPL version 3, you are granted --
+-- additional permissions described in the GCC Runtime Library Exception,   --
+-- version 3.1, as published by the Free Software Foundation.               --
+--                                                                          --
+-- You should have received a copy of the GNU General Public License and    --
+-- a copy of the GCC Runtime Library Exception along with this program;     --
+-- see the files COPYING3 and COPYING.RUNTIME respectively.  If not, see    --
+-- <http://www.gnu.org/licenses/>.                                          --
+--                                                                          --
+------------------------------------------------------------------------------
+
+pragma Ada_2012;
+with Ada.Unchecked_Conversion;
+with Interfaces.C;              use Interfaces.C;
+with System.Storage_Elements;   use System.Storage_Elements;
+
+package body Conts.Vectors.Storage.Mapped_File with SPARK_Mode => Off is
+
+   package body Impl is
+      use Memory_Maps;
+
+      type File_Header is record
+         Length       : Count_Type;
+         Element_Size : size_t;
+      end record;
+      type File_Header_Access is access File_Header;
+      for File_Header_Access'Storage_Size use 0;
+
+      Header_Size : constant := 4096;
+      --  Number of bytes reserved for the header at the start of the file.
+      --  This keeps the elements aligned.
+
+      pragma Warnings (Off);  --  no aliasing issue
+      function Convert is new Ada.Unchecked_Conversion
+        (System.Address, Nodes_Array_Access);
+      function Convert is new Ada.Unchecked_Conversion
+        (System.Address, File_Header_Access);
+      pragma Warnings (On);
+
+      Element_Size : constant size_t :=
+        size_t (Big_Nodes_Array'Component_Size / System.Storage_Unit);
+      --  Size of each element, in bytes
+
+      function Bytes_For (Count : Count_Type) return size_t
+        is (Header_Size + Round_To_Page (size_t (Count) * Element_Size))
+        with Inline;
+      --  Number of bytes to map to store Count elements
+
+      function Header (Self : Container'Class) return File_Header_Access
+        is (Convert (Self.Base)) with Inline;
+
+      procedure Set_Mapping
+        (Self  : in out Container'Class;
+         Base  : System.Address;
+         Bytes : size_t);
+      --  Self now uses Bytes bytes of memory starting at Base
+
+      -----------------
+      -- Set_Mapping --
+      -----------------
+
+      procedure Set_Mapping
+        (Self  : in out Container'Class;
+         Base  : System.Address;
+         Bytes : size_t) is
+      begin
+         Self.Base   := Base;
+         Self.Mapped := Bytes;
+         Self.Nodes  := Convert (Base + Storage_Offset (Header_Size));
+         Self.Capacity := Count_Type
+           (size_t'Min
+              ((Bytes - Header_Size) / Element_Size,
+               size_t (Count_Type'Last - Min_Index + 1)));
+      end Set_Mapping;
+
+      ---------------------
+      -- Release_Element --
+      ---------------------
+
+      procedure Release_Element
+        (Self : in out Container'Class; Index : Count_Type) is
+      begin
+         Elements.Release (Self.Nodes (Index));
+      end Release_Element;
+
+      -----------------
+      -- Set_Element --
+      -----------------
+
+      procedure Set_Element
+        (Self    : in out Container'Class;
+         Index   : Count_Type;
+         Element : Elements.Stored_Type) is
+      begin
+         Self.Nodes (Index) := Element;
+      end Set_Element;
+
+      ------------
+      -- Assign --
+      ------------
+
+      procedure Assign
+        (Self                : in out Container'Class;
+         Source              : Container'Class;
+         Last                : Count_Type)
+      is
+         --  Self might be a bitwise copy of Source, so we must not release
+         --  its memory or close its file here.
+         Bytes : size_t;
+      begin
+         Self.File := Invalid_File;
+
+         if Last < Min_Index then
+            Self.Base     := System.Null_Address;
+            Self.Mapped   := 0;
+            Self.Nodes    := null;
+            Self.Capacity := 0;
+         else
+            Bytes := Bytes_For (Last);
+            Set_Mapping (Self, Map_Anonymous (Bytes), Bytes);
+            Self.Nodes (Min_Index .. Last) := Source.Nodes (Min_Index .. Last);
+         end if;
+      end Assign;
+
+      ----------
+      -- Copy --
+      ----------
+
+      procedure Copy
+        (Self                   : in out Container'Class;
+         Source                 : Container'Class;
+         Source_From, Source_To : Count_Type;
+         Self_From              : Count_Type) is
+      begin
+         --  Slices correctly handle overlapping ranges
+         Self.Nodes (Self_From .. Self_From + Source_To - Source_From) :=
+           Source.Nodes (Source_From .. Source_To);
+      end Copy;
+
+      ------------
+      -- Resize --
+      ------------
+
+      procedure Resize
+        (Self     : in out Container'Class;
+         New_Size : Count_Type;
+         Last     : Count_Type;
+         Force    : Boolean)
+      is
+         pragma Unreferenced (Last);
+         --  Elements are never copied, since the mapping is resized in place
+         Size  : Count_Type;
+         Bytes : size_t;
+      begin
+         if Force then
+            Size := New_Size;
+         elsif New_Size < Self.Capacity then
+            Size := Resize_Policy.Shrink
+              (Current_Size => Self.Capacity, Min_Expected_Size => New_Size);
+         else
+            Size := Resize_Policy.Grow
+              (Current_Size => Self.Capacity, Min_Expected_Size => New_Size);
+         end if;
+
+         if Size = 0 and then not Self.Is_Open then
+            Release (Self);
+            return;
+         end if;
+
+         --  A file stays mapped even when the vector is cleared, with only
+         --  its header, which the vector updates with Set_Length. It is
+         --  only closed when the vector is finalized or closed.
+
+         Bytes := Bytes_For (Size);
+
+         if Bytes /= Self.Mapped then
+            if Self.Base = System.Null_Address then
+               Set_Mapping (Self, Map_Anonymous (Bytes), Bytes);
+
+            elsif not Self.Is_Open then
+               Set_Mapping
+                 (Self, Remap (Self.Base, Self.Mapped, Bytes), Bytes);
+
+            elsif Bytes > Self.Mapped then
+               Set_File_Size (Self.File, Bytes);
+               Set_Mapping
+                 (Self, Remap (Self.Base, Self.Mapped, Bytes), Bytes);
+
+            else
+               Set_Mapping
+                 (Self, Remap (Self.Base, Self.Mapped, Bytes), Bytes);
+               Set_File_Size (Self.File, Bytes);
+            end if;
+         end if;
+      end Resize;
+
+      ----------------
+      -- Set_Length --
+      ----------------
+
+      procedure Set_Length
+        (Self : in out Container'Class; Length : Count_Type) is
+      begin
+         if Self.Is_Open then
+            Header (Self).Length := Length;
+         end if;
+      end Set_Length;
+
+      -------------
+      -- Release --
+      -------------
+
+      procedure Release (Self : in out Container'Class) is
+      begin
+         if Self.Base /= System.Null_Address then
+            Unmap (Self.Base, Self.Mapped);
+         end if;
+
+         if Self.Is_Open then
+            Close_File (Self.File);
+            Self.File := Invalid_File;
+         end if;
+
+         Self.Base     := System.Null_Address;
+         Self.Mapped   := 0;
+         Self.Nodes    := null;
+         Self.Capacity := 0;
+      end Release;
+
+      ----------
+      -- Open --
+      ----------
+
+      procedure Open
+        (Self      : in out Container'Class;
+         File_Name : String;
+         Length    : out Count_Type)
+      is
+         Bytes : size_t;
+      begin
+         Release (Self);
+         Self.File := Open_File (File_Name);
+         Bytes := File_Size (Self.File);
+
+         if Bytes = 0 then
+            --  A new file
+            Bytes := Bytes_For (0);
+            Set_File_Size (Self.File, Bytes);
+            Set_Mapping (Self, Map_File (Self.File, Bytes), Bytes);
+            Header (Self).all := (Length => 0, Element_Size => Element_Size);
+
+         elsif Bytes < Header_Size then
+            Release (Self);
+            raise Constraint_Error with "invalid file " & File_Name;
+
+         else
+            Set_Mapping (Self, Map_File (Self.File, Bytes), Bytes);
+
+            if Header (Self).Element_Size /= Element_Size
+              or else Header (Self).Length > Self.Capacity
+            then
+               Release (Self);
+               raise Constraint_Error with "invalid file " & File_Name;
+            end if;
+         end if;
+
+         Length := Header (Self).Length;
+      end Open;
+
+      ----------
+      -- Sync --
+      ----------
+
+      procedure Sync (Self : in out Container'Class; Length : Count_Type) is
+      begin
+         if Self.Is_Open then
+            Header (Self).Length := Length;
+            Memory_Maps.Sync (Self.Base, Self.Mapped);
+         end if;
+      end Sync;
+
+   end Impl;
+
+end Conts.Vectors.Storage.Mapped_File;
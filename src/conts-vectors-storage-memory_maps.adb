@@ -0,0 +1,212 @@
+------------------------------------------------------------------------------
+--                     Copyright (C) 2016, AdaCore                          --
+--                                                                          --
+-- This library is free software;  you can redistribute it and/or modify it --
+-- under terms of the  GNU General Public License  as published by the Free --
+-- Software  Foundation;  either version 3,  or (at your  option) any later --
+-- version. This library is distributed in the hope that it will be useful, --
+-- but WITHOUT ANY WARRANTY;  without even the implied warranty of MERCHAN- --
+-- TABILITY or FITNESS FOR A PARTICULAR PURPOSE.                            --
+--                                                                          --
+-- As a special exception under Section 7 of GPL version 3, you are granted --
+-- additional permissions described in the GCC Runtime Library Exception,   --
+-- version 3.1, as published by the Free Software Foundation.               --
+--                                                                          --
+-- You should have received a copy of the GNU General Public License and    --
+-- a copy of the GCC Runtime Library Exception along with this program;     --
+-- see the files COPYING3 and COPYING.RUNTIME respectively.  If not, see    --
+-- <http://www.gnu.org/licenses/>.                                          --
+--                                                                          --
+------------------------------------------------------------------------------
+
+pragma Ada_2012;
+with Ada.IO_Exceptions;
+with Interfaces.C.Strings;      use Interfaces.C.Strings;
+with System.Storage_Elements;   use System.Storage_Elements;
+
+package body Conts.Vectors.Storage.Memory_Maps is
+
+   PROT_READ      : constant int := 16#1#;
+   PROT_WRITE     : constant int := 16#2#;
+   MAP_SHARED     : constant int := 16#1#;
+   MAP_PRIVATE    : constant int := 16#2#;
+   MAP_ANONYMOUS  : constant int := 16#20#;
+   MREMAP_MAYMOVE : constant int := 16#1#;
+   MS_SYNC        : constant int := 16#4#;
+   O_RDWR         : constant int := 8#2#;
+   O_CREAT        : constant int := 8#100#;
+   SEEK_END       : constant int := 2;
+   --  Values from <sys/mman.h> on Linux
+
+   MAP_FAILED : constant System.Address := To_Address (Integer_Address'Last);
+   --  (void*) -1
+
+   function getpagesize return int
+     with Import, Convention => C, External_Name => "getpagesize";
+   function mmap
+     (Addr   : System.Address;
+      Length : size_t;
+      Prot   : int;
+      Flags  : int;
+      Fd     : int;
+      Offset : long) return System.Address
+     with Import, Convention => C, External_Name => "mmap";
+   function mremap
+     (Old_Address : System.Address;
+      Old_Size    : size_t;
+      New_Size    : size_t;
+      Flags       : int) return System.Address
+     with Import, Convention => C, External_Name => "mremap";
+   function munmap (Addr : System.Address; Length : size_t) return int
+     with Import, Convention => C, External_Name => "munmap";
+   function msync
+     (Addr : System.Address; Length : size_t; Flags : int) return int
+     with Import, Convention => C, External_Name => "msync";
+   function open
+     (Path : chars_ptr; Flags : int; Mode : int) return File_Descriptor
+     with Import, Convention => C_Variadic_2, External_Name => "open";
+   --  open is variadic in C, and Mode is one of the variable arguments,
+   --  which some ABIs pass differently from fixed ones.
+   function close (Fd : File_Descriptor) return int
+     with Import, Convention => C, External_Name => "close";
+   function lseek
+     (Fd : File_Descriptor; Offset : long; Whence : int) return long
+     with Import, Convention => C, External_Name => "lseek";
+   function ftruncate (Fd : File_Descriptor; Length : long) return int
+     with Import, Convention => C, External_Name => "ftruncate";
+
+   Page : constant size_t := size_t (getpagesize);
+
+   ---------------
+   -- Page_Size --
+   ---------------
+
+   function Page_Size return size_t is
+   begin
+      return Page;
+   end Page_Size;
+
+   -------------------
+   -- Map_Anonymous --
+   -------------------
+
+   function Map_Anonymous (Size : size_t) return System.Address is
+      Result : constant System.Address := mmap
+        (Addr   => System.Null_Address,
+         Length => Size,
+         Prot   => PROT_READ + PROT_WRITE,
+         Flags  => MAP_PRIVATE + MAP_ANONYMOUS,
+         Fd     => -1,
+         Offset => 0);
+   begin
+      if Result = MAP_FAILED then
+         raise Storage_Error with "mmap failed";
+      end if;
+      return Result;
+   end Map_Anonymous;
+
+   -----------
+   -- Remap --
+   -----------
+
+   function Remap
+     (Address            : System.Address;
+      Old_Size, New_Size : size_t) return System.Address
+   is
+      Result : constant System.Address :=
+        mremap (Address, Old_Size, New_Size, MREMAP_MAYMOVE);
+   begin
+      if Result = MAP_FAILED then
+         raise Storage_Error with "mremap failed";
+      end if;
+      return Result;
+   end Remap;
+
+   -----------
+   -- Unmap --
+   -----------
+
+   procedure Unmap (Address : System.Address; Size : size_t) is
+      Dummy : int;
+   begin
+      Dummy := munmap (Address, Size);
+   end Unmap;
+
+   ---------------
+   -- Open_File --
+   ---------------
+
+   function Open_File (Name : String) return File_Descriptor is
+      C_Name : chars_ptr := New_String (Name);
+      Result : constant File_Descriptor :=
+        open (C_Name, O_RDWR + O_CREAT, 8#644#);
+   begin
+      Free (C_Name);
+      if Result = Invalid_File then
+         raise Ada.IO_Exceptions.Name_Error with "cannot open " & Name;
+      end if;
+      return Result;
+   end Open_File;
+
+   ----------------
+   -- Close_File --
+   ----------------
+
+   procedure Close_File (File : File_Descriptor) is
+      Dummy : int;
+   begin
+      Dummy := close (File);
+   end Close_File;
+
+   ---------------
+   -- File_Size --
+   ---------------
+
+   function File_Size (File : File_Descriptor) return size_t is
+   begin
+      return size_t (lseek (File, 0, SEEK_END));
+   end File_Size;
+
+   -------------------
+   -- Set_File_Size --
+   -------------------
+
+   procedure Set_File_Size (File : File_Descriptor; Size : size_t) is
+   begin
+      if ftruncate (File, long (Size)) /= 0 then
+         raise Ada.IO_Exceptions.Use_Error with "ftruncate failed";
+      end if;
+   end Set_File_Size;
+
+   --------------
+   -- Map_File --
+   --------------
+
+   function Map_File
+     (File : File_Descriptor; Size : size_t) return System.Address
+   is
+      Result : constant System.Address := mmap
+        (Addr   => System.Null_Address,
+         Length => Size,
+         Prot   => PROT_READ + PROT_WRITE,
+         Flags  => MAP_SHARED,
+         Fd     => int (File),
+         Offset => 0);
+   begin
+      if Result = MAP_FAILED then
+         raise Storage_Error with "mmap failed";
+      end if;
+      return Result;
+   end Map_File;
+
+   ----------
+   -- Sync --
+   ----------
+
+   procedure Sync (Address : System.Address; Size : size_t) is
+      Dummy : int;
+   begin
+      Dummy := msync (Address, Size, MS_SYNC);
+   end Sync;
+
+end Conts.Vectors.Storage.Memory_Maps;
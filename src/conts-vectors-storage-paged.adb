@@ -0,0 +1,233 @@
+------------------------------------------------------------------------------
+--                     Copyright (C) 2016, AdaCore                          --
+--                                                                          --
+-- This library is free software;  you can redistribute it and/or modify it --
+-- under terms of the  GNU General Public License  as published by the Free --
+-- Software  Foundation;  either version 3,  or (at your  option) any later --
+-- version. This library is distributed in the hope that it will be useful, --
+-- but WITHOUT ANY WARRANTY;  without even the implied warranty of MERCHAN- --
+-- TABILITY or FITNESS FOR A PARTICULAR PURPOSE.                            --
+--                                                                          --
+-- As a special exception under Section 7 of GPL version 3, you are granted --
+-- additional permissions described in the GCC Runtime Library Exception,   --
+-- version 3.1, as published by the Free Software Foundation.               --
+--                                                                          --
+-- You should have received a copy of the GNU General Public License and    --
+-- a copy of the GCC Runtime Library Exception along with this program;     --
+-- see the files COPYING3 and COPYING.RUNTIME respectively.  If not, see    --
+-- <http://www.gnu.org/licenses/>.                                          --
+--                                                                          --
+------------------------------------------------------------------------------
+
+pragma Ada_2012;
+with Ada.Unchecked_Conversion;
+with Conts.Vectors.Storage.Memory_Maps;
+use Conts.Vectors.Storage.Memory_Maps;
+with Interfaces.C;      use Interfaces.C;
+with System;
+
+package body Conts.Vectors.Storage.Paged with SPARK_Mode => Off is
+
+   package body Impl is
+      pragma Warnings (Off);  --  no aliasing issue
+      function Convert is new Ada.Unchecked_Conversion
+        (Nodes_Array_Access, System.Address);
+      function Convert is new Ada.Unchecked_Conversion
+        (System.Address, Nodes_Array_Access);
+      pragma Warnings (On);
+
+      Element_Size : constant size_t :=
+        size_t (Big_Nodes_Array'Component_Size / System.Storage_Unit);
+      --  Size of each element, in bytes
+
+      function Bytes_For (Count : Count_Type) return size_t
+        is (Round_To_Page (size_t (Count) * Element_Size)) with Inline;
+      --  Number of bytes to map to store Count elements
+
+      function Capacity_Of (Bytes : size_t) return Count_Type
+        is (Count_Type
+              (size_t'Min
+                 (Bytes / Element_Size,
+                  size_t (Count_Type'Last - Min_Index + 1))))
+        with Inline;
+      --  Number of elements that fit in Bytes
+
+      procedure Internal_Copy
+        (Self                   : Nodes_Array_Access;
+         Source                 : Nodes_Array_Access;
+         Source_From, Source_To : Count_Type;
+         Self_From              : Count_Type) with Inline;
+      --  Internal version of Copy, directly applying on an array
+
+      ---------------------
+      -- Release_Element --
+      ---------------------
+
+      procedure Release_Element
+        (Self : in out Container'Class; Index : Count_Type) is
+      begin
+         Elements.Release (Self.Nodes (Index));
+      end Release_Element;
+
+      -----------------
+      -- Set_Element --
+      -----------------
+
+      procedure Set_Element
+        (Self    : in out Container'Class;
+         Index   : Count_Type;
+         Element : Elements.Stored_Type) is
+      begin
+         Self.Nodes (Index) := Element;
+      end Set_Element;
+
+      -------------------
+      -- Internal_Copy --
+      -------------------
+
+      procedure Internal_Copy
+        (Self                   : Nodes_Array_Access;
+         Source                 : Nodes_Array_Access;
+         Source_From, Source_To : Count_Type;
+         Self_From              : Count_Type)
+      is
+         Self_To : Count_Type;
+      begin
+         if Elements.Copyable then
+            Self (Self_From .. Self_From + Source_To - Source_From) :=
+              Source (Source_From .. Source_To);
+         else
+            Self_To := Self_From + Source_To - Source_From;
+
+            --  If the ranges overlap, the order of the loop is important
+            if Self = Source and then Source_To > Self_To then
+               for J in Source_From .. Source_To loop
+                  Self (Self_From + J - Source_From) :=
+                    Elements.Copy (Source (J));
+               end loop;
+
+            else
+               for J in reverse Source_From .. Source_To loop
+                  Self (Self_From + J - Source_From) :=
+                    Elements.Copy (Source (J));
+               end loop;
+            end if;
+         end if;
+      end Internal_Copy;
+
+      ------------
+      -- Assign --
+      ------------
+
+      procedure Assign
+        (Self                : in out Container'Class;
+         Source              : Container'Class;
+         Last                : Count_Type)
+      is
+         --  Self might be a bitwise copy of Source, so we must not release
+         --  its memory here.
+         Bytes : size_t;
+      begin
+         if Last < Min_Index then
+            Self.Nodes    := null;
+            Self.Mapped   := 0;
+            Self.Capacity := 0;
+         else
+            Bytes := Bytes_For (Last);
+            Self.Nodes := Convert (Map_Anonymous (Bytes));
+            Internal_Copy
+              (Self.Nodes, Source.Nodes, Min_Index, Last, Min_Index);
+            Self.Mapped   := Bytes;
+            Self.Capacity := Capacity_Of (Bytes);
+         end if;
+      end Assign;
+
+      ----------
+      -- Copy --
+      ----------
+
+      procedure Copy
+        (Self                   : in out Container'Class;
+         Source                 : Container'Class;
+         Source_From, Source_To : Count_Type;
+         Self_From              : Count_Type) is
+      begin
+         Internal_Copy
+           (Self.Nodes, Source.Nodes, Source_From, Source_To, Self_From);
+      end Copy;
+
+      ------------
+      -- Resize --
+      ------------
+
+      procedure Resize
+        (Self     : in out Container'Class;
+         New_Size : Count_Type;
+         Last     : Count_Type;
+         Force    : Boolean)
+      is
+         Size  : Count_Type;
+         Bytes : size_t;
+         Tmp   : Nodes_Array_Access;
+      begin
+         if Force then
+            Size := New_Size;
+         elsif New_Size < Self.Capacity then
+            Size := Resize_Policy.Shrink
+              (Current_Size => Self.Capacity, Min_Expected_Size => New_Size);
+         else
+            Size := Resize_Policy.Grow
+              (Current_Size => Self.Capacity, Min_Expected_Size => New_Size);
+         end if;
+
+         if Size = 0 then
+            Release (Self);
+            return;
+         end if;
+
+         Bytes := Bytes_For (Size);
+
+         if Bytes /= Self.Mapped then
+            if Self.Nodes = null then
+               Self.Nodes := Convert (Map_Anonymous (Bytes));
+
+            elsif Elements.Movable then
+               --  The kernel moves the pages, the elements are not copied
+               Self.Nodes := Convert
+                 (Remap (Convert (Self.Nodes), Self.Mapped, Bytes));
+
+            else
+               Tmp := Convert (Map_Anonymous (Bytes));
+
+               for J in Min_Index .. Count_Type'Min (Last, Capacity_Of (Bytes))
+               loop
+                  Tmp (J) := Elements.Copy (Self.Nodes (J));
+                  Elements.Release (Self.Nodes (J));
+               end loop;
+
+               Unmap (Convert (Self.Nodes), Self.Mapped);
+               Self.Nodes := Tmp;
+            end if;
+
+            Self.Mapped := Bytes;
+            Self.Capacity := Capacity_Of (Bytes);
+         end if;
+      end Resize;
+
+      -------------
+      -- Release --
+      -------------
+
+      procedure Release (Self : in out Container'Class) is
+      begin
+         if Self.Nodes /= null then
+            Unmap (Convert (Self.Nodes), Self.Mapped);
+            Self.Nodes := null;
+         end if;
+         Self.Mapped := 0;
+         Self.Capacity := 0;
+      end Release;
+
+   end Impl;
+
+end Conts.Vectors.Storage.Paged;
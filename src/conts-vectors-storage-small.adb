@@ -0,0 +1,244 @@
+------------------------------------------------------------------------------
+--                     Copyright (C) 2016, AdaCore                          --
+--                                                                          --
+-- This library is free software;  you can redistribute it and/or modify it --
+-- under terms of the  GNU General Public License  as published by the Free --
+-- Software  Foundation;  either version 3,  or (at your  option) any later --
+-- version. This library is distributed in the hope that it will be useful, --
+-- but WITHOUT ANY WARRANTY;  without even the implied warranty of MERCHAN- --
+-- TABILITY or FITNESS FOR A PARTICULAR PURPOSE.                            --
+--                                                                          --
+-- As a special exception under Section 7 of GPL version 3, you are granted --
+-- additional permissions described in the GCC Runtime Library Exception,   --
+-- version 3.1, as published by the Free Software Foundation.               --
+--                                                                          --
+-- You should have received a copy of the GNU General Public License and    --
+-- a copy of the GCC Runtime Library Exception along with this program;     --
+-- see the files COPYING3 and COPYING.RUNTIME respectively.  If not, see    --
+-- <http://www.gnu.org/licenses/>.                                          --
+--                                                                          --
+------------------------------------------------------------------------------
+
+pragma Ada_2012;
+with Ada.Unchecked_Conversion;
+with System;                   use System;
+with System.Memory;            use System.Memory;
+
+package body Conts.Vectors.Storage.Small with SPARK_Mode => Off is
+
+   package body Impl is
+      pragma Warnings (Off);  --  no aliasing issue
+      function Convert is new Ada.Unchecked_Conversion
+        (Nodes_Array_Access, System.Address);
+      function Convert is new Ada.Unchecked_Conversion
+        (System.Address, Nodes_Array_Access);
+      pragma Warnings (On);
+
+      function Allocate (Size : Count_Type) return Nodes_Array_Access
+        with Inline;
+      --  Allocate memory for Size elements on the heap
+
+      function Copy_Element
+        (E : Elements.Stored_Type) return Elements.Stored_Type
+        is (if Elements.Copyable then E else Elements.Copy (E))
+        with Inline;
+
+      --------------
+      -- Allocate --
+      --------------
+
+      function Allocate (Size : Count_Type) return Nodes_Array_Access is
+      begin
+         return Convert
+           (System.Memory.Alloc
+              (size_t
+                 (Size * Big_Nodes_Array'Component_Size
+                  / System.Storage_Unit)));
+      end Allocate;
+
+      ---------------------
+      -- Release_Element --
+      ---------------------
+
+      procedure Release_Element
+        (Self : in out Container'Class; Index : Count_Type) is
+      begin
+         if Self.Nodes = null then
+            Elements.Release (Self.Inline (Index));
+         else
+            Elements.Release (Self.Nodes (Index));
+         end if;
+      end Release_Element;
+
+      -----------------
+      -- Set_Element --
+      -----------------
+
+      procedure Set_Element
+        (Self    : in out Container'Class;
+         Index   : Count_Type;
+         Element : Elements.Stored_Type) is
+      begin
+         if Self.Nodes = null then
+            Self.Inline (Index) := Element;
+         else
+            Self.Nodes (Index) := Element;
+         end if;
+      end Set_Element;
+
+      ----------
+      -- Copy --
+      ----------
+
+      procedure Copy
+        (Self                   : in out Container'Class;
+         Source                 : Container'Class;
+         Source_From, Source_To : Count_Type;
+         Self_From              : Count_Type) is
+      begin
+         --  If the ranges overlap, the order of the loop is important
+
+         if Self'Address = Source'Address and then Self_From < Source_From
+         then
+            for J in Source_From .. Source_To loop
+               Set_Element
+                 (Self, Self_From + J - Source_From,
+                  Copy_Element (Get_Element (Source, J)));
+            end loop;
+
+         else
+            for J in reverse Source_From .. Source_To loop
+               Set_Element
+                 (Self, Self_From + J - Source_From,
+                  Copy_Element (Get_Element (Source, J)));
+            end loop;
+         end if;
+      end Copy;
+
+      ------------
+      -- Assign --
+      ------------
+
+      procedure Assign
+        (Self                : in out Container'Class;
+         Source              : Container'Class;
+         Last                : Count_Type)
+      is
+         --  Self might be the same as Source, or a bitwise copy of it, so
+         --  Self.Nodes must not be reused.
+
+         Tmp : Nodes_Array_Access;
+      begin
+         if Last <= Inline_Capacity then
+            for J in Min_Index .. Last loop
+               Self.Inline (J) := Copy_Element (Get_Element (Source, J));
+            end loop;
+            Self.Nodes := null;
+            Self.Capacity := Inline_Capacity;
+
+         else
+            --  As for unbounded vectors, we only allocate enough memory to
+            --  copy everything.
+
+            Tmp := Allocate (Last);
+            for J in Min_Index .. Last loop
+               Tmp (J) := Copy_Element (Source.Nodes (J));
+            end loop;
+            Self.Nodes := Tmp;
+            Self.Capacity := Last;
+         end if;
+      end Assign;
+
+      ------------
+      -- Resize --
+      ------------
+
+      procedure Resize
+        (Self     : in out Container'Class;
+         New_Size : Count_Type;
+         Last     : Count_Type;
+         Force    : Boolean)
+      is
+         Size : Count_Type;
+         Tmp  : Nodes_Array_Access;
+      begin
+         if Force then
+            Size := New_Size;
+         elsif New_Size < Self.Capacity then
+            Size := Resize_Policy.Shrink
+              (Current_Size => Self.Capacity, Min_Expected_Size => New_Size);
+         else
+            Size := Resize_Policy.Grow
+              (Current_Size => Self.Capacity, Min_Expected_Size => New_Size);
+         end if;
+
+         --  The inline elements are always available
+
+         Size := Count_Type'Max (Size, Inline_Capacity);
+
+         if Size = Self.Capacity then
+            return;
+
+         elsif Size = Inline_Capacity then
+            --  Move the elements back into the vector itself
+
+            for J in Min_Index .. Count_Type'Min (Last, Size) loop
+               if Elements.Movable then
+                  Self.Inline (J) := Self.Nodes (J);
+               else
+                  Self.Inline (J) := Elements.Copy (Self.Nodes (J));
+                  Elements.Release (Self.Nodes (J));
+               end if;
+            end loop;
+
+            System.Memory.Free (Convert (Self.Nodes));
+            Self.Nodes := null;
+
+         elsif Self.Nodes = null then
+            Tmp := Allocate (Size);
+            for J in Min_Index .. Last loop
+               if Elements.Movable then
+                  Tmp (J) := Self.Inline (J);
+               else
+                  Tmp (J) := Elements.Copy (Self.Inline (J));
+                  Elements.Release (Self.Inline (J));
+               end if;
+            end loop;
+            Self.Nodes := Tmp;
+
+         elsif Elements.Movable then
+            Self.Nodes := Convert
+              (Realloc
+                 (Convert (Self.Nodes),
+                  size_t (Size * Big_Nodes_Array'Component_Size
+                          / System.Storage_Unit)));
+
+         else
+            Tmp := Allocate (Size);
+            for J in Min_Index .. Count_Type'Min (Last, Size) loop
+               Tmp (J) := Elements.Copy (Self.Nodes (J));
+               Elements.Release (Self.Nodes (J));
+            end loop;
+            System.Memory.Free (Convert (Self.Nodes));
+            Self.Nodes := Tmp;
+         end if;
+
+         Self.Capacity := Size;
+      end Resize;
+
+      -------------
+      -- Release --
+      -------------
+
+      procedure Release (Self : in out Container'Class) is
+      begin
+         if Self.Nodes /= null then
+            System.Memory.Free (Convert (Self.Nodes));
+            Self.Nodes := null;
+         end if;
+         Self.Capacity := Inline_Capacity;
+      end Release;
+
+   end Impl;
+
+end Conts.Vectors.Storage.Small;
@@ -0,0 +1,101 @@
+------------------------------------------------------------------------------
+--                     Copyright (C) 2016, AdaCore                          --
+--                                                                          --
+-- This library is free software;  you can redistribute it and/or modify it --
+-- under terms of the  GNU General Public License  as published by the Free --
+-- Software  Foundation;  either version 3,  or (at your  option) any later --
+-- version. This library is distributed in the hope that it will be useful, --
+-- but WITHOUT ANY WARRANTY;  without even the implied warranty of MERCHAN- --
+-- TABILITY or FITNESS FOR A PARTICULAR PURPOSE.                            --
+--                                                                          --
+-- As a special exception under Section 7 of GPL version 3, you are granted --
+-- additional permissions described in the GCC Runtime Library Exception,   --
+-- version 3.1, as published by the Free Software Foundation.               --
+--                                                                          --
+-- You should have received a copy of the GNU General Public License and    --
+-- a copy of the GCC Runtime Library Exception along with this program;     --
+-- see the files COPYING3 and COPYING.RUNTIME respectively.  If not, see    --
+-- <http://www.gnu.org/licenses/>.                                          --
+--                                                                          --
+------------------------------------------------------------------------------
+
+pragma Ada_2012;
+with Ada.Finalization;
+with Asserts;                use Asserts;
+with Conts;                  use Conts;
+with Conts.Algorithms;
+with Conts.Vectors.Definite_Unbounded;
+with Ada.Text_IO;            use Ada.Text_IO;
+
+procedure Main is
+   use Asserts.Booleans, Asserts.Integers;
+
+   package Int_Vecs is new Conts.Vectors.Definite_Unbounded
+      (Positive, Integer, Ada.Finalization.Controlled);
+   use Int_Vecs;
+
+   function Is_Partitioned is new Conts.Algorithms.Is_Partitioned
+      (Int_Vecs.Cursors.Forward, Int_Vecs.Maps.Element);
+   function Partition_Point is new Conts.Algorithms.Partition_Point
+      (Int_Vecs.Cursors.Random_Access, Int_Vecs.Maps.Element_From_Index);
+   function Lower_Bound is new Conts.Algorithms.Lower_Bound
+      (Int_Vecs.Cursors.Random_Access, Int_Vecs.Maps.Element_From_Index);
+   function Upper_Bound is new Conts.Algorithms.Upper_Bound
+      (Int_Vecs.Cursors.Random_Access, Int_Vecs.Maps.Element_From_Index);
+   procedure Equal_Range is new Conts.Algorithms.Equal_Range
+      (Int_Vecs.Cursors.Random_Access, Int_Vecs.Maps.Element_From_Index);
+   function Binary_Search is new Conts.Algorithms.Binary_Search
+      (Int_Vecs.Cursors.Random_Access, Int_Vecs.Maps.Element_From_Index);
+
+   function Is_Small (E : Integer) return Boolean is (E < 10);
+
+   No_Index : constant Integer := Int_Vecs.Cursors.Random_Access.No_Element;
+
+   V         : Vector;
+   Low, High : Extended_Index;
+
+begin
+   --  Empty vector
+
+   Assert (Partition_Point (V, Is_Small'Access), No_Index, "empty point");
+   Assert (Lower_Bound (V, 1), No_Index, "empty lower_bound");
+   Assert (Binary_Search (V, 1), No_Index, "empty search");
+
+   --  0, 2, 2, 2, 4, 6, ..., 18 (the value 2 appears three times)
+
+   for J in 0 .. 9 loop
+      V.Append (J * 2);
+   end loop;
+   V.Insert (2, 2, Count => 2);
+
+   Assert (Is_Partitioned (V, Is_Small'Access), True, "partitioned");
+   Assert (Partition_Point (V, Is_Small'Access), 8, "partition point");
+
+   Assert (Lower_Bound (V, 2), 2, "lower_bound 2");
+   Assert (Upper_Bound (V, 2), 5, "upper_bound 2");
+   Assert (Lower_Bound (V, 3), 5, "lower_bound 3");
+   Assert (Lower_Bound (V, -1), 1, "lower_bound -1");
+   Assert (Lower_Bound (V, 19), No_Index, "lower_bound 19");
+   Assert (Upper_Bound (V, 18), No_Index, "upper_bound 18");
+
+   Equal_Range (V, 2, Low, High);
+   Assert (Low, 2, "equal_range 2 low");
+   Assert (High, 4, "equal_range 2 high");
+   Equal_Range (V, 18, Low, High);
+   Assert (Low, 12, "equal_range 18 low");
+   Assert (High, 12, "equal_range 18 high");
+   Equal_Range (V, 5, Low, High);
+   Assert (Low, No_Index, "equal_range 5 low");
+   Assert (High, No_Index, "equal_range 5 high");
+
+   Assert (Binary_Search (V, 2), 2, "search 2");
+   Assert (Binary_Search (V, 12), 9, "search 12");
+   Assert (Binary_Search (V, 7), No_Index, "search 7");
+
+   --  Not partitioned once a small element comes after a large one
+
+   V.Append (1);
+   Assert (Is_Partitioned (V, Is_Small'Access), False, "not partitioned");
+
+   Put_Line ("Done");
+end Main;
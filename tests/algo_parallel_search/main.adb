@@ -0,0 +1,132 @@
+------------------------------------------------------------------------------
+--                     Copyright (C) 2016, AdaCore                          --
+--                                                                          --
+-- This library is free software;  you can redistribute it and/or modify it --
+-- under terms of the  GNU General Public License  as published by the Free --
+-- Software  Foundation;  either version 3,  or (at your  option) any later --
+-- version. This library is distributed in the hope that it will be useful, --
+-- but WITHOUT ANY WARRANTY;  without even the implied warranty of MERCHAN- --
+-- TABILITY or FITNESS FOR A PARTICULAR PURPOSE.                            --
+--                                                                          --
+-- As a special exception under Section 7 of GPL version 3, you are granted --
+-- additional permissions described in the GCC Runtime Library Exception,   --
+-- version 3.1, as published by the Free Software Foundation.               --
+--                                                                          --
+-- You should have received a copy of the GNU General Public License and    --
+-- a copy of the GCC Runtime Library Exception along with this program;     --
+-- see the files COPYING3 and COPYING.RUNTIME respectively.  If not, see    --
+-- <http://www.gnu.org/licenses/>.                                          --
+--                                                                          --
+------------------------------------------------------------------------------
+
+pragma Ada_2012;
+with Ada.Finalization;
+with Asserts;                use Asserts;
+with Conts;                  use Conts;
+with Conts.Algorithms.Parallel;
+with Conts.Vectors.Definite_Unbounded;
+with Ada.Text_IO;            use Ada.Text_IO;
+
+procedure Main is
+   use Asserts.Booleans, Asserts.Integers;
+
+   package Int_Vecs is new Conts.Vectors.Definite_Unbounded
+      (Positive, Integer, Ada.Finalization.Controlled);
+   use Int_Vecs;
+
+   package Par renames Conts.Algorithms.Parallel;
+
+   function Count_If is new Par.Count_If
+      (Int_Vecs.Cursors.Random_Access, Int_Vecs.Maps.Element_From_Index);
+   function Find is new Par.Find
+      (Int_Vecs.Cursors.Random_Access, Int_Vecs.Maps.Element_From_Index);
+   function Contains is new Par.Contains
+      (Int_Vecs.Cursors.Random_Access, Int_Vecs.Maps.Element_From_Index);
+   function Equals is new Par.Equals
+      (Int_Vecs.Cursors.Random_Access, Int_Vecs.Maps.Element_From_Index);
+   procedure For_Each is new Par.For_Each
+      (Int_Vecs.Cursors.Random_Access, Int_Vecs.Maps.Element_From_Index);
+
+   function Is_Even (E : Integer) return Boolean is (E mod 2 = 0);
+
+   protected Sum is
+      procedure Add (E : Integer);
+      function Value return Integer;
+   private
+      Total : Integer := 0;
+   end Sum;
+
+   procedure Add_To_Sum (E : Integer);
+
+   ---------
+   -- Sum --
+   ---------
+
+   protected body Sum is
+      procedure Add (E : Integer) is
+      begin
+         Total := Total + E;
+      end Add;
+
+      function Value return Integer is
+      begin
+         return Total;
+      end Value;
+   end Sum;
+
+   ----------------
+   -- Add_To_Sum --
+   ----------------
+
+   procedure Add_To_Sum (E : Integer) is
+   begin
+      Sum.Add (E);
+   end Add_To_Sum;
+
+   V, V2 : Vector;
+   Pool  : Par.Task_Pool (Workers => 4);
+
+begin
+   for J in 1 .. 100_000 loop
+      V.Append (J mod 1_000);
+   end loop;
+
+   Assert (Count_If (V, Is_Even'Access, Pool), 50_000, "count_if");
+
+   --  Find returns the first occurrence, even if a later chunk finds
+   --  another one first.
+
+   Assert (Find (V, 999, Pool), 999, "find 999");
+   Assert (Find (V, 0, Pool), 1_000, "find 0");
+   Assert (Find (V, 5_000, Pool), Int_Vecs.Cursors.Random_Access.No_Element,
+           "find missing");
+
+   Assert (Contains (V, 42, Pool), True, "contains 42");
+   Assert (Contains (V, -1, Pool), False, "contains -1");
+
+   V2 := V;
+   Assert (Equals (V, V2, Pool), True, "equals copy");
+   V2.Replace_Element (99_000, -1);
+   Assert (Equals (V, V2, Pool), False, "equals modified");
+   V2.Delete_Last;
+   Assert (Equals (V, V2, Pool), False, "equals shorter");
+
+   For_Each (V, Add_To_Sum'Access, Pool);
+   Assert (Sum.Value, 100 * (999 * 1_000 / 2), "for_each");
+
+   --  Small vectors are processed by the calling task only
+
+   V.Clear;
+   for J in 1 .. 10 loop
+      V.Append (J);
+   end loop;
+   Assert (Count_If (V, Is_Even'Access, Pool), 5, "small count_if");
+   Assert (Find (V, 7, Pool), 7, "small find");
+
+   V.Clear;
+   Assert (Count_If (V, Is_Even'Access, Pool), 0, "empty count_if");
+   Assert (Contains (V, 1, Pool), False, "empty contains");
+   Assert (Equals (V, V2, Pool), False, "empty equals");
+
+   Put_Line ("Done");
+end Main;
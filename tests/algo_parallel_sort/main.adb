@@ -0,0 +1,143 @@
+------------------------------------------------------------------------------
+--                     Copyright (C) 2016, AdaCore                          --
+--                                                                          --
+-- This library is free software;  you can redistribute it and/or modify it --
+-- under terms of the  GNU General Public License  as published by the Free --
+-- Software  Foundation;  either version 3,  or (at your  option) any later --
+-- version. This library is distributed in the hope that it will be useful, --
+-- but WITHOUT ANY WARRANTY;  without even the implied warranty of MERCHAN- --
+-- TABILITY or FITNESS FOR A PARTICULAR PURPOSE.                            --
+--                                                                          --
+-- As a special exception under Section 7 of GPL version 3, you are granted --
+-- additional permissions described in the GCC Runtime Library Exception,   --
+-- version 3.1, as published by the Free Software Foundation.               --
+--                                                                          --
+-- You should have received a copy of the GNU General Public License and    --
+-- a copy of the GCC Runtime Library Exception along with this program;     --
+-- see the files COPYING3 and COPYING.RUNTIME respectively.  If not, see    --
+-- <http://www.gnu.org/licenses/>.                                          --
+--                                                                          --
+------------------------------------------------------------------------------
+
+pragma Ada_2012;
+with Ada.Finalization;
+with Asserts;                use Asserts;
+with Conts;                  use Conts;
+with Conts.Algorithms.Parallel;
+with Conts.Vectors.Definite_Unbounded;
+with Ada.Text_IO;            use Ada.Text_IO;
+
+procedure Main is
+   use Asserts.Booleans, Asserts.Integers;
+
+   package Int_Vecs is new Conts.Vectors.Definite_Unbounded
+      (Positive, Integer, Ada.Finalization.Controlled);
+   use Int_Vecs;
+
+   procedure Sort is new Conts.Algorithms.Parallel.Sort
+      (Cursors              => Int_Vecs.Cursors.Random_Access,
+       Element_Type         => Integer,
+       Getters              => Int_Vecs.Maps.Element_From_Index,
+       Set                  => Int_Vecs.Replace_Element,
+       Sequential_Threshold => 1_000);
+   procedure Sequential_Sort is new Conts.Algorithms.Pdqsort
+      (Cursors => Int_Vecs.Cursors.Random_Access,
+       Getters => Int_Vecs.Maps.Element_From_Index,
+       Swap    => Int_Vecs.Swap);
+
+   procedure Fill (V : in out Vector; Count : Natural; Seed : Integer);
+   --  Fill V with pseudo-random integers with some duplicates
+
+   procedure Check (V : Vector; Input : Vector; Msg : String);
+   --  Check that V has the same elements as Input sorted sequentially, so
+   --  that no element was dropped or duplicated.
+
+   ----------
+   -- Fill --
+   ----------
+
+   procedure Fill (V : in out Vector; Count : Natural; Seed : Integer) is
+      S : Integer := Seed;
+   begin
+      V.Clear;
+      for J in 1 .. Count loop
+         S := (S * 1_103 + 12_345) mod 100_003;
+         V.Append (S mod 20_000);
+      end loop;
+   end Fill;
+
+   -----------
+   -- Check --
+   -----------
+
+   procedure Check (V : Vector; Input : Vector; Msg : String) is
+      Expected : Vector := Input;
+   begin
+      Sequential_Sort (Expected);
+      Assert (Integer (V.Length), Integer (Expected.Length),
+              Msg & ": length");
+      for J in V.First .. V.Last loop
+         Assert (V.Element (J), Expected.Element (J),
+                 Msg & ": element at" & J'Img);
+      end loop;
+   end Check;
+
+   V, Input : Vector;
+   Pool  : Conts.Algorithms.Parallel.Task_Pool (Workers => 4);
+   Pool3 : Conts.Algorithms.Parallel.Task_Pool (Workers => 3);
+   Seq   : Conts.Algorithms.Parallel.Task_Pool (Workers => 1);
+
+begin
+   Fill (V, 100_000, 7);
+   Input := V;
+   Sort (V, Pool);
+   Check (V, Input, "random");
+
+   --  Reusing the pool, with a number of elements that is not a multiple
+   --  of the number of workers
+
+   Fill (V, 12_345, 3);
+   Input := V;
+   Sort (V, Pool);
+   Check (V, Input, "reuse");
+
+   --  Already sorted, then reversed
+
+   Input := V;
+   Sort (V, Pool);
+   Check (V, Input, "sorted");
+   for J in 1 .. 12_345 loop
+      V.Replace_Element (J, 12_345 - J);
+   end loop;
+   Input := V;
+   Sort (V, Pool);
+   Check (V, Input, "reversed");
+   Assert (V.Element (1), 0, "first after reversed");
+
+   --  A number of workers that is not a power of two, so that one run has
+   --  no partner in the first merge pass
+
+   Fill (V, 50_000, 5);
+   Input := V;
+   Sort (V, Pool3);
+   Check (V, Input, "three workers");
+
+   --  Small vectors and a single worker fall back to a sequential sort
+
+   Fill (V, 500, 1);
+   Input := V;
+   Sort (V, Pool);
+   Check (V, Input, "small");
+
+   Fill (V, 5_000, 9);
+   Input := V;
+   Sort (V, Seq);
+   Check (V, Input, "single worker");
+
+   V.Clear;
+   Input.Clear;
+   Sort (V, Pool);
+   Check (V, Input, "empty");
+
+   Put_Line ("Done");
+end Main;
@@ -74,6 +74,22 @@ procedure Main is
        "<"     => "<",
        Threshold => 0,
        Swap    => Int_Vecs.Swap);
+   procedure Heapsort is new Conts.Algorithms.Heapsort
+      (Cursors => Int_Vecs.Cursors.Random_Access,
+       Getters => Int_Vecs.Maps.Element,
+       "<"     => "<",
+       Swap    => Int_Vecs.Swap);
+   procedure Pdqsort is new Conts.Algorithms.Pdqsort
+      (Cursors => Int_Vecs.Cursors.Random_Access,
+       Getters => Int_Vecs.Maps.Element,
+       "<"     => "<",
+       Swap    => Int_Vecs.Swap);
+   package Stable is new Conts.Algorithms.Stable_Sorting
+      (Cursors      => Int_Vecs.Cursors.Random_Access,
+       Element_Type => Integer,
+       Getters      => Int_Vecs.Maps.Element,
+       "<"          => "<",
+       Set          => Int_Vecs.Replace_Element);
    function Is_Sorted is new Conts.Algorithms.Is_Sorted
       (Cursors => Int_Vecs.Cursors.Forward,
        Getters => Int_Vecs.Maps.Element,
@@ -97,6 +113,15 @@ procedure Main is
    procedure Ada_Test (V : Int_Ada_Vecs.Vector; Msg : String);
    --  Test sorting on a standard Ada array
 
+   type Int_Array is array (Natural range <>) of Integer
+     with Convention => C;
+   procedure Std_Sort (Data : in out Int_Array; Count : Integer)
+     with Import, Convention => C, External_Name => "std_sort_integers";
+   --  Calls C++'s std::sort
+
+   procedure Cpp_Test (V : Vector; Msg : String);
+   --  Test sorting with std::sort on a copy of V
+
    ----------
    -- Dump --
    ----------
@@ -141,6 +166,9 @@ procedure Main is
    procedure Do_Sort_Quick      is new Do_Sort (Quicksort,   "quicksort     ");
    procedure Do_Sort_Quick_Pure is
       new Do_Sort (Quicksort_Pure, "quicksort_pure");
+   procedure Do_Sort_Heap       is new Do_Sort (Heapsort,    "heapsort      ");
+   procedure Do_Sort_Pdq        is new Do_Sort (Pdqsort,     "pdqsort       ");
+   procedure Do_Sort_Stable     is new Do_Sort (Stable.Sort, "stable-sort   ");
 
    ---------------
    -- Test_Sort --
@@ -157,6 +185,10 @@ procedure Main is
 
       Do_Sort_Quick      (V, Msg);
       Do_Sort_Quick_Pure (V, Msg);
+      Do_Sort_Heap       (V, Msg);
+      Do_Sort_Pdq        (V, Msg);
+      Do_Sort_Stable     (V, Msg);
+      Cpp_Test           (V, Msg);
    end Test_Sort;
 
    --------------
@@ -175,6 +207,32 @@ procedure Main is
       end if;
    end Ada_Test;
 
+   --------------
+   -- Cpp_Test --
+   --------------
+
+   procedure Cpp_Test (V : Vector; Msg : String) is
+      A     : Int_Array (0 .. Integer (V.Length) - 1);
+      Start : Time;
+      Dur   : Duration;
+   begin
+      for J in A'Range loop
+         A (J) := V.Element (J + 1);
+      end loop;
+
+      Start := Clock;
+      Std_Sort (A, A'Length);
+      Dur := Clock - Start;
+
+      for J in A'First + 1 .. A'Last loop
+         Assert (A (J - 1) <= A (J), True, "std::sort failed for " & Msg);
+      end loop;
+
+      if Perf then
+         Put_Line (Msg & " std::sort      =>" & Dur'Img & "s");
+      end if;
+   end Cpp_Test;
+
    V     : Vector;
    V2    : Int_Ada_Vecs.Vector;
    Val   : Extended_Index;
@@ -227,4 +285,49 @@ begin
    Test_Sort (V,  "random array  ");
    Ada_Test (V2,  "random array  ");
 
+   --  Organ pipe: increasing then decreasing
+
+   if Perf then
+      Put_Line ("--");
+   end if;
+   V.Clear;
+   V2.Clear;
+   for J in 1 .. Max loop
+      V.Append (Integer'Min (J, Max - J));
+      V2.Append (Integer'Min (J, Max - J));
+   end loop;
+   Test_Sort (V,  "organ pipe    ");
+   Ada_Test (V2,  "organ pipe    ");
+
+   --  Sorted, except for one element out of hundred
+
+   if Perf then
+      Put_Line ("--");
+   end if;
+   V.Clear;
+   V2.Clear;
+   for J in 1 .. Max loop
+      if J mod 100 = 0 then
+         Rand.Random (G, Val);
+      else
+         Val := J;
+      end if;
+      V.Append (Val);
+      V2.Append (Val);
+   end loop;
+   Test_Sort (V,  "mostly sorted ");
+   Ada_Test (V2,  "mostly sorted ");
+
+   --  Empty and single-element vectors
+
+   V.Clear;
+   Do_Sort_Heap   (V, "empty array   ");
+   Do_Sort_Pdq    (V, "empty array   ");
+   Do_Sort_Stable (V, "empty array   ");
+
+   V.Append (1);
+   Do_Sort_Heap   (V, "one element   ");
+   Do_Sort_Pdq    (V, "one element   ");
+   Do_Sort_Stable (V, "one element   ");
+
 end Main;
@@ -0,0 +1,133 @@
+------------------------------------------------------------------------------
+--                     Copyright (C) 2016, AdaCore                          --
+--                                                                          --
+-- This library is free software;  you can redistribute it and/or modify it --
+-- under terms of the  GNU General Public License  as published by the Free --
+-- Software  Foundation;  either version 3,  or (at your  option) any later --
+-- version. This library is distributed in the hope that it will be useful, --
+-- but WITHOUT ANY WARRANTY;  without even the implied warranty of MERCHAN- --
+-- TABILITY or FITNESS FOR A PARTICULAR PURPOSE.                            --
+--                                                                          --
+-- As a special exception under Section 7 of GPL version 3, you are granted --
+-- additional permissions described in the GCC Runtime Library Exception,   --
+-- version 3.1, as published by the Free Software Foundation.               --
+--                                                                          --
+-- You should have received a copy of the GNU General Public License and    --
+-- a copy of the GCC Runtime Library Exception along with this program;     --
+-- see the files COPYING3 and COPYING.RUNTIME respectively.  If not, see    --
+-- <http://www.gnu.org/licenses/>.                                          --
+--                                                                          --
+------------------------------------------------------------------------------
+
+pragma Ada_2012;
+with Ada.Finalization;
+with Asserts;                use Asserts;
+with Conts;                  use Conts;
+with Conts.Algorithms;
+with Conts.Vectors.Definite_Unbounded;
+with Ada.Text_IO;            use Ada.Text_IO;
+
+procedure Main is
+   use Asserts.Booleans, Asserts.Integers;
+
+   type Pair is record
+      Key, Seq : Integer;
+   end record;
+   function "<" (L, R : Pair) return Boolean is (L.Key < R.Key);
+
+   package Pair_Vecs is new Conts.Vectors.Definite_Unbounded
+      (Positive, Pair, Ada.Finalization.Controlled);
+   use Pair_Vecs;
+
+   package Sorting is new Conts.Algorithms.Stable_Sorting
+      (Cursors      => Pair_Vecs.Cursors.Random_Access,
+       Element_Type => Pair,
+       Getters      => Pair_Vecs.Maps.Element_From_Index,
+       Set          => Pair_Vecs.Replace_Element);
+
+   procedure Check (V : Vector; Msg : String);
+   --  Check that V is sorted, and that equal keys are in order of Seq
+
+   -----------
+   -- Check --
+   -----------
+
+   procedure Check (V : Vector; Msg : String) is
+   begin
+      for J in V.First + 1 .. V.Last loop
+         Assert (V.Element (J - 1).Key <= V.Element (J).Key, True,
+                 Msg & ": sorted at" & J'Img);
+         if V.Element (J - 1).Key = V.Element (J).Key then
+            Assert (V.Element (J - 1).Seq < V.Element (J).Seq, True,
+                    Msg & ": stable at" & J'Img);
+         end if;
+      end loop;
+   end Check;
+
+   V       : Vector;
+   Scratch : Sorting.Scratch_Buffer;
+   Seed    : Integer := 11;
+
+begin
+   --  Random keys with many duplicates
+
+   for J in 1 .. 10_000 loop
+      Seed := (Seed * 1_103 + 12_345) mod 10_007;
+      V.Append ((Key => Seed mod 100, Seq => J));
+   end loop;
+   Sorting.Sort (V, Scratch);
+   Check (V, "random");
+   Assert (Integer (V.Length), 10_000, "length after sort");
+
+   --  Decreasing runs, which are reversed only when strictly decreasing
+
+   V.Clear;
+   for J in 1 .. 5_000 loop
+      V.Append ((Key => (5_000 - J) / 3, Seq => J));
+   end loop;
+   Sorting.Sort (V, Scratch);
+   Check (V, "decreasing");
+
+   --  Strictly decreasing runs longer than the minimal run length, which
+   --  are reversed in place
+
+   V.Clear;
+   for J in 1 .. 300 loop
+      V.Append ((Key => 300 - J, Seq => J));
+   end loop;
+   for J in 301 .. 500 loop
+      V.Append ((Key => 1_000 - J, Seq => J));
+   end loop;
+   Sorting.Sort (V, Scratch);
+   Check (V, "strictly decreasing");
+   Assert (V.Element (1).Key, 0, "first after reversal");
+   Assert (V.Last_Element.Key, 699, "last after reversal");
+
+   --  Sorted runs of various lengths, reusing the same buffer
+
+   V.Clear;
+   for J in 1 .. 5_000 loop
+      V.Append ((Key => J mod 700, Seq => J));
+   end loop;
+   Sorting.Sort (V, Scratch);
+   Check (V, "runs");
+
+   --  Short vector, and the version with an internal buffer
+
+   V.Clear;
+   for J in 1 .. 20 loop
+      V.Append ((Key => J mod 3, Seq => J));
+   end loop;
+   Sorting.Sort (V);
+   Check (V, "short");
+   Assert (V.Element (1).Seq, 3, "first element");
+
+   --  Empty vector
+
+   V.Clear;
+   Sorting.Sort (V, Scratch);
+   Sorting.Sort (V);
+   Assert (Integer (V.Length), 0, "length of empty vector");
+
+   Put_Line ("Done");
+end Main;
@@ -0,0 +1,93 @@
+------------------------------------------------------------------------------
+--                     Copyright (C) 2016, AdaCore                          --
+--                                                                          --
+-- This library is free software;  you can redistribute it and/or modify it --
+-- under terms of the  GNU General Public License  as published by the Free --
+-- Software  Foundation;  either version 3,  or (at your  option) any later --
+-- version. This library is distributed in the hope that it will be useful, --
+-- but WITHOUT ANY WARRANTY;  without even the implied warranty of MERCHAN- --
+-- TABILITY or FITNESS FOR A PARTICULAR PURPOSE.                            --
+--                                                                          --
+-- As a special exception under Section 7 of GPL version 3, you are granted --
+-- additional permissions described in the GCC Runtime Library Exception,   --
+-- version 3.1, as published by the Free Software Foundation.               --
+--                                                                          --
+-- You should have received a copy of the GNU General Public License and    --
+-- a copy of the GCC Runtime Library Exception along with this program;     --
+-- see the files COPYING3 and COPYING.RUNTIME respectively.  If not, see    --
+-- <http://www.gnu.org/licenses/>.                                          --
+--                                                                          --
+------------------------------------------------------------------------------
+
+pragma Ada_2012;
+with Asserts;              use Asserts;
+with Conts;                use Conts;
+with Conts.Hashes;
+with Conts.Maps.Def_Def_Unbounded;
+with Conts.Maps.Shared;
+with Conts.Vectors.Definite_Unbounded;
+with Conts.Vectors.Shared;
+with Ada.Text_IO;          use Ada.Text_IO;
+
+procedure Main is
+   use Asserts.Booleans, Asserts.Integers, Asserts.Counts;
+
+   package Int_Vecs is new Conts.Vectors.Definite_Unbounded
+     (Positive, Integer, Conts.Limited_Base);
+   package Shared_Vecs is new Conts.Vectors.Shared (Int_Vecs.Vectors);
+   --  The underlying vector is limited: copies only happen in Write
+
+   package Int_Maps is new Conts.Maps.Def_Def_Unbounded
+     (Integer, Integer, Conts.Limited_Base, Conts.Hashes.Integer_Hash);
+   package Shared_Maps is new Conts.Maps.Shared (Int_Maps.Impl);
+
+   V1, V2, V3 : Shared_Vecs.Vector;
+   M1, M2     : Shared_Maps.Map;
+
+begin
+   Assert (V1.Length, 0, "length of empty vector");
+   Assert (V1.Read.Length, 0, "length of empty contents");
+
+   for J in 1 .. 10 loop
+      V1.Write.Append (J);
+   end loop;
+   Assert (V1.Is_Shared, False, "new vector is not shared");
+
+   V2 := V1;
+   V3 := V2;
+   Assert (V1.Is_Shared, True, "V1 shared after copy");
+   Assert (V2.Is_Shared, True, "V2 shared after copy");
+
+   --  Modifying V2 detaches it
+
+   V2.Write.Replace_Element (1, 100);
+   Assert (V2.Is_Shared, False, "V2 not shared after write");
+   Assert (V1.Is_Shared, True, "V1 still shared with V3");
+   Assert (V2.Read.Element (1), 100, "V2 modified");
+   Assert (V1.Read.Element (1), 1, "V1 unchanged");
+   Assert (V3.Read.Element (1), 1, "V3 unchanged");
+
+   V1.Clear;
+   Assert (V1.Length, 0, "V1 after clear");
+   Assert (V3.Is_Shared, False, "V3 no longer shared");
+   Assert (V3.Length, 10, "V3 after clearing V1");
+
+   --  Maps
+
+   for J in 1 .. 100 loop
+      M1.Write.Set (J, J * 2);
+   end loop;
+
+   M2 := M1;
+   Assert (M2.Is_Shared, True, "M2 shared after copy");
+   Assert (M2.Read.Get (50), 100, "M2 shares contents");
+
+   M2.Write.Delete (50);
+   Assert (M2.Is_Shared, False, "M2 not shared after write");
+   Assert (M1.Read.Contains (50), True, "M1 unchanged");
+   Assert (M2.Read.Contains (50), False, "M2 modified");
+   Assert (M1.Length, 100, "length of M1");
+   Assert (M2.Length, 99, "length of M2");
+
+   Put_Line ("Done");
+end Main;
@@ -0,0 +1,137 @@
+------------------------------------------------------------------------------
+--                     Copyright (C) 2016, AdaCore                          --
+--                                                                          --
+-- This library is free software;  you can redistribute it and/or modify it --
+-- under terms of the  GNU General Public License  as published by the Free --
+-- Software  Foundation;  either version 3,  or (at your  option) any later --
+-- version. This library is distributed in the hope that it will be useful, --
+-- but WITHOUT ANY WARRANTY;  without even the implied warranty of MERCHAN- --
+-- TABILITY or FITNESS FOR A PARTICULAR PURPOSE.                            --
+--                                                                          --
+-- As a special exception under Section 7 of GPL version 3, you are granted --
+-- additional permissions described in the GCC Runtime Library Exception,   --
+-- version 3.1, as published by the Free Software Foundation.               --
+--                                                                          --
+-- You should have received a copy of the GNU General Public License and    --
+-- a copy of the GCC Runtime Library Exception along with this program;     --
+-- see the files COPYING3 and COPYING.RUNTIME respectively.  If not, see    --
+-- <http://www.gnu.org/licenses/>.                                          --
+--                                                                          --
+------------------------------------------------------------------------------
+
+pragma Ada_2012;
+with Ada.Finalization;
+with Asserts;              use Asserts;
+with Conts;                use Conts;
+with Conts.Algorithms;
+with Conts.Deques.Definite_Bounded;
+with Conts.Deques.Definite_Unbounded;
+with Conts.Deques.Indefinite_Unbounded;
+with Ada.Text_IO;          use Ada.Text_IO;
+
+procedure Main is
+   use Asserts.Booleans, Asserts.Integers, Asserts.Counts;
+
+   package Int_Deques is new Conts.Deques.Definite_Unbounded
+     (Integer, Ada.Finalization.Controlled);
+   use Int_Deques;
+
+   package Bounded_Deques is new Conts.Deques.Definite_Bounded
+     (Integer, Ada.Finalization.Controlled);
+
+   package Str_Deques is new Conts.Deques.Indefinite_Unbounded (String);
+
+   procedure Sort is new Conts.Algorithms.Quicksort
+     (Cursors => Int_Deques.Cursors.Random_Access,
+      Getters => Int_Deques.Maps.Element);
+   function Is_Sorted is new Conts.Algorithms.Is_Sorted
+     (Cursors => Int_Deques.Cursors.Forward,
+      Getters => Int_Deques.Maps.Element);
+   function Find is new Conts.Algorithms.Find
+     (Cursors => Int_Deques.Cursors.Forward,
+      Getters => Int_Deques.Maps.Element);
+
+   D1, D2 : Deque;
+   B      : Bounded_Deques.Deque (Capacity => 4);
+   S      : Str_Deques.Deque;
+   Count  : Integer := 0;
+
+begin
+   Assert (D1.Is_Empty, True, "new deque is empty");
+
+   --  Add at both ends, so that the elements wrap around the end of the
+   --  buffer, then grow the buffer.
+
+   for J in 1 .. 10 loop
+      D1.Append (J);
+      D1.Prepend (-J);
+   end loop;
+   Assert (D1.Length, 20, "length after append and prepend");
+   Assert (D1.First_Element, -10, "first element");
+   Assert (D1.Last_Element, 10, "last element");
+   Assert (D1.Element (10), -1, "element 10");
+   Assert (D1.Element (11), 1, "element 11");
+
+   for E of D1 loop
+      Count := Count + E;
+   end loop;
+   Assert (Count, 0, "sum of elements");
+
+   D1.Delete_First;
+   D1.Delete_Last;
+   Assert (D1.Length, 18, "length after delete");
+   Assert (D1 (1), -9, "first element after delete");
+   Assert (D1 (18), 9, "last element after delete");
+
+   --  Copies are independent
+
+   D2 := D1;
+   D2.Replace_Element (1, 100);
+   Assert (D1 (1), -9, "original unchanged");
+   Assert (D2 (1), 100, "copy modified");
+
+   --  Algorithms
+
+   Assert (Find (D1, 5), 14, "find 5");
+   Sort (D2);
+   Assert (Is_Sorted (D2), True, "sorted");
+   Assert (D2 (1), -8, "smallest after sort");
+   Assert (D2.Last_Element, 100, "largest after sort");
+
+   D1.Clear;
+   Assert (D1.Length, 0, "length after clear");
+   Assert (D1.Capacity, 0, "capacity after clear");
+
+   --  A FIFO, which never needs to grow
+
+   D1.Reserve_Capacity (4);
+   for J in 1 .. 1_000 loop
+      D1.Append (J);
+      if D1.Length = 4 then
+         Assert (D1.First_Element, J - 3, "first in fifo");
+         D1.Delete_First;
+      end if;
+   end loop;
+   Assert (D1.Capacity, 4, "capacity of fifo");
+
+   --  Bounded deques
+
+   for J in 1 .. 3 loop
+      B.Append (J);
+   end loop;
+   B.Delete_First;
+   B.Append (4);
+   B.Prepend (1);
+   Assert (B.Length, 4, "length of bounded deque");
+   Assert (B (1), 1, "first of bounded deque");
+   Assert (B (4), 4, "last of bounded deque");
+
+   --  Indefinite elements
+
+   S.Append ("world");
+   S.Prepend ("hello");
+   S.Append ("!");
+   Put_Line (S (1) & " " & S (2) & S (3));
+
+   Put_Line ("Done");
+end Main;
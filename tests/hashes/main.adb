@@ -0,0 +1,79 @@
+------------------------------------------------------------------------------
+--                     Copyright (C) 2016, AdaCore                          --
+--                                                                          --
+-- This library is free software;  you can redistribute it and/or modify it --
+-- under terms of the  GNU General Public License  as published by the Free --
+-- Software  Foundation;  either version 3,  or (at your  option) any later --
+-- version. This library is distributed in the hope that it will be useful, --
+-- but WITHOUT ANY WARRANTY;  without even the implied warranty of MERCHAN- --
+-- TABILITY or FITNESS FOR A PARTICULAR PURPOSE.                            --
+--                                                                          --
+-- As a special exception under Section 7 of GPL version 3, you are granted --
+-- additional permissions described in the GCC Runtime Library Exception,   --
+-- version 3.1, as published by the Free Software Foundation.               --
+--                                                                          --
+-- You should have received a copy of the GNU General Public License and    --
+-- a copy of the GCC Runtime Library Exception along with this program;     --
+-- see the files COPYING3 and COPYING.RUNTIME respectively.  If not, see    --
+-- <http://www.gnu.org/licenses/>.                                          --
+--                                                                          --
+------------------------------------------------------------------------------
+
+pragma Ada_2012;
+with Ada.Finalization;
+with Asserts;              use Asserts;
+with Conts;                use Conts;
+with Conts.Elements.Definite;
+with Conts.Hashes;         use Conts.Hashes;
+with Conts.Maps.Generics;
+with Ada.Text_IO;          use Ada.Text_IO;
+
+procedure Main is
+   use Asserts.Booleans, Asserts.Counts;
+   use type Conts.Hash_Type;
+
+   type Color is (Red, Green, Blue);
+   function Color_Hash is new Discrete_Hash (Color);
+
+   package Int_Elements is new Conts.Elements.Definite (Integer);
+   package Maps is new Conts.Maps.Generics
+     (Keys                => Int_Elements.Traits,
+      Elements            => Int_Elements.Traits,
+      Hash                => Integer_Hash,
+      Probing             => Conts.Maps.Linear_Probing,
+      Pool                => Conts.Global_Pool,
+      Container_Base_Type => Ada.Finalization.Controlled);
+
+   Max : constant := 10_000;
+   M   : Maps.Map;
+
+begin
+   --  Reference values for xxHash32
+
+   Put_Line ("Hash of empty string is" & String_Hash ("")'Img);
+   Put_Line ("Hash of abc is" & String_Hash ("abc")'Img);
+   Put_Line
+     ("Hash of long string is"
+      & String_Hash ("Nobody inspects the spammish repetition")'Img);
+
+   Assert (String_Hash ("abc", Seed => 1) /= String_Hash ("abc"), True,
+           "seed is used");
+   Assert (Integer_Hash (1) /= Integer_Hash (2), True, "integer hash");
+   Assert (Color_Hash (Red) /= Color_Hash (Blue), True, "discrete hash");
+   Assert (Combine (Integer_Hash (1), Integer_Hash (2))
+             /= Combine (Integer_Hash (2), Integer_Hash (1)),
+           True, "combine depends on order");
+
+   --  Keys that are all multiples of a power of two would all be stored
+   --  in the same few slots with the identity hash.
+
+   for J in 1 .. Max loop
+      M.Set (J * 1024, J);
+   end loop;
+   Assert (M.Length, Max, "length with strided keys");
+   for J in 1 .. Max loop
+      Assert (M.Contains (J * 1024), True, "contains" & J'Img);
+   end loop;
+
+   Put_Line ("Done");
+end Main;
@@ -0,0 +1,106 @@
+------------------------------------------------------------------------------
+--                     Copyright (C) 2016, AdaCore                          --
+--                                                                          --
+-- This library is free software;  you can redistribute it and/or modify it --
+-- under terms of the  GNU General Public License  as published by the Free --
+-- Software  Foundation;  either version 3,  or (at your  option) any later --
+-- version. This library is distributed in the hope that it will be useful, --
+-- but WITHOUT ANY WARRANTY;  without even the implied warranty of MERCHAN- --
+-- TABILITY or FITNESS FOR A PARTICULAR PURPOSE.                            --
+--                                                                          --
+-- As a special exception under Section 7 of GPL version 3, you are granted --
+-- additional permissions described in the GCC Runtime Library Exception,   --
+-- version 3.1, as published by the Free Software Foundation.               --
+--                                                                          --
+-- You should have received a copy of the GNU General Public License and    --
+-- a copy of the GCC Runtime Library Exception along with this program;     --
+-- see the files COPYING3 and COPYING.RUNTIME respectively.  If not, see    --
+-- <http://www.gnu.org/licenses/>.                                          --
+--                                                                          --
+------------------------------------------------------------------------------
+
+pragma Ada_2012;
+with Asserts;                use Asserts;
+with Conts;                  use Conts;
+with Conts.Algorithms;
+with Conts.Lists.Singly_Definite_Unbounded;
+with Conts.Lists.Singly_Indefinite_Unbounded;
+with Ada.Text_IO;            use Ada.Text_IO;
+
+procedure Main is
+   use Asserts.Booleans, Asserts.Integers, Asserts.Counts;
+
+   package Int_Lists is new Conts.Lists.Singly_Definite_Unbounded (Integer);
+   use Int_Lists;
+   package Str_Lists is new Conts.Lists.Singly_Indefinite_Unbounded (String);
+
+   function Is_Even (E : Integer) return Boolean is (E mod 2 = 0);
+
+   function Count_If is new Conts.Algorithms.Count_If
+     (Int_Lists.Cursors.Forward, Int_Lists.Maps.Element);
+   function Contains is new Conts.Algorithms.Contains
+     (Int_Lists.Cursors.Forward, Int_Lists.Maps.Element);
+
+   L1, L2 : Int_Lists.List;
+   C      : Int_Lists.Cursor;
+   S      : Str_Lists.List;
+   Sum    : Integer;
+
+begin
+   --  Use the list as a stack
+
+   for J in 1 .. 5 loop
+      L1.Prepend (J);
+   end loop;
+   Assert (L1.Length, 5, "length after push");
+   Assert (L1.First_Element, 5, "top of stack");
+   L1.Delete_First;
+   Assert (L1.First_Element, 4, "top of stack after pop");
+
+   --  4, 3, 2, 1 => 4, 3, 30, 2, 1, 10
+
+   C := L1.Next (L1.First);
+   L1.Insert_After (C, 30);
+   L1.Append (10);
+   Assert (L1.Length, 6, "length after insert");
+
+   Sum := 0;
+   C := L1.First;
+   while L1.Has_Element (C) loop
+      Sum := Sum * 10 + L1.Element (C) mod 10;
+      C := L1.Next (C);
+   end loop;
+   Assert (Sum, 430_210, "contents after insert");
+
+   --  Remove the last element, then check the tail is still correct
+
+   C := L1.First;
+   while L1.Has_Element (L1.Next (L1.Next (C))) loop
+      C := L1.Next (C);
+   end loop;
+   L1.Delete_After (C);
+   L1.Append (7);
+   Assert (L1.Length, 6, "length after delete");
+
+   L2 := L1;
+   L1.Clear;
+   Assert (L1.Is_Empty, True, "cleared list is empty");
+
+   Sum := 0;
+   for E of L2 loop
+      Sum := Sum + E;
+   end loop;
+   Assert (Sum, 47, "sum after copy");
+   Assert (Count_If (L2, Is_Even'Access), 3, "count even");
+   Assert (Contains (L2, 30), True, "contains 30");
+   Assert (Contains (L2, 10), False, "contains 10");
+
+   S.Prepend ("world");
+   S.Prepend ("hello");
+   for E of S loop
+      Put (E & " ");
+   end loop;
+   New_Line;
+
+   Put_Line ("Done");
+end Main;
@@ -0,0 +1,158 @@
+------------------------------------------------------------------------------
+--                     Copyright (C) 2016, AdaCore                          --
+--                                                                          --
+-- This library is free software;  you can redistribute it and/or modify it --
+-- under terms of the  GNU General Public License  as published by the Free --
+-- Software  Foundation;  either version 3,  or (at your  option) any later --
+-- version. This library is distributed in the hope that it will be useful, --
+-- but WITHOUT ANY WARRANTY;  without even the implied warranty of MERCHAN- --
+-- TABILITY or FITNESS FOR A PARTICULAR PURPOSE.                            --
+--                                                                          --
+-- As a special exception under Section 7 of GPL version 3, you are granted --
+-- additional permissions described in the GCC Runtime Library Exception,   --
+-- version 3.1, as published by the Free Software Foundation.               --
+--                                                                          --
+-- You should have received a copy of the GNU General Public License and    --
+-- a copy of the GCC Runtime Library Exception along with this program;     --
+-- see the files COPYING3 and COPYING.RUNTIME respectively.  If not, see    --
+-- <http://www.gnu.org/licenses/>.                                          --
+--                                                                          --
+------------------------------------------------------------------------------
+
+pragma Ada_2012;
+with Asserts;                use Asserts;
+with Conts;                  use Conts;
+with Conts.Lists.Definite_Bounded;
+with Conts.Lists.Definite_Unbounded;
+with Conts.Lists.Indefinite_Unbounded;
+with Ada.Text_IO;            use Ada.Text_IO;
+
+procedure Main is
+   use Asserts.Booleans, Asserts.Integers, Asserts.Counts;
+
+   type Pair is record
+      Key, Seq : Integer;
+   end record;
+   function "<" (L, R : Pair) return Boolean is (L.Key < R.Key);
+
+   package Pair_Lists is new Conts.Lists.Definite_Unbounded (Pair);
+   package Pair_Sorting is new Pair_Lists.Lists.Generic_Sorting;
+   use Pair_Lists, Pair_Sorting;
+
+   package Int_Lists is new Conts.Lists.Definite_Bounded (Integer);
+   package Int_Sorting is new Int_Lists.Lists.Generic_Sorting;
+
+   package Str_Lists is new Conts.Lists.Indefinite_Unbounded (String);
+   package Str_Sorting is new Str_Lists.Lists.Generic_Sorting;
+
+   L1, L2 : Pair_Lists.List;
+   C, C2  : Pair_Lists.Cursor;
+   B1, B2 : Int_Lists.List (20);
+   BC     : Int_Lists.Cursor;
+   S      : Str_Lists.List;
+   Prev   : Pair;
+   Seed   : Integer := 7;
+
+begin
+   --  Stable sort: elements with equal keys keep their order
+
+   for J in 1 .. 1_000 loop
+      Seed := (Seed * 1_103 + 12_345) mod 10_007;
+      L1.Append ((Key => Seed mod 50, Seq => J));
+   end loop;
+   C := L1.First;   --  cursors remain valid
+   Prev := L1.Element (C);
+
+   Sort (L1);
+   Assert (Is_Sorted (L1), True, "list is sorted");
+   Assert (L1.Length, 1_000, "length after sort");
+   Assert (L1.Element (C) = Prev, True, "cursor still valid");
+   Assert (L1.Element (L1.Last).Key, 49, "last key");
+
+   Prev := L1.Element (L1.First);
+   C := L1.Next (L1.First);
+   while L1.Has_Element (C) loop
+      if L1.Element (C).Key = Prev.Key then
+         Assert (Prev.Seq < L1.Element (C).Seq, True, "sort is stable");
+      end if;
+      Prev := L1.Element (C);
+      C := L1.Next (C);
+   end loop;
+
+   --  Merge two sorted lists
+
+   for J in 1 .. 10 loop
+      L2.Append ((Key => J * 5, Seq => -J));
+   end loop;
+   Merge (L1, L2);
+   Assert (L2.Length, 0, "source empty after merge");
+   Assert (L1.Length, 1_010, "length after merge");
+   Assert (Is_Sorted (L1), True, "sorted after merge");
+
+   C := L1.First;
+   while L1.Element (C).Key /= 5 loop
+      C := L1.Next (C);
+   end loop;
+   while L1.Element (C).Key = 5 loop
+      Prev := L1.Element (C);
+      C := L1.Next (C);
+   end loop;
+   Assert (Prev.Seq, -1, "merged elements come after existing ones");
+
+   --  Splice whole lists and single elements
+
+   L2.Append ((Key => -1, Seq => 0));
+   L2.Append ((Key => -2, Seq => 0));
+   C := L2.First;
+   Splice (L1, L1.First, L2);
+   Assert (L2.Length, 0, "source empty after splice");
+   Assert (L1.Length, 1_012, "length after splice");
+   Assert (L1.Element (L1.First).Key, -1, "first after splice");
+   Assert (L1.Element (C).Key, -1, "cursor moved with its element");
+
+   C2 := L1.Last;
+   Splice (L1, L1.First, L1, C2);
+   Assert (L1.Element (L1.First).Key, 50, "element moved to the front");
+   Assert (L1.Element (L1.Last).Key, 49, "last unchanged");
+   Assert (L1.Length, 1_012, "length after move");
+
+   C2 := L1.Next (L1.First);
+   Splice (L2, Pair_Lists.Lists.No_Element, L1, C2);
+   Assert (L2.Element (C2).Key, -1, "element moved to another list");
+   Assert (L1.Length, 1_011, "length after moving out");
+   Assert (L2.Length, 1, "length after moving in");
+
+   --  Bounded lists store nodes in an array, so splicing needs to move
+   --  the elements to new nodes.
+
+   for J in reverse 1 .. 5 loop
+      B1.Append (J * 2);
+      B2.Append (J * 2 + 1);
+   end loop;
+   Int_Sorting.Sort (B1);
+   Int_Sorting.Sort (B2);
+   Int_Sorting.Merge (B1, B2);
+   Assert (Int_Sorting.Is_Sorted (B1), True, "bounded merge");
+   Assert (B1.Length, 10, "bounded length");
+   Assert (B2.Length, 0, "bounded source empty");
+
+   BC := B1.First;
+   Int_Lists.Lists.Splice (B2, Int_Lists.Lists.No_Element, B1, BC);
+   Assert (B2.Element (BC), 2, "bounded single splice");
+   Int_Lists.Lists.Splice (B2, Int_Lists.Lists.No_Element, B1);
+   Assert (B2.Length, 10, "bounded splice");
+   Assert (Int_Sorting.Is_Sorted (B2), True, "bounded splice preserves order");
+   B2.Append (100);
+   Assert (B2.Length, 11, "bounded append after splice");
+
+   S.Append ("pear");
+   S.Append ("apple");
+   S.Append ("orange");
+   Str_Sorting.Sort (S);
+   for E of S loop
+      Put (E & " ");
+   end loop;
+   New_Line;
+
+   Put_Line ("Done");
+end Main;
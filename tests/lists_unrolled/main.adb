@@ -0,0 +1,173 @@
+------------------------------------------------------------------------------
+--                     Copyright (C) 2016, AdaCore                          --
+--                                                                          --
+-- This library is free software;  you can redistribute it and/or modify it --
+-- under terms of the  GNU General Public License  as published by the Free --
+-- Software  Foundation;  either version 3,  or (at your  option) any later --
+-- version. This library is distributed in the hope that it will be useful, --
+-- but WITHOUT ANY WARRANTY;  without even the implied warranty of MERCHAN- --
+-- TABILITY or FITNESS FOR A PARTICULAR PURPOSE.                            --
+--                                                                          --
+-- As a special exception under Section 7 of GPL version 3, you are granted --
+-- additional permissions described in the GCC Runtime Library Exception,   --
+-- version 3.1, as published by the Free Software Foundation.               --
+--                                                                          --
+-- You should have received a copy of the GNU General Public License and    --
+-- a copy of the GCC Runtime Library Exception along with this program;     --
+-- see the files COPYING3 and COPYING.RUNTIME respectively.  If not, see    --
+-- <http://www.gnu.org/licenses/>.                                          --
+--                                                                          --
+------------------------------------------------------------------------------
+
+pragma Ada_2012;
+with Ada.Finalization;
+with Ada.Strings.Unbounded;  use Ada.Strings.Unbounded;
+with Asserts;                use Asserts;
+with Conts;                  use Conts;
+with Conts.Elements.Definite;
+with Conts.Lists.Definite_Unrolled;
+with Conts.Lists.Generics;
+with Conts.Lists.Storage.Unrolled;
+with Ada.Text_IO;            use Ada.Text_IO;
+
+procedure Main is
+   use Asserts.Booleans, Asserts.Integers, Asserts.Counts;
+
+   package Int_Lists is new Conts.Lists.Definite_Unrolled
+     (Integer, Block_Capacity => 4);
+   package Int_Sorting is new Int_Lists.Lists.Generic_Sorting;
+   use Int_Lists;
+
+   package Str_Elements is new Conts.Elements.Definite (Unbounded_String);
+   package Str_Storage is new Conts.Lists.Storage.Unrolled
+     (Str_Elements.Traits, Ada.Finalization.Controlled, Conts.Global_Pool,
+      Block_Capacity => 3);
+   package Str_Lists is new Conts.Lists.Generics (Str_Storage.Traits);
+
+   type Int_Array is array (Positive range <>) of Integer;
+
+   procedure Check (L : Int_Lists.List; Expected : Int_Array; Msg : String);
+   --  Check the contents of L, traversing it in both directions
+
+   -----------
+   -- Check --
+   -----------
+
+   procedure Check (L : Int_Lists.List; Expected : Int_Array; Msg : String) is
+      C : Int_Lists.Cursor := L.First;
+   begin
+      Assert (L.Length, Expected'Length, Msg & " (length)");
+      for E of Expected loop
+         Assert (L.Has_Element (C), True, Msg & " (forward)");
+         Assert (L.Element (C), E, Msg & " (forward)");
+         C := L.Next (C);
+      end loop;
+      Assert (L.Has_Element (C), False, Msg & " (end)");
+
+      C := L.Last;
+      for J in reverse Expected'Range loop
+         Assert (L.Has_Element (C), True, Msg & " (backward)");
+         Assert (L.Element (C), Expected (J), Msg & " (backward)");
+         C := L.Previous (C);
+      end loop;
+      Assert (L.Has_Element (C), False, Msg & " (start)");
+   end Check;
+
+   L1, L2 : Int_Lists.List;
+   C, C5  : Int_Lists.Cursor;
+   S1, S2 : Str_Lists.List;
+   Sum    : Integer;
+
+begin
+   for J in 1 .. 10 loop
+      L1.Append (J);
+      if J = 5 then
+         C5 := L1.Last;
+      end if;
+   end loop;
+   Check (L1, (1, 2, 3, 4, 5, 6, 7, 8, 9, 10), "append");
+
+   --  Cursors remain valid when other elements are inserted or deleted
+
+   L1.Insert (Before => C5, Element => 100, Count => 3);
+   Check (L1, (1, 2, 3, 4, 100, 100, 100, 5, 6, 7, 8, 9, 10), "insert");
+   Assert (L1.Element (C5), 5, "element at stable cursor after insert");
+
+   C := L1.First;
+   L1.Delete (C);
+   C := L1.Next (C5);
+   L1.Delete (C, Count => 2);
+   Check (L1, (2, 3, 4, 100, 100, 100, 5, 8, 9, 10), "delete");
+   Assert (L1.Element (C5), 5, "element at stable cursor after delete");
+
+   L1.Insert (Before => L1.First, Element => 0);
+   L1.Append (11);
+   Check (L1, (0, 2, 3, 4, 100, 100, 100, 5, 8, 9, 10, 11), "reinsert");
+
+   --  Move elements within the list
+
+   C := L1.Last;
+   Int_Lists.Lists.Splice (L1, C5, L1, C);
+   Check (L1, (0, 2, 3, 4, 100, 100, 100, 11, 5, 8, 9, 10), "splice");
+   Assert (L1.Element (C), 11, "cursor moved with its element");
+
+   Int_Sorting.Sort (L1);
+   Check (L1, (0, 2, 3, 4, 5, 8, 9, 10, 11, 100, 100, 100), "sort");
+   Assert (L1.Element (C5), 5, "element at stable cursor after sort");
+
+   --  Copies
+
+   L2 := L1;
+   Check (L2, (0, 2, 3, 4, 5, 8, 9, 10, 11, 100, 100, 100), "copy");
+   L2.Append (7);
+   Check (L1, (0, 2, 3, 4, 5, 8, 9, 10, 11, 100, 100, 100), "copy is deep");
+
+   L1.Clear;
+   Check (L1, (1 .. 0 => 0), "clear");
+   L1.Append (1);
+   Check (L1, (1 => 1), "single element");
+   L1.Assign (L2);
+   Check (L1, (0, 2, 3, 4, 5, 8, 9, 10, 11, 100, 100, 100, 7), "assign");
+
+   --  Large lists, and deleting all elements of some blocks
+
+   L1.Clear;
+   for J in 1 .. 1_000 loop
+      L1.Append (J);
+   end loop;
+
+   C := L1.First;
+   for J in 1 .. 10 loop
+      C := L1.Next (C);
+   end loop;
+   L1.Delete (C, Count => 500);
+   Assert (L1.Length, 500, "length after deleting blocks");
+
+   Sum := 0;
+   for E of L1 loop
+      Sum := Sum + E;
+   end loop;
+   Assert (Sum, 55 + 370_195, "sum with for-of loop");
+
+   Sum := 0;
+   C := L1.Last;
+   while L1.Has_Element (C) loop
+      Sum := Sum + L1.Element (C);
+      C := L1.Previous (C);
+   end loop;
+   Assert (Sum, 55 + 370_195, "sum with backward loop");
+
+   for J in 1 .. 7 loop
+      S1.Append (To_Unbounded_String (J'Img));
+   end loop;
+   S2 := S1;
+   S1.Clear;
+   Assert (S2.Length, 7, "length of string list");
+   Assert (S2.Element (S2.Last) = To_Unbounded_String (" 7"), True,
+           "last string");
+   S1.Append (To_Unbounded_String ("a"));
+   S2.Assign (S1);
+   Assert (S2.Length, 1, "length after assign");
+
+   Put_Line ("Done");
+end Main;
@@ -22,9 +22,12 @@
 pragma Ada_2012;
 with System.Assertions;    use System.Assertions;
 with Ada.Finalization;
+with Conts.Adaptors;
 with Conts.Maps.Indef_Def_Unbounded;
+with Conts.Properties;
 with Ada.Strings.Hash;
 with Ada.Text_IO;          use Ada.Text_IO;
+with Conts;                use Conts;
 
 procedure Main is
 
@@ -34,7 +37,35 @@ procedure Main is
       Container_Base_Type => Ada.Finalization.Controlled,
       Hash                => Ada.Strings.Hash);
 
-   M : Maps.Map;
+   type Int_Array is array (Positive range <>) of Integer;
+   package Int_Arrays is new Conts.Adaptors.Array_Adaptors
+     (Positive, Integer, Int_Array);
+
+   function Image
+     (Self : Int_Array; Position : Int_Arrays.Extended_Index) return String
+     is (Self (Position)'Img);
+   package Images is new Conts.Properties.Read_Only_Maps
+     (Int_Array, Int_Arrays.Extended_Index, String, Image);
+
+   procedure Set_Many is new Maps.Impl.Set_Many
+     (Cursors      => Int_Arrays.Cursors.Forward,
+      Get_Keys     => Images,
+      Get_Elements => Int_Arrays.Maps.Element);
+
+   type Slice is record
+      First, Last : Positive;
+   end record;
+   Buffer : constant String := "key 12 and 5000";
+   --  Alternate keys, which designate a part of Buffer
+
+   function Hash (S : Slice) return Hash_Type
+     is (Ada.Strings.Hash (Buffer (S.First .. S.Last)));
+   function "=" (Left : Slice; Right : Maps.Keys.Traits.Stored) return Boolean
+     is (Buffer (Left.First .. Left.Last) = Right.all);
+   package Slices is new Maps.Impl.Alternate_Keys (Slice, Hash);
+
+   M   : Maps.Map;
+   Cap : Count_Type;
 
 begin
    --  Check looking for an element in an empty table
@@ -75,4 +106,42 @@ begin
       when Constraint_Error | Assert_Failure =>
          null;   --  expected
    end;
+
+   --  Insert and delete lots of keys. Since the number of elements stays
+   --  small, the table should be rehashed in place instead of growing.
+
+   Cap := M.Capacity;
+   for J in 1 .. 10_000 loop
+      M.Set (J'Img, J);
+      M.Delete (J'Img);
+   end loop;
+
+   if M.Capacity /= Cap then
+      Put_Line ("Error, capacity changed from" & Cap'Img
+                & " to" & M.Capacity'Img);
+   end if;
+
+   Put_Line ("Value for ten is " & M ("ten")'Img);
+
+   --  Bulk insertion
+
+   M.Clear;
+   declare
+      A : Int_Array (1 .. 1_000);
+   begin
+      for J in A'Range loop
+         A (J) := J;
+      end loop;
+      Set_Many (M, A);
+   end;
+   Set_Many (M, (11, 12, 2_000));
+   Put_Line ("Length after Set_Many is" & M.Length'Img);
+   Put_Line ("Value for 12 is " & M (" 12")'Img);
+
+   --  Lookups without creating a temporary string
+
+   Put_Line ("Value for slice is " & Slices.Get (M, (4, 6))'Img);
+   Put_Line ("Contains 5000 is " & Slices.Contains (M, (11, 15))'Img);
+   Slices.Delete (M, (4, 6));
+   Put_Line ("Length after deleting slice is" & M.Length'Img);
 end Main;
@@ -0,0 +1,125 @@
+------------------------------------------------------------------------------
+--                     Copyright (C) 2016, AdaCore                          --
+--                                                                          --
+-- This library is free software;  you can redistribute it and/or modify it --
+-- under terms of the  GNU General Public License  as published by the Free --
+-- Software  Foundation;  either version 3,  or (at your  option) any later --
+-- version. This library is distributed in the hope that it will be useful, --
+-- but WITHOUT ANY WARRANTY;  without even the implied warranty of MERCHAN- --
+-- TABILITY or FITNESS FOR A PARTICULAR PURPOSE.                            --
+--                                                                          --
+-- As a special exception under Section 7 of GPL version 3, you are granted --
+-- additional permissions described in the GCC Runtime Library Exception,   --
+-- version 3.1, as published by the Free Software Foundation.               --
+--                                                                          --
+-- You should have received a copy of the GNU General Public License and    --
+-- a copy of the GCC Runtime Library Exception along with this program;     --
+-- see the files COPYING3 and COPYING.RUNTIME respectively.  If not, see    --
+-- <http://www.gnu.org/licenses/>.                                          --
+--                                                                          --
+------------------------------------------------------------------------------
+
+pragma Ada_2012;
+with Ada.Finalization;
+with Asserts;              use Asserts;
+with Conts;                use Conts;
+with Conts.Elements.Definite;
+with Conts.Hashes;
+with Conts.Maps.Compact;
+with Ada.Text_IO;          use Ada.Text_IO;
+
+procedure Main is
+   use Asserts.Booleans, Asserts.Integers, Asserts.Counts;
+
+   package Int_Elements is new Conts.Elements.Definite (Integer);
+   package Maps is new Conts.Maps.Compact
+     (Keys                => Int_Elements.Traits,
+      Elements            => Int_Elements.Traits,
+      Hash                => Conts.Hashes.Integer_Hash,
+      Probing             => Conts.Maps.Perturbation_Probing,
+      Pool                => Conts.Global_Pool,
+      Container_Base_Type => Ada.Finalization.Controlled);
+
+   Max    : constant := 1_000;
+   M, M2  : Maps.Map;
+   N      : Natural;
+   Expect : Integer;
+
+begin
+   --  Insert keys in decreasing order: iteration must return them in the
+   --  same order, even after the map grew several times.
+
+   for J in reverse 1 .. Max loop
+      M.Set (J, J * 10);
+   end loop;
+   Assert (M.Length, Max, "length after insert");
+
+   N := 0;
+   for Key of M loop
+      Assert (Key, Max - N, "insertion order");
+      Assert (M.Get (Key), Key * 10, "value for" & Key'Img);
+      N := N + 1;
+   end loop;
+   Assert (N, Max, "number of keys");
+
+   --  Replacing a value keeps the position of the key
+
+   M.Set (Max, 0);
+   Assert (M.As_Key (M.First), Max, "first key after replace");
+   Assert (M.As_Element (M.First), 0, "first element after replace");
+
+   --  Delete the even keys, then insert them again: they are now at the
+   --  end of the map.
+
+   for J in 1 .. Max loop
+      if J mod 2 = 0 then
+         M.Delete (J);
+      end if;
+   end loop;
+   Assert (M.Length, Max / 2, "length after delete");
+
+   for J in 1 .. Max loop
+      Assert (M.Contains (J), J mod 2 = 1, "contains" & J'Img);
+   end loop;
+
+   M2 := M;
+
+   for J in 1 .. Max loop
+      if J mod 2 = 0 then
+         M.Set (J, J);
+      end if;
+   end loop;
+   Assert (M.Length, Max, "length after reinsert");
+
+   N := 0;
+   for Key of M loop
+      if N < Max / 2 then
+         Expect := Max - 1 - N * 2;   --  odd keys, in decreasing order
+      else
+         Expect := (N - Max / 2 + 1) * 2;   --  then even keys
+      end if;
+      Assert (Key, Expect, "order after reinsert");
+      N := N + 1;
+   end loop;
+   Assert (N, Max, "number of keys after reinsert");
+
+   --  The copy was made before the even keys were inserted again
+
+   Assert (M2.Length, Max / 2, "length of copy");
+   Assert (M2.Contains (2), False, "copy contains 2");
+   Assert (M2.As_Key (M2.First), Max - 1, "first key in copy");
+
+   M.Delete (Max + 1);
+   Assert (M.Length, Max, "length after deleting missing key");
+
+   M2.Reserve_Capacity (Max * 4);
+   Assert (M2.Capacity >= Max * 4, True, "capacity after reserve");
+   Assert (M2.Length, Max / 2, "length after reserve");
+
+   M.Clear;
+   Assert (M.Length, 0, "length after clear");
+   Assert (M.Contains (1), False, "contains after clear");
+   Assert (M.Has_Element (M.First), False, "first in empty map");
+
+   Put_Line ("Done");
+end Main;
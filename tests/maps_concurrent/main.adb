@@ -0,0 +1,101 @@
+------------------------------------------------------------------------------
+--                     Copyright (C) 2016, AdaCore                          --
+--                                                                          --
+-- This library is free software;  you can redistribute it and/or modify it --
+-- under terms of the  GNU General Public License  as published by the Free --
+-- Software  Foundation;  either version 3,  or (at your  option) any later --
+-- version. This library is distributed in the hope that it will be useful, --
+-- but WITHOUT ANY WARRANTY;  without even the implied warranty of MERCHAN- --
+-- TABILITY or FITNESS FOR A PARTICULAR PURPOSE.                            --
+--                                                                          --
+-- As a special exception under Section 7 of GPL version 3, you are granted --
+-- additional permissions described in the GCC Runtime Library Exception,   --
+-- version 3.1, as published by the Free Software Foundation.               --
+--                                                                          --
+-- You should have received a copy of the GNU General Public License and    --
+-- a copy of the GCC Runtime Library Exception along with this program;     --
+-- see the files COPYING3 and COPYING.RUNTIME respectively.  If not, see    --
+-- <http://www.gnu.org/licenses/>.                                          --
+--                                                                          --
+------------------------------------------------------------------------------
+
+pragma Ada_2012;
+with Asserts;              use Asserts;
+with Conts;                use Conts;
+with Conts.Elements.Definite;
+with Conts.Hashes;
+with Conts.Maps.Concurrent;
+with Ada.Text_IO;          use Ada.Text_IO;
+
+procedure Main is
+   use Asserts.Booleans, Asserts.Integers, Asserts.Counts;
+
+   package Int_Elements is new Conts.Elements.Definite (Integer);
+   package Maps is new Conts.Maps.Concurrent
+     (Keys     => Int_Elements.Traits,
+      Elements => Int_Elements.Traits,
+      Hash     => Conts.Hashes.Integer_Hash,
+      Probing  => Conts.Maps.Perturbation_Probing,
+      Pool     => Conts.Global_Pool);
+
+   Task_Count : constant := 4;
+   Per_Task   : constant := 10_000;
+   M          : Maps.Map;
+   Sum        : Integer := 0;
+
+   task type Worker is
+      entry Start (Id : Natural);
+   end Worker;
+
+   task body Worker is
+      First : Natural;
+   begin
+      accept Start (Id : Natural) do
+         First := Id * Per_Task;
+      end Start;
+
+      for J in First + 1 .. First + Per_Task loop
+         M.Set (J, J);
+      end loop;
+
+      --  Delete half of our own keys, while other tasks are inserting
+
+      for J in First + 1 .. First + Per_Task loop
+         if J mod 2 = 0 then
+            M.Delete (J);
+         end if;
+      end loop;
+   end Worker;
+
+   procedure Add (Key : Integer; Element : Integer);
+   procedure Add (Key : Integer; Element : Integer) is
+   begin
+      Assert (Key, Element, "element for" & Key'Img);
+      Sum := Sum + 1;
+   end Add;
+
+   procedure Count is new Maps.Iterate (Add);
+
+begin
+   declare
+      Workers : array (0 .. Task_Count - 1) of Worker;
+   begin
+      for W in Workers'Range loop
+         Workers (W).Start (W);
+      end loop;
+   end;  --  wait for all tasks to terminate
+
+   Assert (M.Length, Task_Count * Per_Task / 2, "length");
+   for J in 1 .. Task_Count * Per_Task loop
+      Assert (M.Contains (J), J mod 2 = 1, "contains" & J'Img);
+   end loop;
+   Assert (M.Get (3), 3, "get");
+
+   Count (M);
+   Assert (Sum, Task_Count * Per_Task / 2, "number of elements iterated");
+
+   M.Clear;
+   Assert (M.Length, 0, "length after clear");
+
+   Put_Line ("Done");
+end Main;
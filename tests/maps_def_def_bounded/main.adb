@@ -0,0 +1,103 @@
+------------------------------------------------------------------------------
+--                     Copyright (C) 2016, AdaCore                          --
+--                                                                          --
+-- This library is free software;  you can redistribute it and/or modify it --
+-- under terms of the  GNU General Public License  as published by the Free --
+-- Software  Foundation;  either version 3,  or (at your  option) any later --
+-- version. This library is distributed in the hope that it will be useful, --
+-- but WITHOUT ANY WARRANTY;  without even the implied warranty of MERCHAN- --
+-- TABILITY or FITNESS FOR A PARTICULAR PURPOSE.                            --
+--                                                                          --
+-- As a special exception under Section 7 of GPL version 3, you are granted --
+-- additional permissions described in the GCC Runtime Library Exception,   --
+-- version 3.1, as published by the Free Software Foundation.               --
+--                                                                          --
+-- You should have received a copy of the GNU General Public License and    --
+-- a copy of the GCC Runtime Library Exception along with this program;     --
+-- see the files COPYING3 and COPYING.RUNTIME respectively.  If not, see    --
+-- <http://www.gnu.org/licenses/>.                                          --
+--                                                                          --
+------------------------------------------------------------------------------
+
+pragma Ada_2012;
+with Ada.Finalization;
+with Asserts;              use Asserts;
+with Conts;                use Conts;
+with Conts.Maps.Def_Def_Bounded;
+with Ada.Text_IO;          use Ada.Text_IO;
+
+procedure Main is
+   use Asserts.Booleans, Asserts.Integers, Asserts.Counts;
+
+   function Hash (Key : Integer) return Hash_Type
+     is (Hash_Type'Mod (Key));
+
+   Max : constant := 100;
+
+   package Maps is new Conts.Maps.Def_Def_Bounded
+     (Key_Type            => Integer,
+      Element_Type        => Integer,
+      Capacity            => Max,
+      Container_Base_Type => Ada.Finalization.Controlled,
+      Hash                => Hash);
+
+   M, M2, M3 : Maps.Map;
+
+begin
+   for J in 1 .. Max loop
+      M.Set (J, J);
+   end loop;
+   Assert (M.Length, Max, "length when full");
+
+   --  Replacing an element is still possible when the map is full
+
+   M.Set (1, 10);
+   Assert (M.Get (1), 10, "value after replace");
+
+   begin
+      M.Set (Max + 1, 0);
+      Put_Line ("Error, map should be full");
+   exception
+      when Constraint_Error =>
+         null;   --  expected
+   end;
+
+   --  Lots of inserts and deletes, which leave dummy slots behind. These
+   --  are removed without ever resizing the table.
+
+   for J in Max + 1 .. 100 * Max loop
+      M.Delete (J - Max);
+      M.Set (J, J);
+   end loop;
+   Assert (M.Length, Max, "length after churn");
+
+   for J in 99 * Max + 1 .. 100 * Max loop
+      Assert (M.Get (J), J, "value for" & J'Img);
+   end loop;
+
+   --  Copies have their own table
+
+   M2 := M;
+   M2.Clear;
+   Assert (M.Length, Max, "length after clearing copy");
+   Assert (M.Contains (100 * Max), True, "contains after clearing copy");
+   Assert (M2.Contains (100 * Max), False, "copy was cleared");
+
+   --  Same with Assign: changes to the copy are made in its own table
+
+   M3.Assign (M);
+   M3.Delete (100 * Max);
+   M3.Set (1, 1);
+   Assert (M3.Get (1), 1, "value in assigned copy");
+   Assert (M.Contains (1), False, "source unchanged by copy");
+   Assert (M.Contains (100 * Max), True, "source keeps deleted key");
+   Assert (M3.Length, Max, "length of assigned copy");
+
+   --  Assigning to a map that is not empty replaces all its elements
+
+   M3.Assign (M2);
+   Assert (M3.Length, 0, "length after assigning empty map");
+   Assert (M3.Contains (1), False, "contents after assigning empty map");
+
+   Put_Line ("Done");
+end Main;
@@ -0,0 +1,126 @@
+------------------------------------------------------------------------------
+--                     Copyright (C) 2016, AdaCore                          --
+--                                                                          --
+-- This library is free software;  you can redistribute it and/or modify it --
+-- under terms of the  GNU General Public License  as published by the Free --
+-- Software  Foundation;  either version 3,  or (at your  option) any later --
+-- version. This library is distributed in the hope that it will be useful, --
+-- but WITHOUT ANY WARRANTY;  without even the implied warranty of MERCHAN- --
+-- TABILITY or FITNESS FOR A PARTICULAR PURPOSE.                            --
+--                                                                          --
+-- As a special exception under Section 7 of GPL version 3, you are granted --
+-- additional permissions described in the GCC Runtime Library Exception,   --
+-- version 3.1, as published by the Free Software Foundation.               --
+--                                                                          --
+-- You should have received a copy of the GNU General Public License and    --
+-- a copy of the GCC Runtime Library Exception along with this program;     --
+-- see the files COPYING3 and COPYING.RUNTIME respectively.  If not, see    --
+-- <http://www.gnu.org/licenses/>.                                          --
+--                                                                          --
+------------------------------------------------------------------------------
+
+pragma Ada_2012;
+with Ada.Finalization;
+with Asserts;              use Asserts;
+with Conts;                use Conts;
+with Conts.Elements.Definite;
+with Conts.Maps.Generics;
+with Ada.Text_IO;          use Ada.Text_IO;
+
+procedure Main is
+   use Asserts.Booleans, Asserts.Integers, Asserts.Counts;
+
+   function Hash (Key : Integer) return Hash_Type
+     is (Hash_Type'Mod (Key) * 2_654_435_769);
+   --  Multiplicative hashing, so that the high bits (used for the control
+   --  bytes) also vary
+
+   package Int_Elements is new Conts.Elements.Definite (Integer);
+   package Maps is new Conts.Maps.Generics
+     (Keys                => Int_Elements.Traits,
+      Elements            => Int_Elements.Traits,
+      Hash                => Hash,
+      Probing             => Conts.Maps.Group_Probing,
+      Pool                => Conts.Global_Pool,
+      Container_Base_Type => Ada.Finalization.Controlled);
+
+   function Identity_Hash (Key : Integer) return Hash_Type
+     is (Hash_Type'Mod (Key));
+   --  The high bits are always 0 for small keys, so the control bytes
+   --  must not be taken from them directly.
+
+   package Small_Maps is new Conts.Maps.Generics
+     (Keys                => Int_Elements.Traits,
+      Elements            => Int_Elements.Traits,
+      Hash                => Identity_Hash,
+      Probing             => Conts.Maps.Group_Probing,
+      Pool                => Conts.Global_Pool,
+      Container_Base_Type => Ada.Finalization.Controlled);
+
+   Max : constant := 1_000;
+   M   : Maps.Map;
+   S   : Small_Maps.Map;
+
+begin
+   for J in 1 .. Max loop
+      M.Set (J, J * 10);
+   end loop;
+   Assert (M.Length, Max, "length after insert");
+
+   --  Delete every other key. Some of the slots are then marked as deleted
+   --  and lookups must skip them.
+
+   for J in 1 .. Max loop
+      if J mod 2 = 0 then
+         M.Delete (J);
+      end if;
+   end loop;
+   Assert (M.Length, Max / 2, "length after delete");
+
+   for J in 1 .. Max loop
+      Assert (M.Contains (J), J mod 2 = 1, "contains" & J'Img);
+   end loop;
+
+   --  Replacing an existing key must not create a duplicate
+
+   for J in 1 .. Max loop
+      M.Set (J, J);
+   end loop;
+   Assert (M.Length, Max, "length after reinsert");
+
+   for J in 1 .. Max loop
+      Assert (M.Get (J), J, "value for" & J'Img);
+   end loop;
+
+   --  Deleting a missing key is a no-op
+
+   M.Delete (Max + 1);
+   Assert (M.Length, Max, "length after deleting missing key");
+
+   M.Clear;
+   Assert (M.Length, 0, "length after clear");
+   Assert (M.Contains (1), False, "contains after clear");
+
+   --  Small integer keys with an identity hash
+
+   for J in 0 .. Max loop
+      S.Set (J, J + 1);
+   end loop;
+   Assert (S.Length, Max + 1, "small keys length");
+
+   for J in 0 .. Max loop
+      if J mod 3 = 0 then
+         S.Delete (J);
+      end if;
+   end loop;
+
+   for J in 0 .. Max loop
+      Assert (S.Contains (J), J mod 3 /= 0, "small contains" & J'Img);
+      if J mod 3 /= 0 then
+         Assert (S.Get (J), J + 1, "small value for" & J'Img);
+      end if;
+   end loop;
+   Assert (S.Contains (Max + 1), False, "small missing key");
+
+   Put_Line ("Done");
+end Main;
@@ -0,0 +1,117 @@
+------------------------------------------------------------------------------
+--                     Copyright (C) 2016, AdaCore                          --
+--                                                                          --
+-- This library is free software;  you can redistribute it and/or modify it --
+-- under terms of the  GNU General Public License  as published by the Free --
+-- Software  Foundation;  either version 3,  or (at your  option) any later --
+-- version. This library is distributed in the hope that it will be useful, --
+-- but WITHOUT ANY WARRANTY;  without even the implied warranty of MERCHAN- --
+-- TABILITY or FITNESS FOR A PARTICULAR PURPOSE.                            --
+--                                                                          --
+-- As a special exception under Section 7 of GPL version 3, you are granted --
+-- additional permissions described in the GCC Runtime Library Exception,   --
+-- version 3.1, as published by the Free Software Foundation.               --
+--                                                                          --
+-- You should have received a copy of the GNU General Public License and    --
+-- a copy of the GCC Runtime Library Exception along with this program;     --
+-- see the files COPYING3 and COPYING.RUNTIME respectively.  If not, see    --
+-- <http://www.gnu.org/licenses/>.                                          --
+--                                                                          --
+------------------------------------------------------------------------------
+
+pragma Ada_2012;
+with Ada.Finalization;
+with Asserts;              use Asserts;
+with Conts;                use Conts;
+with Conts.Elements.Definite;
+with Conts.Hashes;
+with Conts.Maps.Generics;
+with Ada.Text_IO;          use Ada.Text_IO;
+
+procedure Main is
+   use Asserts.Booleans, Asserts.Integers, Asserts.Counts;
+
+   package Int_Elements is new Conts.Elements.Definite (Integer);
+   package Maps is new Conts.Maps.Generics
+     (Keys                => Int_Elements.Traits,
+      Elements            => Int_Elements.Traits,
+      Hash                => Conts.Hashes.Integer_Hash,
+      Probing             => Conts.Maps.Perturbation_Probing,
+      Pool                => Conts.Global_Pool,
+      Container_Base_Type => Ada.Finalization.Controlled,
+      Migration_Step      => 1);
+   --  Only move one slot at a time, so that the map is almost always being
+   --  resized.
+
+   Max   : constant := 1_000;
+   M, M2 : Maps.Map;
+   N     : Natural;
+   Sum   : Natural;
+
+begin
+   for J in 1 .. Max loop
+      M.Set (J, J * 10);
+      Assert (M.Contains (J), True, "contains" & J'Img & " after insert");
+      Assert (M.Contains (1), True, "contains 1 after insert" & J'Img);
+   end loop;
+   Assert (M.Length, Max, "length after insert");
+
+   for J in 1 .. Max loop
+      Assert (M.Get (J), J * 10, "value for" & J'Img);
+   end loop;
+
+   --  Iteration must see the elements of both tables, exactly once
+
+   N := 0;
+   Sum := 0;
+   for Key of M loop
+      N := N + 1;
+      Sum := Sum + Key;
+   end loop;
+   Assert (N, Max, "number of keys");
+   Assert (Sum, Max * (Max + 1) / 2, "sum of keys");
+
+   M2 := M;
+
+   --  Delete every other key, and replace the others. Keys might be in
+   --  either table.
+
+   for J in 1 .. Max loop
+      if J mod 2 = 0 then
+         M.Delete (J);
+      else
+         M.Set (J, J);
+      end if;
+   end loop;
+   Assert (M.Length, Max / 2, "length after delete");
+
+   for J in 1 .. Max loop
+      Assert (M.Contains (J), J mod 2 = 1, "contains" & J'Img);
+   end loop;
+
+   for J in 1 .. Max loop
+      if J mod 2 = 1 then
+         Assert (M.Get (J), J, "value after replace for" & J'Img);
+      end if;
+   end loop;
+
+   --  The copy is not affected
+
+   Assert (M2.Length, Max, "length of copy");
+   for J in 1 .. Max loop
+      Assert (M2.Get (J), J * 10, "value in copy for" & J'Img);
+   end loop;
+
+   --  Explicit resizing moves all the elements at once
+
+   M.Resize (4 * Max);
+   Assert (M.Length, Max / 2, "length after resize");
+   Assert (M.Contains (Max - 1), True, "contains after resize");
+
+   M.Clear;
+   M2.Clear;
+   Assert (M.Length, 0, "length after clear");
+   Assert (M.Contains (1), False, "contains after clear");
+
+   Put_Line ("Done");
+end Main;
@@ -0,0 +1,140 @@
+------------------------------------------------------------------------------
+--                     Copyright (C) 2016, AdaCore                          --
+--                                                                          --
+-- This library is free software;  you can redistribute it and/or modify it --
+-- under terms of the  GNU General Public License  as published by the Free --
+-- Software  Foundation;  either version 3,  or (at your  option) any later --
+-- version. This library is distributed in the hope that it will be useful, --
+-- but WITHOUT ANY WARRANTY;  without even the implied warranty of MERCHAN- --
+-- TABILITY or FITNESS FOR A PARTICULAR PURPOSE.                            --
+--                                                                          --
+-- As a special exception under Section 7 of GPL version 3, you are granted --
+-- additional permissions described in the GCC Runtime Library Exception,   --
+-- version 3.1, as published by the Free Software Foundation.               --
+--                                                                          --
+-- You should have received a copy of the GNU General Public License and    --
+-- a copy of the GCC Runtime Library Exception along with this program;     --
+-- see the files COPYING3 and COPYING.RUNTIME respectively.  If not, see    --
+-- <http://www.gnu.org/licenses/>.                                          --
+--                                                                          --
+------------------------------------------------------------------------------
+
+pragma Ada_2012;
+with Ada.Finalization;
+with Asserts;              use Asserts;
+with Conts;                use Conts;
+with Conts.Elements.Definite;
+with Conts.Maps.Ordered;
+with Conts.Maps.Ordered_Indef_Indef_Unbounded;
+with Ada.Text_IO;          use Ada.Text_IO;
+
+procedure Main is
+   use Asserts.Booleans, Asserts.Integers, Asserts.Counts;
+
+   package Int_Elements is new Conts.Elements.Definite (Integer);
+   package Maps is new Conts.Maps.Ordered
+     (Keys                => Int_Elements.Traits,
+      Elements            => Int_Elements.Traits,
+      Pool                => Conts.Global_Pool,
+      Container_Base_Type => Ada.Finalization.Controlled,
+      Node_Capacity       => 4);
+   --  Small nodes, so that the tree has several levels
+   use type Maps.Cursor;
+
+   package Strings is new Conts.Maps.Ordered_Indef_Indef_Unbounded
+     (Key_Type            => String,
+      Element_Type        => String,
+      Container_Base_Type => Ada.Finalization.Controlled);
+
+   Max   : constant := 1_008;
+   M, M2 : Maps.Map;
+   C     : Maps.Cursor;
+   Prev  : Integer;
+   N     : Natural;
+   S     : Strings.Map;
+
+begin
+   --  Insert all keys in 1 .. Max in a random-looking order (1009 is prime)
+
+   for J in 1 .. Max loop
+      M.Set ((J * 37) mod (Max + 1), J);
+      M.Set ((J * 37) mod (Max + 1), (J * 37) mod (Max + 1) * 10);
+   end loop;
+   Assert (M.Length, Max, "length after insert");
+
+   Prev := 0;
+   N := 0;
+   for Key of M loop
+      Assert (Key, Prev + 1, "keys are sorted");
+      Assert (M.Get (Key), Key * 10, "value for" & Key'Img);
+      Prev := Key;
+      N := N + 1;
+   end loop;
+   Assert (N, Max, "number of keys");
+
+   N := 0;
+   C := M.Last;
+   while M.Has_Element (C) loop
+      Assert (M.Key (C), Max - N, "reverse iteration");
+      N := N + 1;
+      C := M.Previous (C);
+   end loop;
+   Assert (N, Max, "number of keys in reverse");
+
+   M2 := M;
+
+   --  Remove the odd keys, which rebalances the tree
+
+   for J in 1 .. Max loop
+      if J mod 2 = 1 then
+         M.Delete (J);
+      end if;
+   end loop;
+   Assert (M.Length, Max / 2, "length after delete");
+   Assert (M2.Length, Max, "length of copy");
+   Assert (M2.Contains (1), True, "copy contains 1");
+
+   for J in 1 .. Max loop
+      Assert (M.Contains (J), J mod 2 = 0, "contains" & J'Img);
+   end loop;
+
+   Assert (M.Key (M.Floor (5)), 4, "floor of 5");
+   Assert (M.Key (M.Floor (6)), 6, "floor of 6");
+   Assert (M.Key (M.Floor (2_000)), Max, "floor of 2000");
+   Assert (M.Floor (1) = Maps.No_Element, True, "floor of 1");
+   Assert (M.Key (M.Ceiling (5)), 6, "ceiling of 5");
+   Assert (M.Key (M.Ceiling (-1)), 2, "ceiling of -1");
+   Assert (M.Ceiling (Max + 1) = Maps.No_Element, True, "ceiling of max");
+
+   N := 0;
+   for P in M.Between (9, 21) loop
+      Assert (M.Key (P), 10 + N * 2, "key in range");
+      N := N + 1;
+   end loop;
+   Assert (N, 6, "number of keys in 9 .. 21");
+
+   N := 0;
+   for P in M.Between (11, 11) loop
+      Assert (M.Key (P), 11, "unexpected key in 11 .. 11");
+      N := N + 1;
+   end loop;
+   Assert (N, 0, "number of keys in 11 .. 11");
+
+   for J in 1 .. Max loop
+      M.Delete (J);
+   end loop;
+   Assert (M.Length, 0, "length after deleting all");
+   Assert (M.First = Maps.No_Element, True, "first in empty map");
+
+   M2.Clear;
+   Assert (M2.Length, 0, "length after clear");
+
+   S.Set ("banana", "yellow");
+   S.Set ("apple", "red");
+   S.Set ("cherry", "dark red");
+   Put_Line ("First fruit is " & S.As_Key (S.First));
+   Put_Line ("Floor of blueberry is " & S.As_Key (S.Floor ("blueberry")));
+   Put_Line ("Cherry is " & S.As_Element (S.Find ("cherry")));
+
+   Put_Line ("Done");
+end Main;
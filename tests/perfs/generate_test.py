@@ -67,6 +67,7 @@ pragma Warnings (Off, "unit * is not referenced");
 with Perf_Support;  use Perf_Support;
 with Ada.Finalization;
 with Conts.Algorithms;
+with Conts.Algorithms.Parallel;
 with Conts.Adaptors;
 pragma Warnings (On, "unit * is not referenced");
 procedure {test_name}
@@ -165,6 +166,11 @@ end {test_name};"""
     list_count_if = wrap("count_if", """
       Co := Count_If (V2, Predicate'Access);""", group=False)
 
+    # Count_If with the parallel algorithm, for random-access containers
+
+    vector_parallel_count_if = wrap("parallel count_if", """
+      Co := Parallel_Count_If (V2, Predicate'Access, Pool);""", group=False)
+
     # loop using Constant_Indexing
 
     int_int_indexing_loop = wrap("indexed", """
@@ -174,6 +180,13 @@ end {test_name};"""
          end if;
       end loop;""", group=False)
 
+    map_int_int_indexing_loop = wrap("indexed", """
+      for C in 1 .. Items_Count loop
+         if V2 ({key}) <= 2 then
+            Co := Co + 1;
+         end if;
+      end loop;""", group=False)
+
     int_str_indexing_loop = wrap("indexed", """
       for C in 1 .. Items_Count loop
          if Perf_Support.Predicate (V2 (C)) then
@@ -183,7 +196,7 @@ end {test_name};"""
 
     str_str_indexing_loop = wrap("indexed", """
       for C in 1 .. Items_Count loop
-         if Perf_Support.Predicate (V2 ("1")) then
+         if Perf_Support.Predicate (V2 ({first_key})) then
             Co := Co + 1;
          end if;
       end loop;""", group=False)
@@ -264,17 +277,21 @@ end {test_name};"""
                     Templates.list_str_for_of_loop, Templates.list_count_if)
 
     @staticmethod
-    def vectors(elem_type):
+    def vectors(elem_type, parallel=False):
         if elem_type == "integer":
-            return (Templates.list_fill, Templates.list_copy,
-                    Templates.list_int_cursor_loop,
-                    Templates.list_int_for_of_loop, Templates.list_count_if,
-                    Templates.int_int_indexing_loop)
+            result = (Templates.list_fill, Templates.list_copy,
+                      Templates.list_int_cursor_loop,
+                      Templates.list_int_for_of_loop, Templates.list_count_if,
+                      Templates.int_int_indexing_loop)
         else:
-            return (Templates.list_fill, Templates.list_copy,
-                    Templates.list_str_cursor_loop,
-                    Templates.list_str_for_of_loop, Templates.list_count_if,
-                    Templates.int_str_indexing_loop)
+            result = (Templates.list_fill, Templates.list_copy,
+                      Templates.list_str_cursor_loop,
+                      Templates.list_str_for_of_loop, Templates.list_count_if,
+                      Templates.int_str_indexing_loop)
+
+        if parallel:
+            result += (Templates.vector_parallel_count_if, )
+        return result
 
     @staticmethod
     def maps(elem_type, std_ada=False):
@@ -283,7 +300,8 @@ end {test_name};"""
                     Templates.map_cursor_loop,
                     Templates.map_for_of_loop
                        if not std_ada else Templates.map_ada2012_for_of_loop,                    
-                    Templates.map_count_if, Templates.int_int_indexing_loop,
+                    Templates.map_count_if,
+                    Templates.map_int_int_indexing_loop,
                     Templates.map_find)
         else:
             return (Templates.map_fill, Templates.map_copy,
@@ -299,6 +317,10 @@ end {test_name};"""
 
 class Tests(object):
 
+    # Whether the container has random-access cursors and can be used with
+    # Conts.Algorithms.Parallel
+    parallel = False
+
     def write(self):
         filename = self.args['test_name'].lower()
 
@@ -344,6 +366,14 @@ class Tests(object):
    function Count_If is new Conts.Algorithms.Count_If
       (Container.Cursors.Forward, Container.Maps.%s);""" % adaptor
 
+            if self.parallel:
+                # The pool is created once, outside of the timed tests
+                self.args['adaptors'] += """
+   function Parallel_Count_If is new Conts.Algorithms.Parallel.Count_If
+      (Container.Cursors.Random_Access, Container.Maps.Element_From_Index);
+   Pool : Conts.Algorithms.Parallel.Task_Pool
+      (Conts.Algorithms.Parallel.Default_Workers);"""
+
         self.write()
 
 
@@ -453,6 +483,14 @@ class List(Tests):
 
 class Map(Tests):
 
+    # The keys inserted in the map, as a function of C in 1 .. Items_Count.
+    # Hash functions that do not mix the bits of the key, like the identity
+    # for integers, perform poorly on strided keys.
+    keys = {
+        "sequential": "{c}",
+        "strided": "{c} * 1024",
+        "random": "Perf_Support.Random_Key ({c})"}
+
     def __init__(
         self,
         elem_type,   # "intint", "strstr",...
@@ -464,28 +502,31 @@ class Map(Tests):
         limited=False,   # Whether we need explicit Copy and Clear
         comments=None,   # instance of Comments
         favorite=False,  # Whether this should be highlighted in the results
-        ada2012=False
+        ada2012=False,
+        keys="sequential"  # Distribution of keys (see Map.keys)
     ):
         type = "Map"
         category = '%s %s' % (elem_type, type)
 
         self.elem_type = elem_type.lower()
         self.ada2012 = ada2012
+        key = Map.keys[keys].format(c="C")
+        first_key = Map.keys[keys].format(c="1")
 
         if self.elem_type == "strstr":
-            get_val = 'Image (C)'
+            get_val = 'Image (%s)' % key
             expected = "Items_Count"
             append = """
         --   ??? Can't use V2 (V'Img) := "foo"
-        V2.{set} (Image (C), "foo");
-"""
+        V2.{set} (Image (%s), "foo");
+""" % key
 
         elif self.elem_type == "intint":
-            get_val = 'C'
+            get_val = key
             expected = "2"
             append = """
-        V2.{set} (C, C);
-"""
+        V2.{set} (%s, C);
+""" % key
 
         if ada2012:
             set = "Include"
@@ -502,6 +543,9 @@ class Map(Tests):
             elem_type=elem_type,
             instance=instance,
             withs=withs,
+            key=key,
+            first_key=('"1"' if first_key == "1"
+                       else "Image (%s)" % first_key),
             expected=expected,
             copy='',
             get=get,
@@ -542,8 +586,12 @@ class Map(Tests):
 class Vector(List):
     type = "Vector"
 
+    def __init__(self, *args, **kwargs):
+        super(Vector, self).__init__(*args, **kwargs)
+        self.parallel = not self.ada2012
+
     def tests(self):
-        return Templates.vectors(self.elem_type)
+        return Templates.vectors(self.elem_type, parallel=self.parallel)
 
 
 # Setup
@@ -602,6 +650,23 @@ List("Integer",
      comments=Comments(forofloop=
           "Because of dynamic dispatching -- When avoided, we gain 40%")
     ).gen(adaptor="Constant_Returned")
+List("Integer",
+     "package Elements is new Conts.Elements.Definite (Integer);\n"
+     + "   package Storage is new Conts.Lists.Storage.Unbounded\n"
+     + "      (Elements.Traits, Ada.Finalization.Controlled,\n"
+     + "       Conts.Slab_Pools.Global.Pool);\n"
+     + "   package Container is new Conts.Lists.Generics (Storage.Traits);",
+     "with Conts.Elements.Definite, Conts.Lists.Generics;\n"
+     + "with Conts.Lists.Storage.Unbounded, Conts.Slab_Pools.Global;",
+     unbounded=True,
+     name="Def Unbounded Slab Pool", filename="def_unbounded_slab"
+    ).gen(adaptor="Constant_Returned")
+List("Integer",
+     "package Container is new Conts.Lists.Definite_Unrolled" + ci,
+     "with Conts.Lists.Definite_Unrolled;",
+     unbounded=True,
+     name="Def Unrolled", filename="def_unrolled"
+    ).gen(adaptor="Constant_Returned")
 List("Integer",
      "package Container is new Conts.Lists.Definite_Bounded" + ci,
      "with Conts.Lists.Definite_Bounded;",
@@ -857,6 +922,53 @@ Map("IntInt",
     name="Hashed Linear Probing Def Def Unbounded",
     filename="hashed_linear_probing_def_def_unbounded",
     favorite=True).gen(adaptor="Constant_Returned")
+Map("IntInt",
+    'function Hash (K : Integer) return Conts.Hash_Type is\n'
+    + '      (Conts.Hash_Type (K)) with Inline;\n'
+    + '   package Container is new Conts.Maps.Def_Def_Bounded\n'
+    + '      (Integer, Integer, Items_Count, Ada.Finalization.Controlled,'
+    + ' Hash);\n',
+    'with Conts.Maps.Def_Def_Bounded;',
+    unbounded=True,   # the capacity is given in the instance
+    name="Hashed Def Def Bounded",
+    filename="hashed_def_def_bounded",
+    favorite=True).gen(adaptor="Constant_Returned")
+Map("IntInt",
+    'package Container is new Conts.Maps.Ordered_Def_Def_Unbounded\n'
+    + '      (Integer, Integer, Ada.Finalization.Controlled);\n',
+    'with Conts.Maps.Ordered_Def_Def_Unbounded;',
+    unbounded=True,
+    name="Ordered Def Def Unbounded",
+    filename="ordered_def_def_unbounded",
+    favorite=True).gen(adaptor="Constant_Returned")
+Map("IntInt",
+    'function Hash (K : Integer) return Conts.Hash_Type\n'
+    + '      renames Conts.Hashes.Integer_Hash;\n'
+    + '   package Elements is new Conts.Elements.Definite (Integer);\n'
+    + '   package Container is new Conts.Maps.Generics\n'
+    + '      (Elements.Traits, Elements.Traits,'
+    + ' Ada.Finalization.Controlled,\n'
+    + '       Hash, Conts.Maps.Perturbation_Probing, Conts.Global_Pool,\n'
+    + '       Migration_Step => 64);\n',
+    'with Conts.Elements.Definite, Conts.Maps.Generics;\n'
+    + 'with Conts.Hashes;',
+    unbounded=True,
+    name="Hashed Incremental Resize Def Def Unbounded",
+    filename="hashed_incremental_def_def_unbounded"
+    ).gen(adaptor="Constant_Returned")
+Map("IntInt",
+    'function Hash (K : Integer) return Conts.Hash_Type\n'
+    + '      renames Conts.Hashes.Integer_Hash;\n'
+    + '   package Elements is new Conts.Elements.Definite (Integer);\n'
+    + '   package Container is new Conts.Maps.Compact\n'
+    + '      (Elements.Traits, Elements.Traits,'
+    + ' Ada.Finalization.Controlled,\n'
+    + '       Hash, Conts.Maps.Perturbation_Probing, Conts.Global_Pool);\n',
+    'with Conts.Elements.Definite, Conts.Maps.Compact;\n'
+    + 'with Conts.Hashes;',
+    unbounded=True,
+    name="Compact Def Def Unbounded",
+    filename="compact_def_def_unbounded").gen(adaptor="Constant_Returned")
 
 # String-String maps
 
@@ -922,6 +1034,52 @@ Map("StrStr",
     filename="hashed_indef_indef_unbounded_spark",
     favorite=True).gen(adaptor="Constant_Returned")
 
+# Hash functions and key distributions
+
+for keys in ("sequential", "strided", "random"):
+    for hash_name, hash in (
+            ("Identity", "is (Conts.Hash_Type (K)) with Inline;"),
+            ("Conts.Hashes", "renames Conts.Hashes.Integer_Hash;")):
+        Map("IntInt",
+            'function Hash (K : Integer) return Conts.Hash_Type\n'
+            + '      %s\n' % hash
+            + '   package Elements is new Conts.Elements.Definite (Integer);\n'
+            + '   package Container is new Conts.Maps.Generics\n'
+            + '      (Elements.Traits, Elements.Traits,'
+            + ' Ada.Finalization.Controlled,\n'
+            + '       Hash, Conts.Maps.Linear_Probing, Conts.Global_Pool);\n',
+            'with Conts.Elements.Definite, Conts.Maps.Generics;\n'
+            + 'with Conts.Hashes;',
+            unbounded=True, keys=keys,
+            name="Linear Probing %s Hash (%s keys)" % (hash_name, keys),
+            filename="linear_probing_%s_%s" % (
+                hash_name.lower().replace(".", "_"), keys)
+            ).gen(adaptor="Constant_Returned")
+
+    for hash_name, hash in (
+            ("Ada.Strings.Hash", "Ada.Strings.Hash"),
+            ("Conts.Hashes", "Conts.Hashes.String_Hash")):
+        Map("StrStr",
+            'package Container is new Conts.Maps.Indef_Indef_Unbounded\n'
+            + '      (String, String, Ada.Finalization.Controlled, %s);\n'
+            % hash
+            + '   function Predicate (P : Container.Constant_Returned_Type)'
+            + ' return Boolean\n'
+            + '      is (Perf_Support.Predicate (P)) with Inline;\n'
+            + '   function Ref_Predicate (P : Container.Constant_Returned_Type)'
+            + ' return Boolean\n'
+            + '      renames Predicate;',
+            'with Conts.Maps.Indef_Indef_Unbounded, Ada.Strings.Hash;\n'
+            + 'with Conts.Hashes;',
+            unbounded=True, keys=keys,
+            name="Hashed Indef-Indef %s (%s keys)" % (hash_name, keys),
+            filename="hashed_indef_indef_%s_%s" % (
+                hash_name.lower().replace(".", "_"), keys)
+            ).gen(
+                adaptor="Constant_Returned",
+                cursor_loop_predicate='Ref_Predicate',
+                find_predicate='Ref_Predicate')
+
 run_all = open(os.path.join(output_dir, "main-run_all.adb"), "w")
 run_all.write("\n".join(all_tests_withs))
 run_all.write("""
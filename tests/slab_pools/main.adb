@@ -0,0 +1,84 @@
+------------------------------------------------------------------------------
+--                     Copyright (C) 2016, AdaCore                          --
+--                                                                          --
+-- This library is free software;  you can redistribute it and/or modify it --
+-- under terms of the  GNU General Public License  as published by the Free --
+-- Software  Foundation;  either version 3,  or (at your  option) any later --
+-- version. This library is distributed in the hope that it will be useful, --
+-- but WITHOUT ANY WARRANTY;  without even the implied warranty of MERCHAN- --
+-- TABILITY or FITNESS FOR A PARTICULAR PURPOSE.                            --
+--                                                                          --
+-- As a special exception under Section 7 of GPL version 3, you are granted --
+-- additional permissions described in the GCC Runtime Library Exception,   --
+-- version 3.1, as published by the Free Software Foundation.               --
+--                                                                          --
+-- You should have received a copy of the GNU General Public License and    --
+-- a copy of the GCC Runtime Library Exception along with this program;     --
+-- see the files COPYING3 and COPYING.RUNTIME respectively.  If not, see    --
+-- <http://www.gnu.org/licenses/>.                                          --
+--                                                                          --
+------------------------------------------------------------------------------
+
+pragma Ada_2012;
+with Ada.Finalization;
+with Ada.Strings.Unbounded;  use Ada.Strings.Unbounded;
+with Asserts;                use Asserts;
+with Conts;                  use Conts;
+with Conts.Elements.Definite;
+with Conts.Lists.Generics;
+with Conts.Lists.Storage.Unbounded;
+with Conts.Slab_Pools.Global;
+with Ada.Text_IO;            use Ada.Text_IO;
+
+procedure Main is
+   use Asserts.Integers, Asserts.Counts;
+
+   package Int_Elements is new Conts.Elements.Definite (Integer);
+   package Int_Storage is new Conts.Lists.Storage.Unbounded
+     (Int_Elements.Traits, Ada.Finalization.Controlled,
+      Conts.Slab_Pools.Global.Pool);
+   package Int_Lists is new Conts.Lists.Generics (Int_Storage.Traits);
+
+   package Str_Elements is new Conts.Elements.Definite (Unbounded_String);
+   package Str_Storage is new Conts.Lists.Storage.Unbounded
+     (Str_Elements.Traits, Ada.Finalization.Controlled,
+      Conts.Slab_Pools.Global.Pool);
+   package Str_Lists is new Conts.Lists.Generics (Str_Storage.Traits);
+   --  Nodes of a different size, allocated from the same pool
+
+   L1, L2 : Int_Lists.List;
+   S      : Str_Lists.List;
+   Sum    : Integer;
+
+begin
+   for Round in 1 .. 3 loop
+      for J in 1 .. 10_000 loop
+         L1.Append (J);
+         S.Append (To_Unbounded_String (J'Img));
+      end loop;
+
+      L2 := L1;
+
+      Sum := 0;
+      for E of L2 loop
+         Sum := Sum + E;
+      end loop;
+      Assert (Sum, 50_005_000, "sum of elements");
+      Assert (S.Length, 10_000, "length of string list");
+
+      --  Freeing all nodes returns the chunks to the system, except for
+      --  one per size, which the next round starts from.
+      L1.Clear;
+      L2.Clear;
+      S.Clear;
+   end loop;
+
+   --  Return the remaining chunks to the system, the pool is still usable
+   --  afterward
+
+   Conts.Slab_Pools.Reset (Conts.Slab_Pools.Global.Slab);
+   L1.Append (1);
+   Assert (L1.Length, 1, "length after reset");
+
+   Put_Line ("Done");
+end Main;
@@ -0,0 +1,39 @@
+------------------------------------------------------------------------------
+--                     Copyright (C) 2016, AdaCore                          --
+--                                                                          --
+-- This library is free software;  you can redistribute it and/or modify it --
+-- under terms of the  GNU General Public License  as published by the Free --
+-- Software  Foundation;  either version 3,  or (at your  option) any later --
+-- version. This library is distributed in the hope that it will be useful, --
+-- but WITHOUT ANY WARRANTY;  without even the implied warranty of MERCHAN- --
+-- TABILITY or FITNESS FOR A PARTICULAR PURPOSE.                            --
+--                                                                          --
+-- As a special exception under Section 7 of GPL version 3, you are granted --
+-- additional permissions described in the GCC Runtime Library Exception,   --
+-- version 3.1, as published by the Free Software Foundation.               --
+--                                                                          --
+-- You should have received a copy of the GNU General Public License and    --
+-- a copy of the GCC Runtime Library Exception along with this program;     --
+-- see the files COPYING3 and COPYING.RUNTIME respectively.  If not, see    --
+-- <http://www.gnu.org/licenses/>.                                          --
+--                                                                          --
+------------------------------------------------------------------------------
+
+pragma Ada_2012;
+with Ada.Finalization;
+with Conts.Vectors.Definite_Small;
+with Support;           use Support;
+
+procedure Main is
+   package Int_Vecs is new Conts.Vectors.Definite_Small
+      (Index_Type, Integer, Ada.Finalization.Controlled,
+       Inline_Capacity => 4);
+   procedure T is new Support.Test
+      (Image           => Integer'Image,
+       Elements        => Int_Vecs.Elements.Traits,
+       Storage         => Int_Vecs.Storage.Traits,
+       Vectors         => Int_Vecs.Vectors);
+   V1 : Int_Vecs.Vector;
+begin
+   T (V1);
+end Main;
@@ -0,0 +1,120 @@
+------------------------------------------------------------------------------
+--                     Copyright (C) 2016, AdaCore                          --
+--                                                                          --
+-- This library is free software;  you can redistribute it and/or modify it --
+-- under terms of the  GNU General Public License  as published by the Free --
+-- Software  Foundation;  either version 3,  or (at your  option) any later --
+-- version. This library is distributed in the hope that it will be useful, --
+-- but WITHOUT ANY WARRANTY;  without even the implied warranty of MERCHAN- --
+-- TABILITY or FITNESS FOR A PARTICULAR PURPOSE.                            --
+--                                                                          --
+-- As a special exception under Section 7 of GPL version 3, you are granted --
+-- additional permissions described in the GCC Runtime Library Exception,   --
+-- version 3.1, as published by the Free Software Foundation.               --
+--                                                                          --
+-- You should have received a copy of the GNU General Public License and    --
+-- a copy of the GCC Runtime Library Exception along with this program;     --
+-- see the files COPYING3 and COPYING.RUNTIME respectively.  If not, see    --
+-- <http://www.gnu.org/licenses/>.                                          --
+--                                                                          --
+------------------------------------------------------------------------------
+
+pragma Ada_2012;
+with Ada.Directories;
+with Ada.Finalization;
+with Asserts;              use Asserts;
+with Conts;                use Conts;
+with Conts.Vectors.Definite_Mapped_File;
+with Ada.Text_IO;          use Ada.Text_IO;
+
+procedure Main is
+   use Asserts.Booleans, Asserts.Integers, Asserts.Counts;
+
+   package Int_Vecs is new Conts.Vectors.Definite_Mapped_File
+     (Positive, Integer, Ada.Finalization.Controlled);
+   use Int_Vecs;
+
+   File_Name : constant String := "vector.data";
+
+begin
+   if Ada.Directories.Exists (File_Name) then
+      Ada.Directories.Delete_File (File_Name);
+   end if;
+
+   declare
+      V : Vector;
+   begin
+      Open (V, File_Name);
+      Assert (V.Is_Open, True, "new file is open");
+      Assert (V.Length, 0, "new file is empty");
+
+      for J in 1 .. 10_000 loop
+         V.Append (J);
+      end loop;
+      Sync (V);
+
+      --  A copy lives in memory, and does not modify the file
+
+      declare
+         V2 : Vector := V;
+      begin
+         Assert (V2.Is_Open, False, "copy is not open");
+         V2.Replace_Element (1, 100);
+         Assert (V2.Element (1), 100, "copy modified");
+         Assert (V.Element (1), 1, "original unchanged");
+      end;
+
+      V.Append (10_001);
+   end;  --  finalizing V saves its length
+
+   declare
+      V : Vector;
+   begin
+      Open (V, File_Name);
+      Assert (V.Length, 10_001, "length after reopening");
+      Assert (V.Element (1), 1, "first element after reopening");
+      Assert (V.Element (5_000), 5_000, "element after reopening");
+      Assert (V.Last_Element, 10_001, "last element after reopening");
+
+      V.Resize (100, 0);
+      V.Shrink_To_Fit;
+      Sync (V);
+      Assert (V.Length, 100, "length after shrinking");
+   end;
+
+   declare
+      V : Vector;
+   begin
+      Open (V, File_Name);
+      Assert (V.Length, 100, "length after reopening shrunk file");
+      Assert (V.Element (100), 100, "last element of shrunk file");
+
+      --  The length is saved without calling Sync
+
+      V.Delete_Last;
+      Close (V);
+      Assert (V.Is_Open, False, "closed");
+      Assert (V.Length, 0, "closed vector is empty");
+
+      Open (V, File_Name);
+      Assert (V.Length, 99, "length after delete");
+
+      --  Clearing empties the file, but keeps it open
+
+      V.Clear;
+      Assert (V.Is_Open, True, "still open after clear");
+      V.Append (1);
+      V.Append (2);
+   end;
+
+   declare
+      V : Vector;
+   begin
+      Open (V, File_Name);
+      Assert (V.Length, 2, "length after clear and append");
+      Assert (V.Last_Element, 2, "last element after clear and append");
+   end;
+
+   Ada.Directories.Delete_File (File_Name);
+   Put_Line ("Done");
+end Main;
@@ -0,0 +1,106 @@
+------------------------------------------------------------------------------
+--                     Copyright (C) 2016, AdaCore                          --
+--                                                                          --
+-- This library is free software;  you can redistribute it and/or modify it --
+-- under terms of the  GNU General Public License  as published by the Free --
+-- Software  Foundation;  either version 3,  or (at your  option) any later --
+-- version. This library is distributed in the hope that it will be useful, --
+-- but WITHOUT ANY WARRANTY;  without even the implied warranty of MERCHAN- --
+-- TABILITY or FITNESS FOR A PARTICULAR PURPOSE.                            --
+--                                                                          --
+-- As a special exception under Section 7 of GPL version 3, you are granted --
+-- additional permissions described in the GCC Runtime Library Exception,   --
+-- version 3.1, as published by the Free Software Foundation.               --
+--                                                                          --
+-- You should have received a copy of the GNU General Public License and    --
+-- a copy of the GCC Runtime Library Exception along with this program;     --
+-- see the files COPYING3 and COPYING.RUNTIME respectively.  If not, see    --
+-- <http://www.gnu.org/licenses/>.                                          --
+--                                                                          --
+------------------------------------------------------------------------------
+
+pragma Ada_2012;
+with Ada.Finalization;
+with Asserts;                use Asserts;
+with Conts;                  use Conts;
+with Conts.Vectors.Definite_Unbounded;
+with Conts.Vectors.Indefinite_Unbounded;
+with Conts.Vectors.Sorted;
+with Ada.Text_IO;            use Ada.Text_IO;
+
+procedure Main is
+   use Asserts.Booleans, Asserts.Integers;
+
+   --  A set of integers
+
+   package Int_Vecs is new Conts.Vectors.Definite_Unbounded
+      (Positive, Integer, Ada.Finalization.Controlled);
+   function Identity (E : Integer) return Integer is (E);
+   package Int_Sets is new Conts.Vectors.Sorted
+      (Int_Vecs.Vectors, Integer, Identity);
+
+   --  A map from strings to integers
+
+   type Pair (Length : Natural) is record
+      Value : Integer;
+      Key   : String (1 .. Length);
+   end record;
+   function Key (P : Pair) return String is (P.Key);
+   function Make (K : String; V : Integer) return Pair
+      is ((Length => K'Length, Value => V, Key => K));
+
+   package Pair_Vecs is new Conts.Vectors.Indefinite_Unbounded
+      (Positive, Pair);
+   package Str_Maps is new Conts.Vectors.Sorted
+      (Pair_Vecs.Vectors, String, Key);
+
+   S : Int_Vecs.Vector;
+   M : Pair_Vecs.Vector;
+
+begin
+   --  Insert in random order, with duplicates
+
+   for J in 1 .. 1_000 loop
+      Int_Sets.Include (S, (J * 7_919) mod 500);
+   end loop;
+   Assert (Integer (S.Length), 500, "set length");
+   for J in 1 .. S.Last loop
+      Assert (S.Element (J), J - 1, "set sorted at" & J'Img);
+   end loop;
+
+   Assert (Int_Sets.Contains (S, 499), True, "contains 499");
+   Assert (Int_Sets.Contains (S, 500), False, "contains 500");
+   Assert (Int_Sets.Find (S, 10), 11, "find 10");
+
+   Int_Sets.Delete (S, 10);
+   Int_Sets.Delete (S, 10);
+   Assert (Integer (S.Length), 499, "length after delete");
+   Assert (Int_Sets.Contains (S, 10), False, "contains deleted");
+   Assert (Int_Sets.Lower_Bound (S, 10), 11, "lower_bound deleted");
+   Assert (Int_Sets.Upper_Bound (S, 499), Int_Vecs.Vectors.No_Index,
+           "upper_bound last");
+
+   --  Maps
+
+   Str_Maps.Include (M, Make ("pear", 3));
+   Str_Maps.Include (M, Make ("apple", 1));
+   Str_Maps.Include (M, Make ("orange", 2));
+   Str_Maps.Include (M, Make ("apple", 10));
+
+   Assert (Integer (M.Length), 3, "map length");
+   Assert (M.Element (1).Key = "apple", True, "first key");
+   Assert (M.Element (3).Key = "pear", True, "last key");
+   Assert (Str_Maps.Get (M, "apple").Value, 10, "replaced value");
+   Assert (Str_Maps.Get (M, "orange").Value, 2, "orange");
+   Assert (Str_Maps.Contains (M, "banana"), False, "no banana");
+
+   begin
+      Assert (Str_Maps.Get (M, "banana").Value, 0, "banana");
+      Assert (True, False, "expected Constraint_Error");
+   exception
+      when Constraint_Error =>
+         null;
+   end;
+
+   Put_Line ("Done");
+end Main;